@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the communication and parsing hot paths of InstrumentKit, to
+be run with airspeed velocity (``asv run``).
+"""
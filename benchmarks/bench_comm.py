@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the communicators: reads up to a termination character and
+binary block transfers.
+"""
+
+# IMPORTS #####################################################################
+
+
+import io
+import os
+import socket
+import threading
+
+import serial
+
+import instruments as ik
+from instruments.abstract_instruments.comm import (
+    FileCommunicator, LoopbackCommunicator, SerialCommunicator,
+    SocketCommunicator
+)
+
+# BENCHMARKS ##################################################################
+
+
+class TimeSocketTerminatorRead:
+
+    """
+    Reads of terminated lines from a `SocketCommunicator` over a local
+    socket pair.
+    """
+
+    params = [16, 1024]
+    param_names = ["line_length"]
+
+    lines = 32
+
+    def setup(self, line_length):
+        self.host_end, self.inst_end = socket.socketpair()
+        self.comm = SocketCommunicator(self.host_end)
+        self.block = (b"x" * (line_length - 1) + b"\n") * self.lines
+
+    def teardown(self, line_length):
+        self.host_end.close()
+        self.inst_end.close()
+
+    def time_read_lines(self, line_length):
+        self.inst_end.sendall(self.block)
+        for _ in range(self.lines):
+            self.comm.read_raw()
+
+
+class TimeSerialTerminatorRead:
+
+    """
+    Reads of terminated lines from a `SerialCommunicator` over a
+    pseudo-terminal, with and without the buffered read mode.
+    """
+
+    params = [False, True]
+    param_names = ["buffered"]
+
+    lines = 16
+
+    def setup(self, buffered):
+        if not hasattr(os, "openpty"):
+            raise NotImplementedError("Pseudo-terminals are not available.")
+        self.master, slave = os.openpty()
+        self.port = serial.Serial(os.ttyname(slave), timeout=1)
+        os.close(slave)
+        self.comm = SerialCommunicator(self.port, buffered=buffered)
+        self.block = (b"x" * 63 + b"\n") * self.lines
+
+    def teardown(self, buffered):
+        self.port.close()
+        os.close(self.master)
+
+    def time_read_lines(self, buffered):
+        os.write(self.master, self.block)
+        for _ in range(self.lines):
+            self.comm.read_raw()
+
+
+class TimeStreamTerminatorRead:
+
+    """
+    Reads of terminated lines from the communicators wrapping a stream.
+    """
+
+    params = ["file", "loopback"]
+    param_names = ["communicator"]
+
+    lines = 64
+
+    def setup(self, communicator):
+        self.stream = io.BytesIO((b"x" * 63 + b"\n") * self.lines)
+        if communicator == "file":
+            self.comm = FileCommunicator(self.stream)
+        else:
+            self.comm = LoopbackCommunicator(self.stream, io.BytesIO())
+
+    def time_read_lines(self, communicator):
+        self.stream.seek(0)
+        for _ in range(self.lines):
+            self.comm.read_raw()
+
+
+def _binblock(size):
+    header = str(size)
+    return "#{}{}".format(len(header), header).encode("utf-8") + bytes(size)
+
+
+class TimeLoopbackBinblockRead:
+
+    """
+    `~instruments.Instrument.binblockread` of blocks from 1 kB to 100 MB
+    held in a stream.
+    """
+
+    params = [10 ** 3, 10 ** 6, 10 ** 8]
+    param_names = ["size"]
+    timeout = 120
+
+    def setup(self, size):
+        self.stream = io.BytesIO(_binblock(size))
+        self.inst = ik.Instrument.open_test(self.stream, io.BytesIO())
+
+    def time_binblockread(self, size):
+        self.stream.seek(0)
+        self.inst.binblockread(2)
+
+    def peakmem_binblockread(self, size):
+        self.stream.seek(0)
+        self.inst.binblockread(2)
+
+
+class TimeSocketBinblockRead:
+
+    """
+    `~instruments.Instrument.binblockread` of blocks from 1 kB to 100 MB
+    sent over a local socket pair.
+    """
+
+    params = [10 ** 3, 10 ** 6, 10 ** 8]
+    param_names = ["size"]
+    timeout = 120
+
+    def setup(self, size):
+        self.host_end, self.inst_end = socket.socketpair()
+        self.inst = ik.Instrument(SocketCommunicator(self.host_end))
+        self.block = _binblock(size)
+
+    def teardown(self, size):
+        self.host_end.close()
+        self.inst_end.close()
+
+    def time_binblockread(self, size):
+        sender = threading.Thread(target=self.inst_end.sendall,
+                                  args=(self.block,))
+        sender.start()
+        self.inst.binblockread(2)
+        sender.join()
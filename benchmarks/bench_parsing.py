@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the parsing and packing helpers.
+"""
+
+# IMPORTS #####################################################################
+
+
+import numpy as np
+
+import instruments.units as u
+from instruments.named_struct import Field, NamedStruct, Padding, StringField
+from instruments.thorlabs._packets import ThorLabsPacket
+from instruments.util_fns import (
+    convert_temperature, parse_ascii_array, split_unit_str,
+    split_unit_str_array
+)
+
+# BENCHMARKS ##################################################################
+
+
+class TimeSplitUnitStr:
+
+    """
+    `~instruments.util_fns.split_unit_str` on typical responses.
+    """
+
+    params = ["12", "14.7 GHz", "-1.234E-03 V", "300 mK"]
+    param_names = ["string"]
+
+    def time_split_unit_str(self, string):
+        split_unit_str(string, u.volt)
+
+
+class TimeSplitUnitStrArray:
+
+    """
+    `~instruments.util_fns.split_unit_str_array` on a list of responses.
+    """
+
+    def setup(self):
+        self.strings = ["{:.4f} mV".format(x) for x in range(1000)]
+
+    def time_split_unit_str_array(self):
+        split_unit_str_array(self.strings, u.volt)
+
+
+class TimeParseAsciiArray:
+
+    """
+    `~instruments.util_fns.parse_ascii_array` on comma-separated responses,
+    such as ASCII waveforms and reading buffers.
+    """
+
+    params = [10, 1000, 10000]
+    param_names = ["points"]
+
+    def setup(self, points):
+        values = np.linspace(-1, 1, points)
+        self.response = ",".join("{:+.8E}".format(x) for x in values)
+
+    def time_parse_ascii_array(self, points):  # pylint: disable=unused-argument
+        parse_ascii_array(self.response)
+
+
+class TimeConvertTemperature:
+
+    """
+    `~instruments.util_fns.convert_temperature` between each pair of
+    units.
+    """
+
+    params = [["degC", "degF", "degK"], ["degC", "degF", "degK"]]
+    param_names = ["source", "target"]
+
+    def setup(self, source, target):
+        self.temperature = u.Quantity(300, getattr(u, source))
+        self.target = getattr(u, target)
+
+    def time_convert_temperature(self, source, target):
+        convert_temperature(self.temperature, self.target)
+
+
+class _Struct(NamedStruct):
+    a = Field("H")
+    padding = Padding(2)
+    b = Field("I")
+    c = StringField(8, strip_null=True)
+
+
+class TimeNamedStruct:
+
+    """
+    Packing and unpacking a `~instruments.named_struct.NamedStruct`.
+    """
+
+    def setup(self):
+        self.struct = _Struct(a=1, b=2, c="abc")
+        self.packed = self.struct.pack()
+
+    def time_pack(self):
+        self.struct.pack()
+
+    def time_unpack(self):
+        _Struct.unpack(self.packed)
+
+
+class TimeThorLabsPacket:
+
+    """
+    Packing and unpacking ThorLabs APT packets, with parameters or data.
+    """
+
+    params = ["parameters", "data"]
+    param_names = ["kind"]
+
+    def setup(self, kind):
+        if kind == "parameters":
+            self.packet = ThorLabsPacket(0x0223, param1=1, param2=0)
+        else:
+            self.packet = ThorLabsPacket(0x0464, data=bytes(range(20)))
+        self.packed = self.packet.pack()
+
+    def time_pack(self, kind):
+        self.packet.pack()
+
+    def time_unpack(self, kind):
+        ThorLabsPacket.unpack(self.packed)
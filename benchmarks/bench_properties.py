@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the overhead of the properties created by the property
+factories of `instruments.util_fns`.
+"""
+
+# IMPORTS #####################################################################
+
+
+from enum import Enum
+
+import instruments as ik
+import instruments.units as u
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.util_fns import (
+    bool_property, enum_property, int_property, string_property,
+    unitful_property, unitless_property
+)
+
+# CLASSES #####################################################################
+
+
+class _ConstantCommunicator(AbstractCommunicator):
+
+    """
+    Communicator answering every query with the same response, such that
+    benchmarks measure the driver and not the connection.
+    """
+
+    def __init__(self, response):
+        super(_ConstantCommunicator, self).__init__()
+        self.response = response
+
+    address = None
+    terminator = "\n"
+    timeout = None
+
+    def _read_raw(self, size=-1):
+        return self.response.encode("utf-8")
+
+    def _write_raw(self, msg):
+        pass
+
+    def flush_input(self):
+        pass
+
+    def _sendcmd(self, msg):
+        pass
+
+    def _query(self, msg, size=-1):
+        return self.response
+
+
+class _Mode(Enum):
+    voltage = "VOLT"
+    current = "CURR"
+
+
+class _Instrument(ik.Instrument):
+    output = bool_property("OUTP")
+    mode = enum_property("MODE", _Mode)
+    count = int_property("COUN")
+    gain = unitless_property("GAIN")
+    voltage = unitful_property("VOLT", u.volt)
+    label = string_property("LAB")
+
+# BENCHMARKS ##################################################################
+
+
+_RESPONSES = {
+    "output": ("ON", True),
+    "mode": ("VOLT", _Mode.voltage),
+    "count": ("12", 12),
+    "gain": ("+1.5E+00", 1.5),
+    "voltage": ("+1.5E+00", 1.5 * u.volt),
+    "label": ('"CH1"', "CH1"),
+}
+
+
+class TimePropertyFactories:
+
+    """
+    Getting and setting each kind of factory property.
+    """
+
+    params = sorted(_RESPONSES)
+    param_names = ["prop"]
+
+    def setup(self, prop):
+        response, self.value = _RESPONSES[prop]
+        self.inst = _Instrument(_ConstantCommunicator(response))
+
+    def time_get(self, prop):
+        getattr(self.inst, prop)
+
+    def time_set(self, prop):
+        setattr(self.inst, prop, self.value)
+
+
+class TimeRawUnits:
+
+    """
+    Getting a unitful property with and without the raw units mode.
+    """
+
+    params = [False, True]
+    param_names = ["raw_units"]
+
+    def setup(self, raw_units):
+        self.inst = _Instrument(_ConstantCommunicator("+1.5E+00"))
+        self.inst.raw_units = raw_units
+
+    def time_get_voltage(self, raw_units):  # pylint: disable=unused-argument
+        self.inst.voltage  # pylint: disable=pointless-statement
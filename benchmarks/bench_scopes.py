@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of oscilloscope waveform transfers against loopback streams.
+"""
+
+# IMPORTS #####################################################################
+
+
+import io
+
+import instruments as ik
+
+# BENCHMARKS ##################################################################
+
+
+class TimeTekTDS224ReadWaveform:
+
+    """
+    `read_waveform` of a `~instruments.tektronix.TekTDS224` channel, in
+    binary format, as a function of the number of points.
+    """
+
+    params = [10 ** 3, 10 ** 5, 10 ** 7]
+    param_names = ["points"]
+    timeout = 120
+
+    def setup(self, points):
+        size = str(2 * points)
+        block = "#{}{}".format(len(size), size).encode("utf-8") + bytes(
+            2 * points
+        )
+        # The loopback communicator does not flush the terminator sent after
+        # the block, so it is left out.
+        responses = [b"0", b"0.1", b"0", b"0", b"1e-6",
+                     str(points).encode("utf-8")]
+        self.stream = io.BytesIO(
+            b"CH1\n2\n" + block + b"\n".join(responses) + b"\n"
+        )
+        self.tek = ik.tektronix.TekTDS224.open_test(self.stream, io.BytesIO())
+
+    def time_read_waveform(self, points):
+        self.stream.seek(0)
+        self.tek.channel[0].read_waveform()
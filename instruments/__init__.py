@@ -7,33 +7,43 @@ Defines globally-available subpackages and symbols for the instruments package.
 # IMPORTS ####################################################################
 
 
+import importlib
+
 from . import abstract_instruments
 from .abstract_instruments import Instrument
 
-from . import agilent
-from . import generic_scpi
-from . import fluke
-from . import glassman
-from . import holzworth
-from . import hp
-from . import keithley
-from . import lakeshore
-from . import minghe
-from . import newport
-from . import oxford
-from . import phasematrix
-from . import picowatt
-from . import qubitekk
-from . import rigol
-from . import srs
-from . import tektronix
-from . import thorlabs
-from . import toptica
-from . import wavetek
-from . import yokogawa
-
 from . import units
-from .config import load_instruments
+
+# Vendor subpackages, and the configuration file support depending on
+# ruamel.yaml, are only imported when first accessed, such that importing
+# instruments stays fast.
+_LAZY_SUBPACKAGES = {
+    "agilent", "generic_scpi", "fluke", "glassman", "holzworth", "hp",
+    "keithley", "lakeshore", "minghe", "newport", "oxford", "phasematrix",
+    "picowatt", "qubitekk", "rigol", "srs", "tektronix", "thorlabs",
+    "toptica", "wavetek", "yokogawa",
+}
+_LAZY_ATTRIBUTES = {
+    "load_instruments": ".config",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBPACKAGES | set(_LAZY_ATTRIBUTES))
 
 # VERSION METADATA ###########################################################
 # In keeping with PEP-396, we define a version number of the form
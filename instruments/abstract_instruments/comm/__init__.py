@@ -5,14 +5,44 @@ Module containing communication layers
 """
 
 
+import importlib
+
 from .abstract_comm import AbstractCommunicator
 
+from .comm_stats import CommStats, LatencyHistogram, aggregate_stats
+from .trace_recorder import TraceEntry, TraceRecorder
+
 from .file_communicator import FileCommunicator
+from .gpib_bus import GPIBBusScheduler
 from .gpib_communicator import GPIBCommunicator
 from .loopback_communicator import LoopbackCommunicator
+from .recording_communicator import RecordedEvent, RecordingCommunicator
+from .replay_communicator import ReplayCommunicator
 from .serial_communicator import SerialCommunicator
 from .socket_communicator import SocketCommunicator
 from .usb_communicator import USBCommunicator
-from .usbtmc_communicator import USBTMCCommunicator
-from .visa_communicator import VisaCommunicator
-from .vxi11_communicator import VXI11Communicator
+
+# Communicators whose backends are slow to import are only loaded when first
+# accessed.
+_LAZY_ATTRIBUTES = {
+    "AsyncSocketCommunicator": ".async_socket_communicator",
+    "run_async": ".async_socket_communicator",
+    "USBTMCCommunicator": ".usbtmc_communicator",
+    "VisaCommunicator": ".visa_communicator",
+    "VXI11Communicator": ".vxi11_communicator",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
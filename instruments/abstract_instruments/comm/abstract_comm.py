@@ -11,6 +11,19 @@ import abc
 import codecs
 import logging
 import struct
+import threading
+import time
+import weakref
+
+from instruments.abstract_instruments.comm import comm_stats
+from instruments.abstract_instruments.comm.trace_recorder import TraceRecorder
+
+# GLOBALS #####################################################################
+
+# Transaction locks, keyed by the underlying connection object, such that
+# every communicator wrapping the same connection shares a single lock.
+_transport_locks = weakref.WeakKeyDictionary()
+_transport_locks_guard = threading.Lock()
 
 # CLASSES ####################################################################
 
@@ -24,10 +37,35 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
     provide a consistent interface to the user.
     """
 
+    _stats = None
+    _tracer = None
+    # Statistics and trace recorder updated by `read_raw`, `readinto` and
+    # `write_raw`. These are those of the communicator forwarding its I/O to
+    # this one, if any.
+    _io_stats = None
+    _io_tracer = None
+    # Number of terminator bytes consumed and stripped by the last call to
+    # `_read_raw`, as it isn't part of the returned bytes. Only set by
+    # communicators which strip a terminator themselves.
+    _stripped_bytes = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Communicators written before `_read_raw` and `_write_raw` were
+        # introduced implement `read_raw` and `write_raw` instead. These are
+        # used as their `_read_raw` and `_write_raw`, such that statistics
+        # and tracing still cover them.
+        for public, private in (("read_raw", "_read_raw"),
+                                ("write_raw", "_write_raw")):
+            if public in vars(cls) and private not in vars(cls):
+                setattr(cls, private, vars(cls)[public])
+                setattr(cls, public, getattr(AbstractCommunicator, public))
+
     # INITIALIZER #
 
     def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
         self._debug = False
+        self._lock = None
 
         # Create a new logger for the module containing the concrete
         # subclass that we're a part of.
@@ -67,6 +105,104 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
     def debug(self, newval):
         self._debug = bool(newval)
 
+    @property
+    def lock(self):
+        """
+        Gets the reentrant lock guarding transactions on the underlying
+        connection. This lock is shared by every communicator wrapping the
+        same connection, and is held by `sendcmd` and `query`, as well as by
+        the `~instruments.Instrument` methods built on them.
+
+        Holding the lock in a ``with`` block makes a sequence of commands
+        atomic with respect to other threads:
+
+        >>> with comm.lock:
+        ...     comm.sendcmd("CONF:VOLT:DC")
+        ...     value = comm.query("READ?")
+
+        :type: `threading.RLock`
+        """
+        lock = getattr(self, "_lock", None)
+        if lock is None:
+            try:
+                with _transport_locks_guard:
+                    transport = self._transport()
+                    lock = _transport_locks.get(transport)
+                    if lock is None:
+                        lock = _transport_locks[transport] = threading.RLock()
+            except TypeError:
+                # The connection object can't be weakly referenced.
+                lock = threading.RLock()
+            self._lock = lock
+        return lock
+
+    @property
+    def stats(self):
+        """
+        Gets the statistics of the traffic through this communicator, or
+        `None` if they are disabled. See `stats_enabled`.
+
+        :type: `~instruments.abstract_instruments.comm.CommStats` or `None`
+        """
+        return self._stats
+
+    @property
+    def stats_enabled(self):
+        """
+        Gets/sets whether statistics of the traffic through this
+        communicator are collected in `stats`. They are disabled by default.
+
+        Unlike `debug`, collecting statistics only costs a few counter
+        updates and timer reads for each message, and is cheap enough to
+        leave enabled. Disabling and enabling them again starts over from
+        empty statistics. Use
+        `~instruments.abstract_instruments.comm.aggregate_stats` to add up
+        the statistics of every communicator they are enabled on.
+
+        :type: `bool`
+        """
+        return self._stats is not None
+
+    @stats_enabled.setter
+    def stats_enabled(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Statistics must be enabled or disabled with a "
+                            "boolean value.")
+        if newval == (self._stats is not None):
+            return
+        if newval:
+            stats = comm_stats.CommStats()
+            self._monitor_io(stats, self._tracer)
+            self._stats = stats
+            comm_stats._register(self)  # pylint: disable=protected-access
+        else:
+            comm_stats._unregister(self)  # pylint: disable=protected-access
+            self._stats = None
+            self._monitor_io(None, self._tracer)
+
+    @property
+    def tracer(self):
+        """
+        Gets/sets the `~instruments.abstract_instruments.comm.TraceRecorder`
+        recording the raw reads and writes of this communicator, or `None`
+        to record nothing, which is the default.
+
+        Recording is cheap enough to leave enabled, and the recorder can be
+        dumped to a file after a fault to see the last exchanges with the
+        instrument.
+
+        :type: `~instruments.abstract_instruments.comm.TraceRecorder` or
+            `None`
+        """
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, newval):
+        if newval is not None and not isinstance(newval, TraceRecorder):
+            raise TypeError("Tracer must be a TraceRecorder or None.")
+        self._monitor_io(self._stats, newval)
+        self._tracer = newval
+
     # ABSTRACT PROPERTIES #
 
     @property
@@ -111,10 +247,13 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
     # ABSTRACT METHODS #
 
     @abc.abstractmethod
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the connection.
 
+        Note that this is called by :class:`AbstractCommunicator.read_raw`,
+        which also handles statistics and tracing.
+
         :param int size: The number of bytes to read in from the
             connection.
 
@@ -123,10 +262,13 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write bytes to the connection.
 
+        Note that this is called by :class:`AbstractCommunicator.write_raw`,
+        which also handles statistics and tracing.
+
         :param bytes msg: Bytes to be sent to the instrument over the
             connection.
         """
@@ -167,6 +309,96 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
 
     # CONCRETE METHODS #
 
+    def _transport(self):
+        """
+        Returns the underlying connection object wrapped by this
+        communicator, used to share the transaction `lock` between
+        communicators wrapping the same connection. By default, this is
+        the communicator itself.
+        """
+        return self
+
+    def _monitor_io(self, stats, tracer):
+        """
+        Starts counting the bytes read and written by `read_raw`, `readinto`
+        and `write_raw` in ``stats``, and recording the reads and writes in
+        ``tracer``. Either may be `None`.
+
+        Communicators that forward these methods to another communicator
+        pass ``stats`` and ``tracer`` on to that communicator instead.
+        """
+        self._io_stats = stats
+        self._io_tracer = tracer
+
+    def read_raw(self, size=-1):
+        """
+        Read bytes in from the connection.
+
+        :param int size: The number of bytes to read in from the
+            connection.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        stats, tracer = self._io_stats, self._io_tracer
+        if stats is None and tracer is None:
+            return self._read_raw(size)
+        self._stripped_bytes = 0
+        start = time.perf_counter_ns()
+        data = self._read_raw(size)
+        if tracer is not None:
+            tracer.record(tracer.READ, data, start, time.perf_counter_ns())
+        if stats is not None:
+            stats.bytes_in += len(data) + self._stripped_bytes
+            stats._end_read()  # pylint: disable=protected-access
+        return data
+
+    def readinto(self, buf):
+        """
+        Read bytes in from the connection directly into a preallocated,
+        writable buffer, such as a `bytearray`, `memoryview` or
+        `numpy.ndarray`. At most ``len(buf)`` bytes are read, and fewer may
+        be read if the connection times out.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        stats, tracer = self._io_stats, self._io_tracer
+        if stats is None and tracer is None or \
+                type(self)._readinto is AbstractCommunicator._readinto:
+            # The default implementation reads through `read_raw`, which
+            # already counts and traces the bytes read.
+            return self._readinto(buf)
+        start = time.perf_counter_ns()
+        count = self._readinto(buf)
+        if tracer is not None:
+            view = memoryview(buf).cast("B")[:count]
+            tracer.record(tracer.READ, view, start, time.perf_counter_ns())
+        if stats is not None:
+            stats.bytes_in += count
+            stats._end_read()  # pylint: disable=protected-access
+        return count
+
+    def write_raw(self, msg):
+        """
+        Write bytes to the connection.
+
+        :param bytes msg: Bytes to be sent to the instrument over the
+            connection.
+        """
+        stats, tracer = self._io_stats, self._io_tracer
+        if stats is None and tracer is None:
+            self._write_raw(msg)
+            return
+        start = time.perf_counter_ns()
+        self._write_raw(msg)
+        if tracer is not None:
+            tracer.record(tracer.WRITE, msg, start, time.perf_counter_ns())
+        if stats is not None:
+            stats.bytes_out += len(msg)
+            stats._end_write()  # pylint: disable=protected-access
+
     def write(self, msg, encoding="utf-8"):
         """
         Write a string to the connection. This string will be converted
@@ -204,6 +436,49 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
             else:
                 raise ValueError(f"Encoding {encoding} is not currently supported.")
 
+    def _readinto(self, buf):
+        """
+        Read bytes in from the connection directly into a writable buffer.
+
+        Note that this is called by :class:`AbstractCommunicator.readinto`.
+        By default, this reads through `read_raw`. Communicators whose
+        connection supports reading into a buffer override this method to
+        avoid the intermediate `bytes` object returned by `_read_raw`.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        view = memoryview(buf).cast("B")
+        data = self.read_raw(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        """
+        Sends a message made of the bytes of ``header`` followed by binary
+        data, such as an IEEE-488.2 block, handling all proper termination
+        characters and secondary commands as for `sendcmd`. The data bytes
+        are written straight from the buffer of ``data`` in chunks of at most
+        ``chunk_size`` bytes, without being copied.
+
+        Communicators which can't pass arbitrary bytes straight through, or
+        which send each write as a separate message, override this method.
+
+        :param bytes header: Bytes sent before the data, such as the command
+            and block header.
+        :param data: Buffer holding the data bytes, such as a `bytes` object
+            or a contiguous `numpy.ndarray`.
+        :param int chunk_size: Maximum number of bytes sent by each write to
+            the connection.
+        """
+        view = memoryview(data).cast("B")
+        with self.lock:
+            self.write_raw(header)
+            for idx in range(0, len(view), chunk_size):
+                self.write_raw(view[idx:idx + chunk_size])
+            self.write_raw(self.terminator.encode("utf-8"))
+
     def sendcmd(self, msg):
         """
         Sends the incoming msg down to the wrapped file-like object
@@ -215,7 +490,21 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
         if self.debug:
             self._logger.debug(" <- %s", repr(msg))
-        self._sendcmd(msg)
+        with self.lock:
+            stats = self._stats
+            # pylint: disable=protected-access
+            if stats is None or not stats._begin():
+                self._sendcmd(msg)
+                if stats is not None:
+                    # Sent as part of a query.
+                    stats._end_write()
+                return
+            try:
+                self._sendcmd(msg)
+            except BaseException:
+                stats._abort()
+                raise
+            stats._end(msg, query=False)
 
     def query(self, msg, size=-1):
         """
@@ -230,7 +519,18 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
         if self.debug:
             self._logger.debug(" <- %s", repr(msg))
-        resp = self._query(msg, size)
+        with self.lock:
+            stats = self._stats
+            # pylint: disable=protected-access
+            if stats is None or not stats._begin():
+                resp = self._query(msg, size)
+            else:
+                try:
+                    resp = self._query(msg, size)
+                except BaseException:
+                    stats._abort()
+                    raise
+                stats._end(msg, query=True)
         if self.debug:
             self._logger.debug(" -> %s", repr(resp))
         return resp
@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides an asyncio-based tcpip socket communicator for connecting with
+instruments over raw ethernet connections without blocking an event loop.
+"""
+
+# IMPORTS #####################################################################
+
+
+import asyncio
+import contextlib
+import contextvars
+import io
+
+import instruments.units as u
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.util_fns import assume_units
+
+# GLOBALS #####################################################################
+
+# Result of the I/O operation performed by the `run_async` call active in
+# the current asyncio task.
+_current_replay = contextvars.ContextVar("_current_replay", default=None)
+
+# CLASSES #####################################################################
+
+
+class _PendingIO(BaseException):
+
+    """
+    Raised by the blocking methods of `AsyncSocketCommunicator` when
+    `run_async` has to perform an I/O operation before the blocking code can
+    continue. Derives from `BaseException` so that it is not swallowed by
+    drivers catching `Exception`.
+    """
+
+    def __init__(self, comm, op, args):
+        super(_PendingIO, self).__init__(comm, op, args)
+        self.comm = comm
+        self.op = op
+        self.args = args
+
+
+class _AsyncReplay:
+
+    """
+    Result of the I/O operation performed by a `run_async` call.
+    """
+
+    __slots__ = ("key", "result", "used")
+
+    def __init__(self):
+        self.key = None
+        self.result = None
+        self.used = False
+
+    def next(self, comm, op, args):
+        """
+        Returns the result of the I/O operation, or raises `_PendingIO` if
+        it has not been performed yet.
+        """
+        if self.key is None:
+            raise _PendingIO(comm, op, args)
+        if self.used or self.key != (comm, op, args):
+            raise RuntimeError("Blocking code run through run_async must "
+                               "perform a single I/O operation, the same "
+                               "each time it is called; use the coroutine "
+                               "methods of the instrument instead.")
+        self.used = True
+        return self.result
+
+
+class AsyncSocketCommunicator(io.IOBase, AbstractCommunicator):
+
+    """
+    Communicates with an instrument over a TCP connection opened with
+    `asyncio.open_connection`, such that many instruments can be polled
+    concurrently from a single event loop.
+
+    The I/O methods of this communicator are coroutines, named after their
+    blocking counterparts with an ``_async`` suffix: `read_raw_async`,
+    `write_raw_async`, `sendcmd_async` and `query_async`. Each of them holds
+    the connection for the current task, see `transaction`.
+
+    The blocking methods used by the getters and setters of properties are
+    supported from within `run_async`, which performs the single I/O
+    operation of such a getter or setter on the event loop. Outside of
+    `run_async`, they raise `RuntimeError`.
+
+    :param reader: Stream reader of the connection.
+    :type reader: `asyncio.StreamReader`
+    :param writer: Stream writer of the connection.
+    :type writer: `asyncio.StreamWriter`
+    :param float timeout: Timeout for each read, in seconds, or `None` to
+        wait indefinitely.
+    """
+
+    def __init__(self, reader, writer, timeout=None):
+        super(AsyncSocketCommunicator, self).__init__(self)
+
+        if isinstance(reader, asyncio.StreamReader):
+            self._reader = reader
+            self._writer = writer
+            self._terminator = "\n"
+        else:
+            raise TypeError("AsyncSocketCommunicator must wrap an "
+                            ":class:`asyncio.StreamReader` object, instead "
+                            "got {}".format(type(reader)))
+
+        self._async_lock = asyncio.Lock()
+        self._owner = None
+        self._timeout = None
+        if timeout is not None:
+            self.timeout = timeout
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Returns the socket peer address information as a tuple.
+        """
+        return self._writer.get_extra_info("peername")
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError("Unable to change address of sockets.")
+
+    @property
+    def terminator(self):
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError("Terminator for socket communicator must be "
+                            "specified as a byte or unicode string.")
+        self._terminator = newval
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the timeout of each read from the connection, or `None`
+        to wait indefinitely.
+
+        :type: `~quantities.Quantity` or `None`
+        :units: As specified or assumed to be of units ``seconds``
+        """
+        if self._timeout is None:
+            return None
+        return self._timeout * u.second
+
+    @timeout.setter
+    def timeout(self, newval):
+        if newval is not None:
+            newval = float(
+                assume_units(newval, u.second).rescale(u.second).magnitude
+            )
+        self._timeout = newval
+
+    # FILE-LIKE METHODS #
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        self._writer.close()
+
+    def _read_raw(self, size=-1):
+        """
+        Read bytes in from the connection. Only available from within
+        `run_async`.
+
+        :param int size: The number of bytes to read in from the connection.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        return self._replayed("read_raw", size)
+
+    def _write_raw(self, msg):
+        """
+        Write bytes to the connection. Only available from within
+        `run_async`.
+
+        :param bytes msg: Bytes to be sent to the instrument over the
+            connection.
+        """
+        self._replayed("write_raw", msg)
+
+    def seek(self, offset):  # pylint: disable=unused-argument,no-self-use
+        """
+        Go to a specific offset for the input data source.
+
+        Not implemented for async socket communicator.
+        """
+        raise NotImplementedError
+
+    def tell(self):  # pylint: disable=no-self-use
+        """
+        Get the current positional offset for the input data source.
+
+        Not implemented for async socket communicator.
+        """
+        raise NotImplementedError
+
+    def flush_input(self):
+        """
+        Instruct the communicator to flush the input buffer, discarding the
+        entirety of its contents.
+
+        Not implemented for async socket communicator.
+        """
+        raise NotImplementedError
+
+    # ASYNC METHODS #
+
+    async def read_raw_async(self, size=-1):
+        """
+        Read bytes in from the connection.
+
+        :param int size: The number of bytes to read in from the connection.
+            If -1, reads up to the termination character.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        async with self.transaction():
+            return await self._receive(size)
+
+    async def write_raw_async(self, msg):
+        """
+        Write bytes to the connection.
+
+        :param bytes msg: Bytes to be sent to the instrument over the
+            connection.
+        """
+        async with self.transaction():
+            await self._send(msg)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """
+        Asynchronous context manager holding the connection for the current
+        task, such that a sequence of operations is not interleaved with
+        those of other tasks. Transactions of the task holding the
+        connection run as part of it, so they may be nested.
+
+        >>> async with comm.transaction():
+        ...     await comm.sendcmd_async("CURV?")
+        ...     data = await comm.read_raw_async()
+        """
+        task = asyncio.current_task()
+        if self._owner is task:
+            yield
+            return
+        async with self._async_lock:
+            self._owner = task
+            try:
+                yield
+            finally:
+                self._owner = None
+
+    async def read_async(self, size=-1, encoding="utf-8"):
+        """
+        Read bytes in from the connection, returning a decoded string.
+
+        :param int size: The number of bytes to read in from the connection.
+        :param str encoding: Encoding that will be applied to the read bytes
+        :rtype: `str`
+        """
+        return (await self.read_raw_async(size)).decode(encoding)
+
+    async def sendcmd_async(self, msg):
+        """
+        Sends a command, appending the termination character.
+
+        :param str msg: The command message to send to the instrument
+        """
+        if self.debug:
+            self._logger.debug(" <- %s", repr(msg))
+        async with self.transaction():
+            await self._sendcmd_async(msg)
+
+    async def query_async(self, msg, size=-1):
+        """
+        Sends a query and reads the response.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        if self.debug:
+            self._logger.debug(" <- %s", repr(msg))
+        async with self.transaction():
+            resp = await self._query_async(msg, size)
+        if self.debug:
+            self._logger.debug(" -> %s", repr(resp))
+        return resp
+
+    # METHODS #
+
+    def _transport(self):
+        return self._writer
+
+    def _replayed(self, op, *args):
+        replay = _current_replay.get()
+        if replay is None:
+            raise RuntimeError("Blocking I/O is not available on an "
+                               "AsyncSocketCommunicator; use its coroutine "
+                               "methods, or call blocking code through "
+                               "run_async.")
+        return replay.next(self, op, args)
+
+    def _sendcmd(self, msg):
+        """
+        This is the implementation of ``sendcmd`` used from within
+        `run_async`.
+
+        :param str msg: The command message to send to the instrument
+        """
+        self._replayed("sendcmd", msg)
+
+    def _query(self, msg, size=-1):
+        """
+        This is the implementation of ``query`` used from within
+        `run_async`.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        return self._replayed("query", msg, size)
+
+    async def _receive(self, size):
+        if size >= 0:
+            coro = self._read_exactly(size)
+        elif size == -1:
+            coro = self._read_until_terminator()
+        else:
+            raise ValueError("Must read a positive value of characters.")
+        try:
+            return await asyncio.wait_for(coro, self._timeout)
+        except asyncio.TimeoutError as err:
+            raise IOError("Socket connection timed out before reading "
+                          "a termination character.") from err
+
+    async def _read_exactly(self, size):
+        try:
+            return await self._reader.readexactly(size)
+        except asyncio.IncompleteReadError as err:
+            raise IOError("Socket connection closed before reading the "
+                          "requested number of bytes.") from err
+
+    async def _read_until_terminator(self):
+        term = self._terminator.encode("utf-8")
+        if not term:
+            return await self._reader.read(2 ** 16)
+        result = bytearray()
+        while True:
+            try:
+                result += await self._reader.readuntil(term)
+                break
+            except asyncio.LimitOverrunError as e:
+                # Responses longer than the stream buffer limit are
+                # collected piecewise.
+                result += await self._reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError as err:
+                raise IOError("Socket connection closed before reading "
+                              "a termination character.") from err
+        return bytes(result[:-len(term)])
+
+    async def _send(self, msg):
+        self._writer.write(msg)
+        await self._writer.drain()
+
+    async def _sendcmd_async(self, msg):
+        await self._send((msg + self._terminator).encode("utf-8"))
+
+    async def _query_async(self, msg, size=-1):
+        await self._sendcmd_async(msg)
+        return (await self._receive(size)).decode("utf-8")
+
+    async def _perform(self, op, args):
+        """
+        Performs an I/O operation requested from within `run_async`.
+        """
+        async with self.transaction():
+            if op == "read_raw":
+                return await self._receive(*args)
+            if op == "write_raw":
+                return await self._send(*args)
+            if op == "sendcmd":
+                return await self._sendcmd_async(*args)
+            return await self._query_async(*args)
+
+# FUNCTIONS ###################################################################
+
+
+async def run_async(func, *args, **kwargs):
+    """
+    Calls blocking code which performs a single I/O operation, such as the
+    getter or setter of a property created by the factories in
+    `instruments.util_fns`, for an instrument connected by an
+    `AsyncSocketCommunicator`.
+
+    ``func`` is first called until it needs to perform its I/O operation,
+    which is then awaited on the event loop, and ``func`` is called a second
+    time with its result. Everything else ``func`` does thus happens twice,
+    and blocks the event loop, so only code without other side effects,
+    such as property getters, should be run this way. Code performing more
+    than one I/O operation raises `RuntimeError`; use the coroutine methods
+    of `~instruments.Instrument`, such as
+    `~instruments.Instrument.query_async`, instead.
+
+    :param func: Blocking callable to run.
+    :return: The value returned by ``func``.
+    """
+    replay = _AsyncReplay()
+    token = _current_replay.set(replay)
+    try:
+        try:
+            return func(*args, **kwargs)
+        except _PendingIO as pending:
+            comm, op, op_args = pending.comm, pending.op, pending.args
+        # pylint: disable=protected-access
+        replay.result = await comm._perform(op, op_args)
+        replay.key = (comm, op, op_args)
+        return func(*args, **kwargs)
+    finally:
+        _current_replay.reset(token)
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides low-overhead statistics of the traffic through communicators
+"""
+
+# IMPORTS #####################################################################
+
+
+import collections
+import threading
+import time
+import weakref
+
+# GLOBALS #####################################################################
+
+# Communicators with statistics enabled, for `aggregate_stats`.
+_communicators = weakref.WeakSet()
+_communicators_guard = threading.Lock()
+
+# CLASSES #####################################################################
+
+
+class LatencyHistogram:
+
+    """
+    Histogram of durations, in nanoseconds, with buckets bounded by powers
+    of two. A duration ``t`` is counted in the bucket whose upper bound is
+    the smallest power of two strictly greater than ``t``, so each bucket
+    spans a factor of two, from 1 ns to several centuries.
+    """
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+        self._buckets = [0] * 65
+
+    def __repr__(self):
+        if not self.count:
+            return "<LatencyHistogram empty>"
+        return "<LatencyHistogram count={} mean={:.0f} ns max={} ns>".format(
+            self.count, self.mean_ns, self.max_ns)
+
+    @property
+    def mean_ns(self):
+        """
+        Gets the mean of the recorded durations, in nanoseconds.
+
+        :type: `float` or `None`
+        """
+        if not self.count:
+            return None
+        return self.total_ns / self.count
+
+    @property
+    def buckets(self):
+        """
+        Gets the non-empty buckets of the histogram.
+
+        :return: A `dict` mapping the upper bound of each bucket, in
+            nanoseconds, to the number of durations counted in it, ordered
+            by bound.
+        :rtype: `dict`
+        """
+        return {
+            1 << idx: count
+            for idx, count in enumerate(self._buckets) if count
+        }
+
+    @property
+    def bucket_counts(self):
+        """
+        Gets the number of durations counted in every bucket, empty or not,
+        indexed by the base two logarithm of the upper bound of the bucket.
+
+        :type: `tuple` of `int`
+        """
+        return tuple(self._buckets)
+
+    def record(self, duration_ns):
+        """
+        Counts a duration.
+
+        :param int duration_ns: Duration, in nanoseconds.
+        """
+        duration_ns = max(int(duration_ns), 0)
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if self.max_ns is None or duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self._buckets[min(duration_ns.bit_length(), 64)] += 1
+
+    def percentile(self, percent):
+        """
+        Estimates a percentile of the recorded durations, as the upper bound
+        of the bucket it falls in. The estimate is therefore at most twice
+        the actual value.
+
+        :param float percent: Percentile to estimate, between 0 and 100.
+        :return: The estimate, in nanoseconds, or `None` if no duration was
+            recorded.
+        :rtype: `int` or `None`
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for idx, count in enumerate(self._buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(1 << idx, self.max_ns)
+        return self.max_ns
+
+    def merge(self, other):
+        """
+        Adds the durations counted by another histogram to this one.
+
+        :param LatencyHistogram other: Histogram to add.
+        """
+        if not other.count:
+            return
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if self.min_ns is None or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        if self.max_ns is None or other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+        for idx, count in enumerate(other.bucket_counts):
+            self._buckets[idx] += count
+
+    def copy(self):
+        """
+        Returns a copy of the histogram.
+
+        :rtype: `LatencyHistogram`
+        """
+        result = LatencyHistogram()
+        result.merge(self)
+        return result
+
+
+class CommStats:
+
+    """
+    Statistics of the traffic through a communicator, enabled by setting
+    `~instruments.abstract_instruments.comm.AbstractCommunicator.stats_enabled`.
+
+    Durations are measured with `time.perf_counter_ns` and recorded in
+    `LatencyHistogram` objects:
+
+    - `write`: time taken to send each command or query,
+    - `first_byte`: time from the end of sending a query to the end of the
+      first read of its response, which separates the latency of the
+      instrument from the transfer of long responses such as binary blocks,
+    - `query`: total time taken by each query.
+
+    Commands and queries are counted by header, which is the message up to
+    its first space. Bytes are counted as written to and read from the
+    connection, including messages sent to adapters, and termination
+    characters read by communicators which look for them themselves. Those
+    stripped by the VISA, USBTMC and VXI-11 libraries are not counted.
+    """
+
+    def __init__(self):
+        self.commands = collections.Counter()
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.write = LatencyHistogram()
+        self.first_byte = LatencyHistogram()
+        self.query = LatencyHistogram()
+        self._pending = None
+
+    def __repr__(self):
+        return "<CommStats commands={} bytes_out={} bytes_in={}>".format(
+            sum(self.commands.values()), self.bytes_out, self.bytes_in)
+
+    def snapshot(self):
+        """
+        Returns a copy of the statistics, which is not updated by further
+        traffic.
+
+        :rtype: `CommStats`
+        """
+        result = CommStats()
+        result.merge(self)
+        return result
+
+    def reset(self):
+        """
+        Clears the statistics.
+        """
+        self.commands.clear()
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.write = LatencyHistogram()
+        self.first_byte = LatencyHistogram()
+        self.query = LatencyHistogram()
+
+    def merge(self, other):
+        """
+        Adds the statistics of another communicator to these.
+
+        :param CommStats other: Statistics to add.
+        """
+        self.commands.update(other.commands)
+        self.bytes_out += other.bytes_out
+        self.bytes_in += other.bytes_in
+        self.write.merge(other.write)
+        self.first_byte.merge(other.first_byte)
+        self.query.merge(other.query)
+
+    # The methods below are called by the communicator, which holds its
+    # transaction lock around each command or query.
+
+    def _begin(self):
+        """
+        Starts timing a command or query, returning `False` if another one
+        is already being timed.
+        """
+        if self._pending is not None:
+            return False
+        self._pending = [time.perf_counter_ns(), None, None]
+        return True
+
+    def _end_write(self):
+        # The write ends with the last write before the response is read.
+        pending = self._pending
+        if pending is not None and pending[2] is None:
+            pending[1] = time.perf_counter_ns()
+
+    def _end_read(self):
+        pending = self._pending
+        if pending is not None and pending[2] is None:
+            pending[2] = time.perf_counter_ns()
+
+    def _end(self, msg, query):
+        end = time.perf_counter_ns()
+        start, write_end, read_end = self._pending
+        self._pending = None
+        self.commands[msg.split(" ", 1)[0]] += 1
+        if not query:
+            self.write.record((write_end or end) - start)
+            return
+        if write_end is not None:
+            self.write.record(write_end - start)
+        self.first_byte.record((read_end or end) - (write_end or start))
+        self.query.record(end - start)
+
+    def _abort(self):
+        self._pending = None
+
+# FUNCTIONS ###################################################################
+
+
+def aggregate_stats():
+    """
+    Adds up the statistics of every communicator with statistics enabled.
+
+    :rtype: `CommStats`
+    """
+    result = CommStats()
+    with _communicators_guard:
+        communicators = list(_communicators)
+    for comm in communicators:
+        stats = comm.stats
+        if stats is not None:
+            result.merge(stats)
+    return result
+
+
+def _register(comm):
+    with _communicators_guard:
+        _communicators.add(comm)
+
+
+def _unregister(comm):
+    with _communicators_guard:
+        _communicators.discard(comm)
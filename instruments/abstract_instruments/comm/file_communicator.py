@@ -104,7 +104,7 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         except IOError as e:  # pragma: no cover
             logger.warning("Failed to close file, exception: %s", repr(e))
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the file.
 
@@ -122,11 +122,29 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
                     break
                 if c != self._terminator.encode("utf-8"):
                     result += c
+            self._stripped_bytes = len(c)
             return result
         else:
             raise ValueError("Must read a positive value of characters.")
 
-    def write_raw(self, msg):
+    def _readinto(self, buf):
+        """
+        Read bytes in from the file directly into a writable buffer.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        view = memoryview(buf).cast("B")
+        if hasattr(self._filelike, "readinto"):
+            return self._filelike.readinto(view) or 0
+        # Read through `_read_raw`, as `readinto` already counts and traces
+        # the bytes read.
+        data = self._read_raw(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def _write_raw(self, msg):
         """
         Write bytes to the file.
 
@@ -162,6 +180,9 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._filelike
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
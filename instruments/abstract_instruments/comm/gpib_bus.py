@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides a scheduler arbitrating access to a GPIB adapter shared by several
+instruments.
+"""
+
+# IMPORTS #####################################################################
+
+
+import collections
+import itertools
+import threading
+import time
+
+# CLASSES #####################################################################
+
+
+class GPIBBusScheduler:
+
+    """
+    Arbitrates access to a single physical GPIB adapter, such as a Galvant
+    Industries GPIBUSB or a Prologix adapter, that is shared by several
+    `~instruments.abstract_instruments.comm.GPIBCommunicator` objects.
+
+    Each command or query is run as a transaction that holds the bus until
+    it completes, so that transactions issued from different threads never
+    interleave on the wire. Pending transactions are queued per GPIB
+    address and served in order for each address. When the bus is
+    released, transactions for the address currently selected on the
+    adapter are preferred, which avoids ``++addr`` switches. At most
+    `max_burst` such transactions are served in a row while other addresses
+    are waiting, after which the oldest pending transaction goes next.
+
+    The scheduler also holds the adapter settings last applied to the
+    adapter, in `state`.
+
+    :param int max_burst: Maximum number of consecutive transactions served
+        for one address while other addresses have pending transactions.
+    """
+
+    def __init__(self, max_burst=8):
+        if max_burst < 1:
+            raise ValueError("Maximum burst length must be at least 1.")
+        self.max_burst = max_burst
+
+        #: Adapter settings last applied, as a `dict` mapping a setting name
+        #: to the adapter command that was sent.
+        self.state = {}
+
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._pending = collections.OrderedDict()
+        self._owner = None
+        self._depth = 0
+        self._address = None
+        self._burst = 0
+        self._switches = 0
+        self._stats = {}
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the GPIB address of the most recent transaction run on the bus.
+
+        :type: `int` or `None`
+        """
+        return self._address
+
+    @property
+    def address_switches(self):
+        """
+        Gets the number of times consecutive transactions on the bus were
+        for different GPIB addresses.
+
+        :type: `int`
+        """
+        return self._switches
+
+    # METHODS #
+
+    def queue_depth(self, address=None):
+        """
+        Gets the number of transactions waiting for the bus.
+
+        :param int address: If given, only count the transactions for this
+            GPIB address.
+        :rtype: `int`
+        """
+        with self._cond:
+            if address is not None:
+                return len(self._pending.get(address, ()))
+            return sum(len(queue) for queue in self._pending.values())
+
+    def statistics(self):
+        """
+        Gets statistics of the transactions run on the bus, for each GPIB
+        address. For each address, the returned `dict` contains:
+
+        - ``count``: number of transactions run,
+        - ``depth``: number of transactions currently waiting,
+        - ``max_depth``: largest number of transactions that waited at once,
+        - ``total_wait``: total time spent waiting for the bus, in seconds,
+        - ``max_wait``: longest time spent waiting for the bus, in seconds.
+
+        :rtype: `dict`
+        """
+        with self._cond:
+            return {
+                address: dict(stats, depth=len(self._pending.get(address, ())))
+                for address, stats in self._stats.items()
+            }
+
+    def reset_statistics(self):
+        """
+        Clears the statistics returned by `statistics`.
+        """
+        with self._cond:
+            self._stats.clear()
+            self._switches = 0
+
+    def acquire(self, address):
+        """
+        Blocks until the bus is granted to a transaction for the given GPIB
+        address. Calls to `acquire` are reentrant for the thread holding
+        the bus, and each must be matched by a call to `release`.
+
+        :param int address: GPIB address the transaction talks to.
+        """
+        me = threading.get_ident()
+        if self._owner == me:
+            self._depth += 1
+            return
+
+        ticket = next(self._seq)
+        start = time.perf_counter()
+        with self._cond:
+            stats = self._stats.get(address)
+            if stats is None:
+                stats = self._stats[address] = {
+                    "count": 0, "max_depth": 0,
+                    "total_wait": 0.0, "max_wait": 0.0
+                }
+            queue = self._pending.setdefault(address, collections.deque())
+            queue.append(ticket)
+            stats["max_depth"] = max(stats["max_depth"], len(queue))
+
+            while self._owner is not None or self._next_ticket() != ticket:
+                self._cond.wait()
+
+            queue.popleft()
+            if not queue:
+                del self._pending[address]
+            if address == self._address:
+                self._burst += 1
+            else:
+                if self._address is not None:
+                    self._switches += 1
+                self._address = address
+                self._burst = 1
+            self._owner = me
+            self._depth = 1
+
+            wait = time.perf_counter() - start
+            stats["count"] += 1
+            stats["total_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def release(self):
+        """
+        Releases the bus, once every `acquire` made by the current thread
+        has been matched.
+        """
+        if self._owner != threading.get_ident():
+            raise RuntimeError("Cannot release a GPIB bus that is not held "
+                               "by the current thread.")
+        self._depth -= 1
+        if self._depth == 0:
+            with self._cond:
+                self._owner = None
+                self._cond.notify_all()
+
+    def lock(self, address):
+        """
+        Gets a lock-like object that acquires the bus for the given GPIB
+        address, for use in a ``with`` block.
+
+        :param int address: GPIB address the transaction talks to.
+        """
+        return _BusLock(self, address)
+
+    def run(self, address, func, *args, **kwargs):
+        """
+        Runs ``func(*args, **kwargs)`` as a transaction for the given GPIB
+        address, blocking until the bus is granted to it.
+
+        Transactions started from within a running transaction, on the same
+        thread, run immediately as part of it.
+
+        :param int address: GPIB address the transaction talks to.
+        :param func: Callable performing the transaction.
+        :return: The value returned by ``func``.
+        """
+        self.acquire(address)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def _next_ticket(self):
+        """
+        Picks the pending transaction that should be granted the bus next.
+        Must be called with the condition lock held.
+        """
+        current = self._pending.get(self._address)
+        if current and (self._burst < self.max_burst or
+                        len(self._pending) == 1):
+            return current[0]
+        return min(
+            queue[0] for address, queue in self._pending.items()
+            if address != self._address or len(self._pending) == 1
+        )
+
+
+class _BusLock:
+
+    """
+    Lock-like handle acquiring a `GPIBBusScheduler` for one GPIB address.
+    """
+
+    __slots__ = ("_bus", "_address")
+
+    def __init__(self, bus, address):
+        self._bus = bus
+        self._address = address
+
+    def acquire(self):
+        """
+        Acquires the bus for the address of this handle.
+        """
+        self._bus.acquire(self._address)
+        return True
+
+    def release(self):
+        """
+        Releases the bus.
+        """
+        self._bus.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -10,13 +10,31 @@ Industries or Prologix GPIB adapter.
 
 from enum import Enum
 import io
+import re
 import time
+import weakref
 
 import instruments.units as u
 
-from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.abstract_instruments.comm import (
+    AbstractCommunicator, GPIBBusScheduler
+)
 from instruments.util_fns import assume_units
 
+# GLOBALS #####################################################################
+
+# Bus scheduler of each physical GPIB adapter, keyed by the wrapped filelike
+# object. Since `serial_manager` hands out one communicator per serial port,
+# every GPIBCommunicator on the same adapter shares one scheduler, along with
+# the adapter settings it tracks. Keys are held weakly so that closed
+# connections can be garbage collected.
+_adapter_buses = weakref.WeakKeyDictionary()
+
+# Bytes that the adapters interpret themselves, as the end of a command or
+# the start of an adapter command, and which must be escaped with an ESC
+# character to be passed through to the instrument.
+_ESCAPED_BYTES = re.compile(b"[\r\n\x1b+]")
+
 # CLASSES #####################################################################
 
 
@@ -28,19 +46,41 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
     It essentially wraps those physical communication layers with the extra
     overhead required by the GPIB adapters.
+
+    The address, EOI, EOS and timeout settings last applied to the adapter
+    are tracked per physical adapter, and shared by every
+    `GPIBCommunicator` wrapping the same connection. Before each command,
+    only the settings that differ from those last applied are sent.
+
+    Commands and queries are run as transactions through the
+    `GPIBBusScheduler` of the adapter, see `bus`, so that several threads
+    can safely use instruments sharing one adapter.
+
+    :param filelike: Connection to the GPIB adapter.
+    :param int gpib_address: Address of the instrument on the GPIB bus.
+    :param str model: The brand of adapter, either ``"gi"`` for Galvant
+        Industries or ``"pl"`` for Prologix LLC.
+    :param bool auto_read: If `True`, enables the auto-read mode of Prologix
+        adapters. See `auto_read` for details.
     """
 
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, filelike, gpib_address, model="gi"):
+    def __init__(self, filelike, gpib_address, model="gi", auto_read=False):
         super(GPIBCommunicator, self).__init__(self)
         self._model = self.Model(model)
         self._file = filelike
         self._gpib_address = gpib_address
+        self._command_delay = 0
+        self._auto_read = False
+        self._bus = _adapter_buses.get(filelike)
+        if self._bus is None:
+            self._bus = _adapter_buses[filelike] = GPIBBusScheduler()
+        self._adapter_state = self._bus.state
         self._file.terminator = "\r"
         if self._model == GPIBCommunicator.Model.gi:
             self._version = int(self._file.query("+ver"))
         if self._model == GPIBCommunicator.Model.pl:
-            self._file.sendcmd("++auto 0")
+            self._apply_setting("auto", "++auto 0")
         self._terminator = None
         self.terminator = "\n"
         self._eoi = True
@@ -49,6 +89,7 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
             self._eos = 10
         else:
             self._eos = "\n"
+        self.auto_read = auto_read
 
     # ENUMS #
 
@@ -92,6 +133,75 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         else:
             raise TypeError("Not a valid input type for Instrument address.")
 
+    @property
+    def bus(self):
+        """
+        Gets the scheduler arbitrating access to the GPIB adapter. This is
+        shared by all communicators connected through the same adapter, and
+        provides queue depth and wait time statistics for each address.
+
+        :type: `GPIBBusScheduler`
+        """
+        return self._bus
+
+    @property
+    def lock(self):
+        """
+        Gets a lock-like object guarding transactions with this instrument.
+        Acquiring it waits for the `bus` to be granted to this instrument's
+        GPIB address, and holds the bus until it is released. As for other
+        communicators, it can be used in a ``with`` block to make a sequence
+        of commands atomic.
+        """
+        return self._bus.lock(self._gpib_address)
+
+    @property
+    def command_delay(self):
+        """
+        Gets/sets the delay inserted after each command written to the GPIB
+        adapter, including the commands used to change adapter settings.
+        Some older adapters need this time to process each command.
+        Defaults to zero, such that no delay is inserted.
+
+        :type: `~quantities.Quantity`
+        :units: As specified, or assumed to be of units ``seconds``
+        """
+        return self._command_delay * u.second
+
+    @command_delay.setter
+    def command_delay(self, newval):
+        newval = assume_units(newval, u.second).rescale(u.second).magnitude
+        if newval < 0:
+            raise ValueError("Command delay must be non-negative.")
+        self._command_delay = float(newval)
+
+    @property
+    def auto_read(self):
+        """
+        Gets/sets whether queries use the ``++auto`` read-after-write mode
+        of Prologix adapters.
+
+        When enabled, the adapter is switched to ``++auto 1`` before each
+        query, so that it addresses the instrument to talk as soon as the
+        query has been written and no separate ``++read`` command is needed.
+        Plain commands switch the adapter back to ``++auto 0``. As with the
+        other adapter settings, the mode is only sent when it changes.
+
+        This is only supported by Prologix adapters.
+
+        :type: `bool`
+        """
+        return self._auto_read
+
+    @auto_read.setter
+    def auto_read(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Auto-read mode must be specified as a boolean.")
+        if newval and self._model != GPIBCommunicator.Model.pl:
+            raise NotImplementedError("Auto-read mode is only supported by "
+                                      "Prologix GPIB adapters.")
+        self._auto_read = newval
+
     @property
     def timeout(self):
         """
@@ -105,15 +215,10 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
     @timeout.setter
     def timeout(self, newval):
-        newval = assume_units(newval, u.second)
-        if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
-            newval = newval.rescale(u.second)
-            self._file.sendcmd('+t:{}'.format(int(newval.magnitude)))
-        else:
-            newval = newval.rescale(u.millisecond)
-            self._file.sendcmd("++read_tmo_ms {}".format(int(newval.magnitude)))
-        self._file.timeout = newval.rescale(u.second)
-        self._timeout = newval.rescale(u.second)
+        self._timeout = assume_units(newval, u.second).rescale(u.second)
+        self._bus.run(self._gpib_address, self._apply_setting,
+                      "timeout", self._timeout_cmd())
+        self._file.timeout = self._timeout
 
     @property
     def terminator(self):
@@ -193,10 +298,8 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         if not isinstance(newval, bool):
             raise TypeError("EOI status must be specified as a boolean")
         self._eoi = newval
-        if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
-            self._file.sendcmd("+eoi:{}".format('1' if newval else '0'))
-        else:
-            self._file.sendcmd("++eoi {}".format('1' if newval else '0'))
+        self._bus.run(self._gpib_address, self._apply_setting,
+                      "eoi", self._eoi_cmd())
 
     @property
     def eos(self):
@@ -217,26 +320,14 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
             if isinstance(newval, (str, bytes)):
                 newval = ord(newval)
-            self._file.sendcmd("+eos:{}".format(newval))
-            self._eos = newval
         else:
             if isinstance(newval, int):
                 newval = str(chr(newval))
-            if newval == "\r\n":
-                self._eos = newval
-                newval = 0
-            elif newval == "\r":
-                self._eos = newval
-                newval = 1
-            elif newval == "\n":
-                self._eos = newval
-                newval = 2
-            elif newval is None:
-                self._eos = newval
-                newval = 3
-            else:
+            if newval not in self._EOS_CODES:
                 raise ValueError("EOS must be CRLF, CR, LF, or None")
-            self._file.sendcmd("++eos {}".format(newval))
+        self._eos = newval
+        self._bus.run(self._gpib_address, self._apply_setting,
+                      "eos", self._eos_cmd())
 
     # FILE-LIKE METHODS #
 
@@ -248,7 +339,7 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         self._file.close()
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the gpibusb connection.
 
@@ -260,6 +351,17 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         return self._file.read_raw(size)
 
+    def _readinto(self, buf):
+        """
+        Read bytes in from the gpibusb connection directly into a writable
+        buffer.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        return self._file.readinto(buf)
+
     def read(self, size=-1, encoding="utf-8"):
         """
         Read characters from wrapped class (ie SocketCommunicator or
@@ -279,7 +381,7 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         return self._file.read(size, encoding)
 
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write bytes to the gpibusb connection.
 
@@ -305,8 +407,97 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         self._file.flush_input()
 
+    def invalidate_adapter_state(self):
+        """
+        Forgets the settings last applied to the GPIB adapter, such that all
+        of them are sent again before the next command. This is needed if
+        the adapter has been reset or power cycled, or if it has been
+        configured by something other than InstrumentKit.
+
+        The adapter state is shared, so this affects every
+        `GPIBCommunicator` connected through the same adapter.
+        """
+        self._adapter_state.clear()
+
     # METHODS #
 
+    # Prologix and new Galvant firmware codes for each EOS setting.
+    _EOS_CODES = {"\r\n": 0, "\r": 1, "\n": 2, None: 3}
+
+    def _monitor_io(self, stats, tracer):
+        # Count and trace the traffic on the connection to the adapter,
+        # which includes the commands sent to the adapter itself.
+        self._file._monitor_io(stats, tracer)  # pylint: disable=protected-access
+
+    def _old_firmware(self):
+        return self._model == GPIBCommunicator.Model.gi and self._version <= 4
+
+    def _addr_cmd(self):
+        if self._model == GPIBCommunicator.Model.gi:
+            return "+a:{0}".format(self._gpib_address)
+        return "++addr {0}".format(self._gpib_address)
+
+    def _eoi_cmd(self):
+        if self._old_firmware():
+            return "+eoi:{}".format('1' if self._eoi else '0')
+        return "++eoi {}".format('1' if self._eoi else '0')
+
+    def _timeout_cmd(self):
+        if self._old_firmware():
+            return "+t:{}".format(int(self._timeout.rescale(u.second).magnitude))
+        return "++read_tmo_ms {}".format(
+            int(self._timeout.rescale(u.millisecond).magnitude)
+        )
+
+    def _eos_cmd(self):
+        eos = self._eos
+        if self._old_firmware():
+            if isinstance(eos, (str, bytes)):
+                eos = ord(eos)
+            return "+eos:{}".format(eos)
+        if isinstance(eos, int):
+            eos = chr(eos)
+        return "++eos {}".format(self._EOS_CODES[eos])
+
+    def _write_adapter(self, msg):
+        """
+        Writes a command to the adapter, followed by the inter-command delay
+        if one has been set.
+        """
+        self._file.sendcmd(msg)
+        if self._command_delay:
+            time.sleep(self._command_delay)
+
+    def _apply_setting(self, key, cmd):
+        """
+        Sends the adapter command ``cmd`` for the setting ``key``, unless it
+        is the command that was last applied to the adapter for that setting.
+
+        :return: `True` if the command was sent to the adapter.
+        :rtype: `bool`
+        """
+        if self._adapter_state.get(key) == cmd:
+            return False
+        self._write_adapter(cmd)
+        self._adapter_state[key] = cmd
+        return True
+
+    def _sync_adapter(self, auto=False):
+        """
+        Brings the adapter settings in line with those of this communicator,
+        sending only the settings which differ from those last applied.
+
+        :param bool auto: Whether a Prologix adapter should be left in
+            ``++auto 1`` mode for the message that follows.
+        """
+        self._apply_setting("addr", self._addr_cmd())
+        self._apply_setting("eoi", self._eoi_cmd())
+        if self._apply_setting("timeout", self._timeout_cmd()):
+            self._file.timeout = self._timeout
+        self._apply_setting("eos", self._eos_cmd())
+        if self._model == GPIBCommunicator.Model.pl:
+            self._apply_setting("auto", "++auto 1" if auto else "++auto 0")
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -316,23 +507,13 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
         :param str msg: The command message to send to the instrument
         """
-        sleep_time = 0.01
-
         if msg == '':
             return
-        if self._model == GPIBCommunicator.Model.gi:
-            self._file.sendcmd("+a:{0}".format(str(self._gpib_address)))
-        else:
-            self._file.sendcmd("++addr {0}".format(str(self._gpib_address)))
-        time.sleep(sleep_time)
-        self.eoi = self.eoi
-        time.sleep(sleep_time)
-        self.timeout = self.timeout
-        time.sleep(sleep_time)
-        self.eos = self.eos
-        time.sleep(sleep_time)
-        self._file.sendcmd(msg)
-        time.sleep(sleep_time)
+        self._bus.run(self._gpib_address, self._sendcmd_transaction, msg)
+
+    def _sendcmd_transaction(self, msg):
+        self._sync_adapter()
+        self._write_adapter(msg)
 
     def _query(self, msg, size=-1):
         """
@@ -348,7 +529,7 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
         The Prologix adapter is set to not get a response unless told to do
         so. It is instructed to get a response from the instrument via the
-        ``++read`` command.
+        ``++read`` command, unless `auto_read` is enabled.
 
         :param str msg: The query message to send to the instrument
         :param int size: The number of bytes to read back from the instrument
@@ -356,9 +537,66 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         :return: The instrument response to the query
         :rtype: `str`
         """
+        return self._bus.run(
+            self._gpib_address, self._query_transaction, msg, size
+        )
+
+    def _query_transaction(self, msg, size):
+        if self._auto_read and msg != '':
+            self._sync_adapter(auto=True)
+            self._write_adapter(msg)
+            return self._file.read(size).strip()
         self.sendcmd(msg)
         if self._model == GPIBCommunicator.Model.gi and '?' not in msg:
-            self._file.sendcmd('+read')
+            self._write_adapter('+read')
         if self._model == GPIBCommunicator.Model.pl:
-            self._file.sendcmd('++read')
+            self._write_adapter('++read')
         return self._file.read(size).strip()
+
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        """
+        Sends a message made of the bytes of ``header`` followed by binary
+        data, such as an IEEE-488.2 block, to the instrument.
+
+        As for `sendcmd`, the adapter is first addressed to the instrument
+        and brought in line with the settings of this communicator, as one
+        transaction on the `bus`. The carriage return, line feed, escape and
+        ``+`` bytes of the message are escaped, so that the adapter passes
+        them through to the instrument rather than interpreting them. The
+        message is ended as any other command, and the adapter then appends
+        the EOS character and asserts EOI as set by `eos` and `eoi`.
+
+        :param bytes header: Bytes sent before the data, such as the command
+            and block header.
+        :param data: Buffer holding the data bytes, such as a `bytes` object
+            or a contiguous `numpy.ndarray`.
+        :param int chunk_size: Maximum number of data bytes sent by each
+            write to the adapter, before escaping.
+        """
+        self._bus.run(self._gpib_address, self._write_block_transaction,
+                      header, data, chunk_size)
+
+    def _write_block_transaction(self, header, data, chunk_size):
+        self._sync_adapter()
+        view = memoryview(data).cast("B")
+        self._file.write_raw(_escape(header))
+        for idx in range(0, len(view), chunk_size):
+            self._file.write_raw(_escape(view[idx:idx + chunk_size]))
+        # Ends the adapter command; this is the terminator of the connection
+        # to the adapter, never the "eoi" pseudo-terminator of this class.
+        self._file.write_raw(self._file.terminator.encode("utf-8"))
+        if self._command_delay:
+            time.sleep(self._command_delay)
+
+
+# FUNCTIONS ###################################################################
+
+
+def _escape(data):
+    """
+    Escapes the bytes of ``data`` which the GPIB adapters would otherwise
+    interpret, see `GPIBCommunicator.write_block`.
+
+    :rtype: `bytes`
+    """
+    return _ESCAPED_BYTES.sub(b"\x1b\\g<0>", bytes(data))
@@ -91,7 +91,7 @@ class LoopbackCommunicator(io.IOBase, AbstractCommunicator):
         except IOError:
             pass
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Gets desired response command from stdin. If ``stdin`` is `None`, then
         the user will be prompted to enter a mock response in the Python
@@ -110,6 +110,8 @@ class LoopbackCommunicator(io.IOBase, AbstractCommunicator):
                         if c == b'':
                             break
                         result += c
+                    if result.endswith(self._terminator.encode("utf-8")):
+                        self._stripped_bytes = len(self._terminator)
                     return result[:-len(self._terminator)]
                 return self._stdin.read(-1)
 
@@ -123,7 +125,7 @@ class LoopbackCommunicator(io.IOBase, AbstractCommunicator):
             input_var = input("Desired Response: ")
         return input_var
 
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write raw bytes to the loopback communicator's stdout. If ``stdout`` is
         `None` then it will be simply printed to the Python interpreter
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides a communicator recording a live session with an instrument, to be
+served back by `~instruments.abstract_instruments.comm.ReplayCommunicator`.
+"""
+
+# IMPORTS #####################################################################
+
+
+import collections
+import struct
+import time
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+
+# GLOBALS #####################################################################
+
+_MAGIC = b"IKREC001"
+_HEADER = struct.Struct("<8sH")
+_EVENT = struct.Struct("<BqqiII")
+
+# CLASSES #####################################################################
+
+
+RecordedEvent = collections.namedtuple(
+    "RecordedEvent", ["kind", "start_ns", "duration_ns", "size", "msg", "data"]
+)
+RecordedEvent.__doc__ = """
+Event of a session recorded by `RecordingCommunicator`.
+
+``kind`` is one of the ``RecordingCommunicator`` event kinds. ``start_ns``
+is the time the event started, in nanoseconds since the start of the
+recording, and ``duration_ns`` the time it took. ``size`` is the size
+argument of a query or read. ``msg`` is the message sent, as `bytes`, and
+``data`` the bytes received.
+"""
+
+
+class RecordingCommunicator(AbstractCommunicator):
+
+    """
+    Wraps another communicator, passing everything through while recording
+    each command, query and raw read or write, along with its timing and
+    the exact bytes received, such as binary blocks. The recording can be
+    saved to a compact file and served back by
+    `~instruments.abstract_instruments.comm.ReplayCommunicator`, to
+    benchmark or debug driver code against real traffic without the
+    instrument.
+
+    A recording is usually started with `~instruments.Instrument.start_recording`:
+
+    >>> inst = ik.srs.SRS830.open_gpibusb("/dev/ttyUSB0", 1)
+    >>> recording = inst.start_recording()
+    >>> data = inst.take_measurement(...)
+    >>> inst.stop_recording().save("srs830.rec")
+
+    :param comm: Communicator to pass the traffic to.
+    :type comm: `AbstractCommunicator`
+    """
+
+    SENDCMD = 0
+    QUERY = 1
+    READ_RAW = 2
+    READINTO = 3
+    WRITE_RAW = 4
+    WRITE_BLOCK = 5
+
+    def __init__(self, comm):
+        super(RecordingCommunicator, self).__init__()
+        if not isinstance(comm, AbstractCommunicator):
+            raise TypeError("RecordingCommunicator must wrap an "
+                            "AbstractCommunicator.")
+        self._comm = comm
+        self._origin = time.perf_counter_ns()
+        self.events = []
+
+    # PROPERTIES #
+
+    @property
+    def comm(self):
+        """
+        Gets the communicator the traffic is passed to.
+
+        :type: `AbstractCommunicator`
+        """
+        return self._comm
+
+    @property
+    def address(self):
+        return self._comm.address
+
+    @address.setter
+    def address(self, newval):
+        self._comm.address = newval
+
+    @property
+    def terminator(self):
+        return self._comm.terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        self._comm.terminator = newval
+
+    @property
+    def timeout(self):
+        return self._comm.timeout
+
+    @timeout.setter
+    def timeout(self, newval):
+        self._comm.timeout = newval
+
+    @property
+    def lock(self):
+        return self._comm.lock
+
+    # FILE-LIKE METHODS #
+
+    def close(self):
+        """
+        Closes the wrapped communicator.
+        """
+        self._comm.close()
+
+    def _read_raw(self, size=-1):
+        start = time.perf_counter_ns()
+        data = self._comm.read_raw(size)
+        self._record(self.READ_RAW, start, size, b"", data)
+        return data
+
+    def _readinto(self, buf):
+        start = time.perf_counter_ns()
+        count = self._comm.readinto(buf)
+        data = bytes(memoryview(buf).cast("B")[:count])
+        self._record(self.READINTO, start, len(data), b"", data)
+        return count
+
+    def _write_raw(self, msg):
+        start = time.perf_counter_ns()
+        self._comm.write_raw(msg)
+        self._record(self.WRITE_RAW, start, -1, bytes(msg), b"")
+
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        start = time.perf_counter_ns()
+        self._comm.write_block(header, data, chunk_size)
+        msg = bytes(header) + memoryview(data).cast("B").tobytes()
+        self._record(self.WRITE_BLOCK, start, -1, msg, b"")
+
+    def flush_input(self):
+        self._comm.flush_input()
+
+    # METHODS #
+
+    def save(self, file):
+        """
+        Writes the recording to a file, to be loaded with `load`.
+
+        :param file: Path of the file, or binary file-like object, to write
+            to.
+        """
+        if isinstance(file, str):
+            with open(file, "wb") as fileobj:
+                self.save(fileobj)
+            return
+        terminator = self.terminator
+        if isinstance(terminator, str):
+            terminator = terminator.encode("utf-8")
+        file.write(_HEADER.pack(_MAGIC, len(terminator)))
+        file.write(terminator)
+        for event in self.events:
+            file.write(_EVENT.pack(
+                event.kind, event.start_ns, event.duration_ns, event.size,
+                len(event.msg), len(event.data)
+            ))
+            file.write(event.msg)
+            file.write(event.data)
+
+    @staticmethod
+    def load(file):
+        """
+        Reads a recording written by `save`.
+
+        :param file: Path of the file, or binary file-like object, to read
+            from.
+        :return: The terminator of the recorded communicator, and the
+            recorded events.
+        :rtype: `tuple` of `str` and `list` of `RecordedEvent`
+        """
+        if isinstance(file, str):
+            with open(file, "rb") as fileobj:
+                return RecordingCommunicator.load(fileobj)
+        magic, length = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("Not a recording written by "
+                             "RecordingCommunicator.")
+        terminator = file.read(length).decode("utf-8")
+        events = []
+        while True:
+            header = file.read(_EVENT.size)
+            if not header:
+                break
+            kind, start, duration, size, msg_len, data_len = _EVENT.unpack(
+                header
+            )
+            msg = file.read(msg_len)
+            events.append(RecordedEvent(
+                kind, start, duration, size, msg, file.read(data_len)
+            ))
+        return terminator, events
+
+    def _record(self, kind, start, size, msg, data):
+        end = time.perf_counter_ns()
+        self.events.append(RecordedEvent(
+            kind, start - self._origin, end - start, size, msg, data
+        ))
+
+    def _sendcmd(self, msg):
+        start = time.perf_counter_ns()
+        self._comm.sendcmd(msg)
+        self._record(self.SENDCMD, start, -1, msg.encode("utf-8"), b"")
+
+    def _query(self, msg, size=-1):
+        start = time.perf_counter_ns()
+        resp = self._comm.query(msg, size)
+        self._record(self.QUERY, start, size, msg.encode("utf-8"),
+                     resp.encode("utf-8"))
+        return resp
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides a communicator serving back a session recorded by
+`~instruments.abstract_instruments.comm.RecordingCommunicator`.
+"""
+
+# IMPORTS #####################################################################
+
+
+import collections
+import time
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.abstract_instruments.comm.recording_communicator import (
+    RecordingCommunicator
+)
+
+# CLASSES #####################################################################
+
+
+class ReplayCommunicator(AbstractCommunicator):
+
+    """
+    Serves back a session recorded by `RecordingCommunicator`, such that
+    driver code can be run and benchmarked against real traffic without the
+    instrument.
+
+    By default, the session is replayed strictly: each command, query and
+    raw read or write must be the one recorded next, and an `IOError` is
+    raised as soon as the driver diverges from the recording.
+
+    With ``strict=False``, the replay instead follows the driver: the
+    response to each query is the next one recorded for the same message,
+    or the last one once they are exhausted, commands and raw writes are
+    accepted without being checked, and raw reads return the recorded raw
+    reads in order. This allows replaying a session through driver code
+    that sends fewer messages, such as with the query cache or shadow state
+    enabled. Messages never recorded, such as compound messages built by a
+    batch, can't be answered and raise an `IOError`.
+
+    :param recording: Recording to serve, as the path of a file written by
+        `RecordingCommunicator.save`, a binary file-like object, or a
+        `RecordingCommunicator`.
+    :param bool realtime: If `True`, each event takes as long as it did
+        when it was recorded. Otherwise, the session is served as fast as
+        possible.
+    :param bool strict: If `True`, the driver must follow the recording
+        exactly.
+    """
+
+    def __init__(self, recording, realtime=False, strict=True):
+        super(ReplayCommunicator, self).__init__()
+        if isinstance(recording, RecordingCommunicator):
+            terminator, events = recording.terminator, list(recording.events)
+        else:
+            terminator, events = RecordingCommunicator.load(recording)
+        self._terminator = terminator
+        self._timeout = None
+        self.realtime = realtime
+        self.strict = strict
+        self._events = collections.deque(events)
+        self._responses = {}
+        self._reads = collections.deque()
+        if not strict:
+            for event in events:
+                if event.kind == RecordingCommunicator.QUERY:
+                    self._responses.setdefault(
+                        event.msg, collections.deque()
+                    ).append(event)
+                elif event.kind in (RecordingCommunicator.READ_RAW,
+                                    RecordingCommunicator.READINTO):
+                    self._reads.append(event)
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the address of the replay communicator, which is always
+        ``"replay"``.
+
+        :type: `str`
+        """
+        return "replay"
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character of the recorded session.
+
+        :type: `str`
+        """
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError("Terminator for replay communicator must be "
+                            "specified as a byte or unicode string.")
+        self._terminator = newval
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the timeout of the replay communicator, which is unused.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, newval):
+        self._timeout = newval
+
+    @property
+    def remaining(self):
+        """
+        Gets the number of recorded events not served yet. In non-strict
+        mode, only the raw reads are counted.
+
+        :type: `int`
+        """
+        if self.strict:
+            return len(self._events)
+        return len(self._reads)
+
+    # FILE-LIKE METHODS #
+
+    def close(self):
+        """
+        Closes the replay communicator, which does nothing.
+        """
+
+    def _read_raw(self, size=-1):
+        if self.strict:
+            event = self._next(RecordingCommunicator.READ_RAW, size=size)
+        else:
+            event = self._next_read()
+        return event.data
+
+    def _readinto(self, buf):
+        view = memoryview(buf).cast("B")
+        if self.strict:
+            event = self._next(RecordingCommunicator.READINTO)
+        else:
+            event = self._next_read()
+        data = event.data[:len(view)]
+        view[:len(data)] = data
+        return len(data)
+
+    def _write_raw(self, msg):
+        if self.strict:
+            self._next(RecordingCommunicator.WRITE_RAW, msg=bytes(msg))
+
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        # pylint: disable=unused-argument
+        if self.strict:
+            msg = bytes(header) + memoryview(data).cast("B").tobytes()
+            self._next(RecordingCommunicator.WRITE_BLOCK, msg=msg)
+
+    def flush_input(self):
+        """
+        Instruct the communicator to flush the input buffer, which does
+        nothing when replaying.
+        """
+
+    # METHODS #
+
+    def _wait(self, event):
+        if self.realtime and event.duration_ns > 0:
+            time.sleep(event.duration_ns / 1e9)
+
+    def _next(self, kind, msg=None, size=None):
+        """
+        Serves the next recorded event, checking that it matches the call
+        made by the driver.
+        """
+        if not self._events:
+            raise IOError("Replay is exhausted.")
+        event = self._events[0]
+        if (event.kind != kind or (msg is not None and event.msg != msg) or
+                (size is not None and event.size != size)):
+            raise IOError("Replay diverged from the recording: expected "
+                          "{}, got {}.".format(
+                              _describe(event.kind, event.msg, event.size),
+                              _describe(kind, msg, size)))
+        self._events.popleft()
+        self._wait(event)
+        return event
+
+    def _next_read(self):
+        if not self._reads:
+            raise IOError("Replay has no more recorded reads.")
+        event = self._reads.popleft()
+        self._wait(event)
+        return event
+
+    def _sendcmd(self, msg):
+        if self.strict:
+            self._next(RecordingCommunicator.SENDCMD, msg=msg.encode("utf-8"))
+
+    def _query(self, msg, size=-1):
+        encoded = msg.encode("utf-8")
+        if self.strict:
+            event = self._next(RecordingCommunicator.QUERY, msg=encoded,
+                               size=size)
+        else:
+            responses = self._responses.get(encoded)
+            if not responses:
+                raise IOError("Query {!r} was not recorded.".format(msg))
+            event = responses.popleft() if len(responses) > 1 else responses[0]
+            self._wait(event)
+        return event.data.decode("utf-8")
+
+# FUNCTIONS ###################################################################
+
+
+_KIND_NAMES = {
+    RecordingCommunicator.SENDCMD: "sendcmd",
+    RecordingCommunicator.QUERY: "query",
+    RecordingCommunicator.READ_RAW: "read_raw",
+    RecordingCommunicator.READINTO: "readinto",
+    RecordingCommunicator.WRITE_RAW: "write_raw",
+    RecordingCommunicator.WRITE_BLOCK: "write_block",
+}
+
+
+def _describe(kind, msg, size):
+    desc = _KIND_NAMES[kind]
+    if msg:
+        desc += " {!r}".format(msg)
+    if size is not None and size != -1:
+        desc += " of {} bytes".format(size)
+    return desc
@@ -24,9 +24,14 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
     """
     Wraps a `pyserial.Serial` object to add a few properties as well as
     handling of termination characters.
+
+    :param conn: The serial port to be wrapped.
+    :type conn: `serial.Serial`
+    :param bool buffered: If `True`, enables the buffered read mode.
+        See `buffered` for details.
     """
 
-    def __init__(self, conn):
+    def __init__(self, conn, buffered=False):
         super(SerialCommunicator, self).__init__(self)
 
         if isinstance(conn, serial.Serial):
@@ -37,6 +42,10 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
             raise TypeError("SerialCommunicator must wrap a serial.Serial "
                             "object.")
 
+        self._rx_buf = bytearray()
+        self._buffered = False
+        self.buffered = buffered
+
     # PROPERTIES #
 
     @property
@@ -75,6 +84,27 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
                             "specified as a byte or unicode string.")
         self._terminator = newval
 
+    @property
+    def buffered(self):
+        """
+        Gets/sets whether the buffered read mode is enabled.
+
+        When enabled, reads up to a termination character drain all bytes
+        waiting in the serial port in a single call instead of reading one
+        byte at a time. Any bytes received after the termination character
+        are kept in a receive buffer and returned by the next read.
+
+        :type: `bool`
+        """
+        return self._buffered
+
+    @buffered.setter
+    def buffered(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Buffered read mode must be specified as a "
+                            "boolean.")
+        self._buffered = newval
+
     @property
     def timeout(self):
         """
@@ -101,7 +131,7 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         finally:
             self._conn.close()
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the serial port.
 
@@ -109,9 +139,20 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         :rtype: `bytes`
         """
         if size >= 0:
-            resp = self._conn.read(size)
+            buf = self._rx_buf
+            if not buf:
+                resp = self._conn.read(size)
+                return resp
+            if len(buf) >= size:
+                resp = bytes(buf[:size])
+                del buf[:size]
+                return resp
+            resp = bytes(buf) + self._conn.read(size - len(buf))
+            del buf[:]
             return resp
         elif size == -1:
+            if self._buffered:
+                return self._read_buffered()
             result = bytes()
             # If the terminator is empty, we can't use endswith, but must
             # read as many bytes as are available.
@@ -129,11 +170,71 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
                     raise IOError("Serial connection timed out before reading "
                                   "a termination character.")
                 result += c
-            return result[:-len(term)] if term is not None else result
+            if term is None:
+                return result
+            self._stripped_bytes = len(term)
+            return result[:-len(term)]
         else:
             raise ValueError("Must read a positive value of characters.")
 
-    def write_raw(self, msg):
+    def _readinto(self, buf):
+        """
+        Read bytes in from the serial port directly into a writable buffer.
+
+        Bytes left over in the receive buffer by the buffered read mode are
+        copied first, and the rest is read from the serial port.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        view = memoryview(buf).cast("B")
+        rx_buf = self._rx_buf
+        count = min(len(rx_buf), len(view))
+        if count:
+            view[:count] = rx_buf[:count]
+            del rx_buf[:count]
+        if count < len(view):
+            count += self._conn.readinto(view[count:])
+        return count
+
+    def _read_buffered(self):
+        """
+        Reads up to the termination character, draining every byte waiting in
+        the serial port at once. Used by `read_raw` when the buffered read
+        mode is enabled.
+
+        :rtype: `bytes`
+        """
+        buf = self._rx_buf
+        term = self._terminator.encode('utf-8') if self._terminator else None
+        if term is None:
+            # Without a terminator, read as many bytes as are available.
+            while True:
+                chunk = self._conn.read(max(1, self._conn.in_waiting))
+                if chunk == b'':
+                    break
+                buf += chunk
+            result = bytes(buf)
+            del buf[:]
+            return result
+
+        idx = buf.find(term)
+        while idx == -1:
+            # Only the tail of the buffer could hold the start of a
+            # terminator split across two reads.
+            start = max(len(buf) - len(term) + 1, 0)
+            chunk = self._conn.read(max(1, self._conn.in_waiting))
+            if chunk == b'':
+                raise IOError("Serial connection timed out before reading "
+                              "a termination character.")
+            buf += chunk
+            idx = buf.find(term, start)
+        result = bytes(buf[:idx])
+        del buf[:idx + len(term)]
+        return result
+
+    def _write_raw(self, msg):
         """
         Write bytes to the `pyserial.Serial` object.
 
@@ -162,12 +263,17 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         Instruct the communicator to flush the input buffer, discarding the
         entirety of its contents.
 
-        Calls the pyserial flushInput() method.
+        Calls the pyserial flushInput() method, and discards any bytes held
+        in the receive buffer.
         """
+        del self._rx_buf[:]
         self._conn.flushInput()
 
     # METHODS #
 
+    def _transport(self):
+        return self._conn
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -26,9 +26,18 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
     is used instead of `socket.makefile`, as that method does not support
     timeouts. We do not support all features of `file`-like objects here, but
     enough to make `~instrument.Instrument` happy.
+
+    Incoming data is received in chunks of `chunk_size` bytes and held in a
+    per-connection buffer, such that any bytes received past a termination
+    character are kept for the next read.
+
+    :param conn: The socket to be wrapped.
+    :type conn: `socket.socket`
+    :param int chunk_size: Maximum number of bytes to request from the socket
+        for each ``recv`` call when reading up to a termination character.
     """
 
-    def __init__(self, conn):
+    def __init__(self, conn, chunk_size=4096):
         super(SocketCommunicator, self).__init__(self)
 
         if isinstance(conn, socket.socket):
@@ -39,6 +48,10 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
                             ":class:`socket.socket` object, instead got "
                             "{}".format(type(conn)))
 
+        self._rx_buf = bytearray()
+        self._chunk_size = None
+        self.chunk_size = chunk_size
+
     # PROPERTIES #
 
     @property
@@ -52,6 +65,29 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
     def address(self, newval):
         raise NotImplementedError("Unable to change address of sockets.")
 
+    @property
+    def chunk_size(self):
+        """
+        Gets/sets the maximum number of bytes requested from the socket for
+        each ``recv`` call made while searching for a termination character.
+
+        Larger values reduce the number of system calls needed for long
+        responses.
+
+        :type: `int`
+        """
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, newval):
+        if not isinstance(newval, int):
+            raise TypeError("Chunk size for socket communicator must be "
+                            "specified as an integer.")
+        if newval < 1:
+            raise ValueError("Chunk size for socket communicator must be "
+                             "a positive number of bytes.")
+        self._chunk_size = newval
+
     @property
     def terminator(self):
         return self._terminator
@@ -91,30 +127,72 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
         finally:
             self._conn.close()
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the socket connection.
 
+        Bytes left over in the receive buffer from a previous read are
+        returned before any new data is requested from the socket.
+
         :param int size: The number of bytes to read in from the socket
             connection.
         :return: The read bytes
         :rtype: `bytes`
         """
+        buf = self._rx_buf
         if size >= 0:
-            return self._conn.recv(size)
+            if len(buf) >= size:
+                result = bytes(buf[:size])
+                del buf[:size]
+                return result
+            if not buf:
+                return self._conn.recv(size)
+            result = bytes(buf) + self._conn.recv(size - len(buf))
+            del buf[:]
+            return result
         elif size == -1:
-            result = bytes()
-            while result.endswith(self._terminator.encode("utf-8")) is False:
-                c = self._conn.recv(1)
-                if c == b'':
+            term = self._terminator.encode("utf-8")
+            idx = buf.find(term)
+            while idx == -1:
+                # Only the tail of the buffer could hold the start of a
+                # terminator split across two chunks.
+                start = max(len(buf) - len(term) + 1, 0)
+                chunk = self._conn.recv(self._chunk_size)
+                if chunk == b'':
                     raise IOError("Socket connection timed out before reading "
                                   "a termination character.")
-                result += c
-            return result[:-len(self._terminator)]
+                buf += chunk
+                idx = buf.find(term, start)
+            result = bytes(buf[:idx])
+            del buf[:idx + len(term)]
+            self._stripped_bytes = len(term)
+            return result
         else:
             raise ValueError("Must read a positive value of characters.")
 
-    def write_raw(self, msg):
+    def _readinto(self, buf):
+        """
+        Read bytes in from the socket connection directly into a writable
+        buffer, using `socket.socket.recv_into`.
+
+        Bytes left over in the receive buffer from a previous read are
+        copied first, and the rest is requested from the socket.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        view = memoryview(buf).cast("B")
+        rx_buf = self._rx_buf
+        count = min(len(rx_buf), len(view))
+        if count:
+            view[:count] = rx_buf[:count]
+            del rx_buf[:count]
+        if count < len(view):
+            count += self._conn.recv_into(view[count:])
+        return count
+
+    def _write_raw(self, msg):
         """
         Write bytes to the `socket.socket` connection object.
 
@@ -148,6 +226,9 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._conn
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
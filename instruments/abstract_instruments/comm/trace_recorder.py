@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides a fixed-size recorder of the raw traffic through a communicator
+"""
+
+# IMPORTS #####################################################################
+
+
+import collections
+import itertools
+import struct
+import time
+
+# GLOBALS #####################################################################
+
+_MAGIC = b"IKTRACE1"
+_HEADER = struct.Struct("<8sqII")
+_ENTRY = struct.Struct("<qqBIH")
+
+# CLASSES #####################################################################
+
+
+TraceEntry = collections.namedtuple(
+    "TraceEntry", ["timestamp_ns", "direction", "data", "length", "duration_ns"]
+)
+TraceEntry.__doc__ = """
+Entry of a `TraceRecorder`.
+
+``timestamp_ns`` is the time the read or write started, in nanoseconds since
+the epoch. ``direction`` is ``"write"`` or ``"read"``. ``data`` holds the
+first bytes transferred, and ``length`` the number of bytes transferred.
+``duration_ns`` is the time the read or write took, in nanoseconds.
+"""
+
+
+class TraceRecorder:
+
+    """
+    Records the raw reads and writes of a communicator in a ring buffer,
+    holding the most recent `capacity` of them. Attach a recorder by
+    setting `~instruments.abstract_instruments.comm.AbstractCommunicator.tracer`:
+
+    >>> tracer = TraceRecorder(capacity=1024)
+    >>> inst.tracer = tracer
+    >>> try:
+    ...     run_measurement(inst)
+    ... except Exception:
+    ...     tracer.dump("fault.trace")
+    ...     raise
+
+    Unlike `~instruments.abstract_instruments.comm.AbstractCommunicator.debug`,
+    recording formats nothing: each read or write stores two timer values,
+    a direction and a slice of at most `max_bytes` bytes into preallocated
+    slots, and takes no lock. Entries are only decoded by `entries` and
+    `dump`. An entry being recorded while the trace is read may appear
+    partially written.
+
+    :param int capacity: Number of entries held.
+    :param int max_bytes: Number of bytes of data kept for each entry, at
+        most 65535.
+    """
+
+    WRITE = 0
+    READ = 1
+
+    _DIRECTIONS = ("write", "read")
+
+    def __init__(self, capacity=4096, max_bytes=64):
+        if capacity < 1:
+            raise ValueError("Trace capacity must be at least 1.")
+        if not 0 <= max_bytes <= 0xFFFF:
+            raise ValueError("Maximum number of bytes kept for each entry "
+                             "must be between 0 and 65535.")
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        # Offset converting `time.perf_counter_ns` values to epoch times.
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+        self._start = [0] * capacity
+        self._end = [0] * capacity
+        self._direction = [0] * capacity
+        self._data = [b""] * capacity
+        self._length = [0] * capacity
+        self._counter = itertools.count()
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def __repr__(self):
+        return "<TraceRecorder {}/{} entries>".format(len(self), self.capacity)
+
+    # METHODS #
+
+    def record(self, direction, data, start_ns, end_ns):
+        """
+        Records a read or a write.
+
+        :param int direction: `TraceRecorder.WRITE` or `TraceRecorder.READ`.
+        :param data: Bytes transferred, as a bytes-like object.
+        :param int start_ns: `time.perf_counter_ns` value at the start of
+            the transfer.
+        :param int end_ns: `time.perf_counter_ns` value at the end of the
+            transfer.
+        """
+        # next() on itertools.count is atomic, so concurrent writers get
+        # distinct slots without a lock.
+        idx = next(self._counter)
+        slot = idx % self.capacity
+        self._start[slot] = start_ns
+        self._end[slot] = end_ns
+        self._direction[slot] = direction
+        self._data[slot] = bytes(data[:self.max_bytes])
+        self._length[slot] = len(data)
+        self._count = idx + 1
+
+    def clear(self):
+        """
+        Drops every entry.
+        """
+        self._counter = itertools.count()
+        self._count = 0
+
+    def entries(self):
+        """
+        Gets the entries held, oldest first.
+
+        :rtype: `list` of `TraceEntry`
+        """
+        count = self._count
+        held = min(count, self.capacity)
+        result = []
+        for idx in range(count - held, count):
+            slot = idx % self.capacity
+            start = self._start[slot]
+            result.append(TraceEntry(
+                start + self._epoch_offset,
+                self._DIRECTIONS[self._direction[slot]],
+                self._data[slot],
+                self._length[slot],
+                self._end[slot] - start
+            ))
+        return result
+
+    def dump(self, file):
+        """
+        Writes the entries held to a compact binary file, which can be read
+        back with `TraceRecorder.load`.
+
+        :param file: Path of the file, or binary file-like object, to write
+            to.
+        """
+        if isinstance(file, str):
+            with open(file, "wb") as fileobj:
+                self.dump(fileobj)
+            return
+        entries = self.entries()
+        file.write(_HEADER.pack(_MAGIC, self._epoch_offset, len(entries),
+                                self.max_bytes))
+        for entry in entries:
+            file.write(_ENTRY.pack(
+                entry.timestamp_ns,
+                entry.duration_ns,
+                self._DIRECTIONS.index(entry.direction),
+                entry.length,
+                len(entry.data)
+            ))
+            file.write(entry.data)
+
+    @classmethod
+    def load(cls, file):
+        """
+        Reads the entries of a file written by `dump`.
+
+        :param file: Path of the file, or binary file-like object, to read
+            from.
+        :rtype: `list` of `TraceEntry`
+        """
+        if isinstance(file, str):
+            with open(file, "rb") as fileobj:
+                return cls.load(fileobj)
+        magic, _, count, _ = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("Not a trace file written by TraceRecorder.")
+        entries = []
+        for _ in range(count):
+            timestamp, duration, direction, length, size = _ENTRY.unpack(
+                file.read(_ENTRY.size)
+            )
+            entries.append(TraceEntry(
+                timestamp, cls._DIRECTIONS[direction], file.read(size), length,
+                duration
+            ))
+        return entries
@@ -82,13 +82,13 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
         finally:
             self._conn.close()
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         raise NotImplementedError
 
     def read(self, size=-1, encoding="utf-8"):
         raise NotImplementedError
 
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write bytes to the raw usb connection object.
 
@@ -114,6 +114,9 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._conn
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
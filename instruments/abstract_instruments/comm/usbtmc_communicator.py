@@ -102,7 +102,7 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         """
         return self._filelike.read(num=size, encoding=encoding)
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the usbtmc connection.
 
@@ -126,7 +126,7 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         """
         self._filelike.write(msg, encoding=encoding)
 
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write bytes to the usbtmc connection.
 
@@ -149,6 +149,9 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._filelike
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -160,6 +163,22 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         """
         self.write(msg)
 
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        """
+        Sends a message made of the bytes of ``header`` followed by binary
+        data. Each write to a usbtmc connection is sent as a complete
+        message, so the block is sent in a single write, ignoring
+        ``chunk_size``.
+
+        :param bytes header: Bytes sent before the data.
+        :param data: Buffer holding the data bytes.
+        :param int chunk_size: Unused.
+        """
+        # pylint: disable=unused-argument
+        msg = bytes(header) + memoryview(data).cast("B").tobytes()
+        with self.lock:
+            self.write_raw(msg)
+
     def _query(self, msg, size=-1):
         """
         This is the implementation of ``query`` for communicating with
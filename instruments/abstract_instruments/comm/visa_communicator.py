@@ -100,7 +100,7 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
         except IOError:
             pass
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the pyVISA connection.
 
@@ -126,7 +126,34 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
                              "-1 for all characters.")
         return msg
 
-    def write_raw(self, msg):
+    def _readinto(self, buf):
+        """
+        Read bytes in from the pyVISA connection directly into a writable
+        buffer.
+
+        The data is requested in pieces of the connection's ``chunk_size``,
+        each copied into ``buf`` as it arrives, so that large transfers
+        never hold more than one chunk in a temporary `bytes` object.
+
+        :param buf: Writable buffer to fill, starting at its first byte.
+        :return: The number of bytes read into ``buf``
+        :rtype: `int`
+        """
+        view = memoryview(buf).cast("B")
+        count = min(len(self._buf), len(view))
+        if count:
+            view[:count] = self._buf[:count]
+            del self._buf[:count]
+        chunk_size = getattr(self._conn, "chunk_size", 20 * 1024)
+        while count < len(view):
+            chunk = self._conn.read_bytes(min(chunk_size, len(view) - count))
+            if not chunk:
+                break
+            view[count:count + len(chunk)] = chunk
+            count += len(chunk)
+        return count
+
+    def _write_raw(self, msg):
         """
         Write bytes to the VISA connection.
 
@@ -150,6 +177,9 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._conn
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -109,7 +109,7 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
         except IOError:
             pass
 
-    def read_raw(self, size=-1):
+    def _read_raw(self, size=-1):
         """
         Read bytes in from the vxi11 connection.
 
@@ -119,7 +119,7 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
         """
         return self._inst.read_raw(num=size)
 
-    def write_raw(self, msg):
+    def _write_raw(self, msg):
         """
         Write bytes to the vxi11 connection.
 
@@ -154,6 +154,9 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _transport(self):
+        return self._inst
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -165,6 +168,22 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
         """
         self.write(msg)
 
+    def write_block(self, header, data, chunk_size=2 ** 20):
+        """
+        Sends a message made of the bytes of ``header`` followed by binary
+        data. Each write to a vxi11 connection is sent as a complete
+        message, so the block is sent in a single write, ignoring
+        ``chunk_size``.
+
+        :param bytes header: Bytes sent before the data.
+        :param data: Buffer holding the data bytes.
+        :param int chunk_size: Unused.
+        """
+        # pylint: disable=unused-argument
+        msg = bytes(header) + memoryview(data).cast("B").tobytes()
+        with self.lock:
+            self.write_raw(msg)
+
     def _query(self, msg, size=-1):
         """
         This is the implementation of ``query`` for communicating with
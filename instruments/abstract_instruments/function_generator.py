@@ -227,7 +227,9 @@ class FunctionGenerator(Instrument, metaclass=abc.ABCMeta):
 
         :rtype: `FunctionGenerator.Channel`
         """
-        return ProxyList(self, self.Channel, range(self._channel_count))
+        return ProxyList(
+            self, self.Channel, range(self._channel_count), cached=True
+        )
 
     # PASSTHROUGH PROPERTIES #
 
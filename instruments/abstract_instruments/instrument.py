@@ -4,6 +4,10 @@
 Provides the base Instrument class for all instruments.
 """
 
+# The open_* constructors for each kind of connection are part of the public
+# interface of Instrument, and are kept along with it.
+# pylint: disable=too-many-lines
+
 # IMPORTS #####################################################################
 
 
@@ -13,19 +17,16 @@ import socket
 import urllib.parse as parse
 
 from serial import SerialException
-from serial.tools.list_ports import comports
 import numpy as np
-import visa
-import usb
-import usb.core
-import usb.util
 
 from instruments.abstract_instruments.comm import (
-    SocketCommunicator, USBCommunicator, VisaCommunicator, FileCommunicator,
+    SocketCommunicator, USBCommunicator, FileCommunicator,
     LoopbackCommunicator, GPIBCommunicator, AbstractCommunicator,
-    USBTMCCommunicator, VXI11Communicator, serial_manager
+    RecordingCommunicator, ReplayCommunicator, serial_manager
 )
 from instruments.errors import AcknowledgementError, PromptError
+from instruments.util_fns import QueryCache, ShadowState, assume_units
+import instruments.units as u
 
 # CONSTANTS ###################################################################
 
@@ -63,11 +64,58 @@ class Instrument:
         self._prompt = None
         self._terminator = "\n"
 
+    _query_cache = None
+    _query_cache_ttl = None
+    _shadow_state = None
+    _raw_units = False
+
     # COMMAND-HANDLING METHODS #
 
     def _ack_expected(self, msg=""):  # pylint: disable=unused-argument,no-self-use
         return None
 
+    def _setting_hint(self, cmd):
+        """
+        Handles the hint of a property setter sending ``cmd``, invalidating
+        the cached query response it makes stale.
+
+        :return: If the shadow state is enabled and holds the setting, a
+            `tuple` of the query reading the setting, and the prefix and
+            conversion function to record it with. Otherwise, `None`.
+        """
+        hint = QueryCache.take_hint("sendcmd")
+        if hint is None:
+            return None
+        _, msg, query_cmd, to_msg = hint
+        if not cmd.endswith(msg):
+            # The command was rewritten in a way we can't follow, so any
+            # setting may have changed.
+            self.invalidate_cache()
+            if self._shadow_state is not None:
+                self._shadow_state.forget()
+            return None
+        prefix = cmd[:len(cmd) - len(msg)]
+        key = prefix + query_cmd
+        self.invalidate_cache(key)
+        if to_msg is None or self._shadow_state is None:
+            return None
+        return key, prefix, to_msg
+
+    def _send_setting(self, cmd, send):
+        """
+        Sends a command with ``send``, unless it was sent by the setter of a
+        property and the shadow state shows the value is already set.
+        """
+        setting = self._setting_hint(cmd)
+        if setting is not None:
+            key, prefix, to_msg = setting
+            if self._shadow_state.get(key) == cmd:
+                return
+            self._shadow_state.forget(key)
+        send(cmd)
+        if setting is not None:
+            self._shadow_state.record(key, cmd, prefix, to_msg)
+
     def sendcmd(self, cmd):
         """
         Sends a command without waiting for a response.
@@ -75,26 +123,30 @@ class Instrument:
         :param str cmd: String containing the command to
             be sent.
         """
-        self._file.sendcmd(str(cmd))
-        ack_expected_list = self._ack_expected(cmd)  # pylint: disable=assignment-from-none
-        if not isinstance(ack_expected_list, (list, tuple)):
-            ack_expected_list = [ack_expected_list]
-        for ack_expected in ack_expected_list:
-            if ack_expected is None:
-                break
-            ack = self.read()
-            if ack != ack_expected:
-                raise AcknowledgementError(
-                    "Incorrect ACK message received: got {} "
-                    "expected {}".format(ack, ack_expected)
-                )
-        if self.prompt is not None:
-            prompt = self.read(len(self.prompt))
-            if prompt != self.prompt:
-                raise PromptError(
-                    "Incorrect prompt message received: got {} "
-                    "expected {}".format(prompt, self.prompt)
-                )
+        self._send_setting(cmd, self._sendcmd)
+
+    def _sendcmd(self, cmd):
+        with self._file.lock:
+            self._file.sendcmd(str(cmd))
+            ack_expected_list = self._ack_expected(cmd)  # pylint: disable=assignment-from-none
+            if not isinstance(ack_expected_list, (list, tuple)):
+                ack_expected_list = [ack_expected_list]
+            for ack_expected in ack_expected_list:
+                if ack_expected is None:
+                    break
+                ack = self.read()
+                if ack != ack_expected:
+                    raise AcknowledgementError(
+                        "Incorrect ACK message received: got {} "
+                        "expected {}".format(ack, ack_expected)
+                    )
+            if self.prompt is not None:
+                prompt = self.read(len(self.prompt))
+                if prompt != self.prompt:
+                    raise PromptError(
+                        "Incorrect prompt message received: got {} "
+                        "expected {}".format(prompt, self.prompt)
+                    )
 
     def query(self, cmd, size=-1):
         """
@@ -108,27 +160,45 @@ class Instrument:
             connected instrument.
         :rtype: `str`
         """
+        hint = QueryCache.take_hint("query")
+        ttl = shadow = None
+        if hint is not None and size == -1:
+            _, cacheable, query_cmd, to_msg = hint
+            if cacheable is not False and self._query_cache_ttl is not None:
+                ttl = self._query_cache_ttl if cacheable is True else cacheable
+                value = self._query_cache.get(cmd)
+                if value is not None:
+                    return value
+            if (to_msg is not None and self._shadow_state is not None and
+                    cmd.endswith(query_cmd)):
+                shadow = (cmd[:len(cmd) - len(query_cmd)], to_msg)
+
         ack_expected_list = self._ack_expected(cmd)  # pylint: disable=assignment-from-none
         if not isinstance(ack_expected_list, (list, tuple)):
             ack_expected_list = [ack_expected_list]
 
-        if ack_expected_list[0] is None:  # Case no ACK
-            value = self._file.query(cmd, size)
-        else:  # Case with ACKs
-            _ = self._file.query(cmd, size=0)  # Send the cmd, don't read
-            for ack_expected in ack_expected_list:  # Read and verify ACKs
-                ack = self.read()
-                if ack != ack_expected:
-                    raise AcknowledgementError(
-                        f"Incorrect ACK message received: got {ack} expected {ack_expected}"
+        with self._file.lock:
+            if ack_expected_list[0] is None:  # Case no ACK
+                value = self._file.query(cmd, size)
+            else:  # Case with ACKs
+                _ = self._file.query(cmd, size=0)  # Send the cmd, don't read
+                for ack_expected in ack_expected_list:  # Read and verify ACKs
+                    ack = self.read()
+                    if ack != ack_expected:
+                        raise AcknowledgementError(
+                            f"Incorrect ACK message received: got {ack} expected {ack_expected}"
+                        )
+                value = self.read(size)  # Now read in our return data
+            if self.prompt is not None:
+                prompt = self.read(len(self.prompt))
+                if prompt != self.prompt:
+                    raise PromptError(
+                        f"Incorrect prompt message received: got {prompt} expected {self.prompt}"
                     )
-            value = self.read(size)  # Now read in our return data
-        if self.prompt is not None:
-            prompt = self.read(len(self.prompt))
-            if prompt != self.prompt:
-                raise PromptError(
-                    f"Incorrect prompt message received: got {prompt} expected {self.prompt}"
-                )
+        if ttl is not None:
+            self._query_cache.put(cmd, value, ttl)
+        if shadow is not None:
+            self._shadow_state.record_response(cmd, value, *shadow)
         return value
 
     def read(self, size=-1, encoding="utf-8"):
@@ -145,6 +215,79 @@ class Instrument:
 
     # PROPERTIES #
 
+    @property
+    def lock(self):
+        """
+        Gets the lock guarding transactions with this instrument. It is
+        shared with every other instrument using the same underlying
+        connection, such as several instruments on one serial port.
+
+        `sendcmd`, `query` and `binblockread` each hold this lock for
+        their whole exchange, so they may safely be called from several
+        threads. To make a sequence of commands atomic, hold the lock in a
+        ``with`` block:
+
+        >>> with inst.lock:
+        ...     inst.sendcmd("DAT:SOU CH1")
+        ...     data = inst.binblockread(2)
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.AbstractCommunicator.lock`
+        """
+        return self._file.lock
+
+    @property
+    def stats(self):
+        """
+        Gets the statistics of the traffic to and from this instrument, or
+        `None` if they are disabled. Enable them with `stats_enabled`:
+
+        >>> inst.stats_enabled = True
+        >>> inst.query("*IDN?")
+        >>> inst.stats.query.mean_ns
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.CommStats`
+
+        :type: `~instruments.abstract_instruments.comm.CommStats` or `None`
+        """
+        return self._file.stats
+
+    @property
+    def stats_enabled(self):
+        """
+        Gets/sets whether statistics of the traffic to and from this
+        instrument are collected in `stats`.
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.AbstractCommunicator.stats_enabled`
+
+        :type: `bool`
+        """
+        return self._file.stats_enabled
+
+    @stats_enabled.setter
+    def stats_enabled(self, newval):
+        self._file.stats_enabled = newval
+
+    @property
+    def tracer(self):
+        """
+        Gets/sets the recorder of the raw traffic to and from this
+        instrument, or `None` to record nothing.
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.AbstractCommunicator.tracer`
+
+        :type: `~instruments.abstract_instruments.comm.TraceRecorder` or
+            `None`
+        """
+        return self._file.tracer
+
+    @tracer.setter
+    def tracer(self, newval):
+        self._file.tracer = newval
+
     @property
     def timeout(self):
         """
@@ -218,8 +361,139 @@ class Instrument:
     def prompt(self, newval):
         self._prompt = newval
 
+    @property
+    def query_cache_ttl(self):
+        """
+        Gets/sets the time for which responses to the queries of cacheable
+        properties are cached, or `None` if the query cache is disabled. The
+        query cache is disabled by default.
+
+        Properties created by the factories of `instruments.util_fns` are
+        cacheable if declared with the ``cacheable=`` argument, which may
+        also give them their own time to live. Within the time to live, the
+        getter of a cacheable property returns the last response of the
+        instrument without querying it again. Setting the property, or
+        calling `invalidate_cache`, discards the cached response.
+
+        .. warning::
+
+            Cached values may be stale if settings are changed on the local
+            panel of the instrument, by other software, or by commands other
+            than the setters of the cached properties.
+
+        :type: `~quantities.Quantity` or `None`
+        :units: As specified or assumed to be of units ``seconds``
+        """
+        if self._query_cache_ttl is None:
+            return None
+        return self._query_cache_ttl * u.second
+
+    @query_cache_ttl.setter
+    def query_cache_ttl(self, newval):
+        if newval is None:
+            self._query_cache_ttl = None
+            self.invalidate_cache()
+            return
+        newval = float(assume_units(newval, u.second).rescale(u.second).magnitude)
+        if newval < 0:
+            raise ValueError("Query cache time to live must not be negative.")
+        if self._query_cache is None:
+            self._query_cache = QueryCache()
+        self._query_cache_ttl = newval
+
+    @property
+    def shadow_state(self):
+        """
+        Gets/sets whether the shadow state is enabled. It is disabled by
+        default.
+
+        With the shadow state enabled, the last value written to or read
+        from each property created by `~instruments.util_fns.bool_property`,
+        `~instruments.util_fns.enum_property`,
+        `~instruments.util_fns.int_property` or
+        `~instruments.util_fns.unitful_property` is remembered, and setting
+        such a property to the value it already has sends nothing to the
+        instrument. Call `resync` after the settings of the instrument were
+        changed by other means, such as its front panel or a reset.
+
+        :type: `bool`
+        """
+        return self._shadow_state is not None
+
+    @shadow_state.setter
+    def shadow_state(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Shadow state must be enabled or disabled with "
+                            "a boolean value.")
+        if not newval:
+            self._shadow_state = None
+        elif self._shadow_state is None:
+            self._shadow_state = ShadowState()
+
+    @property
+    def raw_units(self):
+        """
+        Gets/sets whether the raw units mode is enabled. It is disabled by
+        default.
+
+        In raw units mode, properties created by
+        `~instruments.util_fns.unitful_property` and methods such as
+        `~instruments.generic_scpi.SCPIMultimeter.measure` return bare
+        `float` values, or `numpy.ndarray` of floats, instead of
+        `~quantities.Quantity` objects, saving their construction when
+        polling the instrument in a tight loop. Values are then in the units
+        documented for each property or method, which for properties are
+        also held by the ``units`` attribute of the property:
+
+        >>> inst.raw_units = True  # doctest: +SKIP
+        >>> type(inst).voltage.units  # doctest: +SKIP
+        array(1.0) * V
+        >>> inst.voltage  # doctest: +SKIP
+        1.5
+
+        Values set are still accepted as `~quantities.Quantity` objects.
+        This mode applies to the properties of the instrument itself, and to
+        those of its channels which hold the instrument in their ``_parent``
+        attribute, as most channels do. Use `~instruments.util_fns.raw_units`
+        to cover every channel, or to override this mode within a block.
+
+        :type: `bool`
+        """
+        return self._raw_units
+
+    @raw_units.setter
+    def raw_units(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Raw units mode must be enabled or disabled "
+                            "with a boolean value.")
+        self._raw_units = newval
+
     # BASIC I/O METHODS #
 
+    def resync(self):
+        """
+        Discards the query cache, and reads again every setting held in the
+        shadow state, for use once the settings of the instrument were
+        changed other than through its properties, such as on its front
+        panel or by ``*RST``.
+        """
+        self.invalidate_cache()
+        if self._shadow_state is None:
+            return
+        for key, prefix, to_msg in self._shadow_state.settings():
+            response = Instrument.query(self, key)
+            self._shadow_state.record_response(key, response, prefix, to_msg)
+
+    def invalidate_cache(self, cmd=None):
+        """
+        Discards the responses held in the query cache.
+
+        :param str cmd: Query whose response is discarded, such as
+            ``"CONF?"``, or `None` to clear the whole cache.
+        """
+        if self._query_cache is not None:
+            self._query_cache.invalidate(cmd)
+
     def write(self, msg):
         """
         Write data string to the connected instrument. This will call
@@ -236,7 +510,7 @@ class Instrument:
         """
         self._file.write(msg)
 
-    def binblockread(self, data_width, fmt=None):
+    def binblockread(self, data_width, fmt=None, out=None):
         """"
         Read a binary data block from attached instrument.
         This requires that the instrument respond in a particular manner
@@ -245,6 +519,14 @@ class Instrument:
         The format is as follows:
         #{number of following digits:1-9}{num of bytes to be read}{data bytes}
 
+        The data bytes are read directly into a preallocated buffer, without
+        intermediate copies. Passing the same ``out`` buffer to repeated
+        calls avoids allocating a new array for each acquisition, and
+        passing a `numpy.memmap` writes the block straight to disk.
+
+        .. seealso:: `binblockread_iter` and `binblockread_to_file` to read
+            long records in bounded memory.
+
         :param int data_width: Specify the number of bytes wide each data
             point is. One of [1,2,4].
 
@@ -252,6 +534,142 @@ class Instrument:
             or `None` to choose a format automatically based on the data
             width. Typically you can just specify `data_width` and leave this
             default.
+
+        :param out: Writable, contiguous buffer such as a `numpy.ndarray`,
+            `numpy.memmap`, `bytearray` or `memoryview` to read the data
+            bytes into, or `None` to allocate a new array. Must hold at least
+            as many bytes as the binary block.
+
+        :return: The data points. If ``out`` is given, the returned array
+            shares its memory.
+        :rtype: `numpy.ndarray`
+        """
+        with self._file.lock:
+            num_of_bytes = self._read_binblock_header()
+
+            # Make or use the required format string.
+            if fmt is None:
+                fmt = _DEFAULT_FORMATS[data_width]
+
+            if out is None:
+                out = np.empty(num_of_bytes, dtype=np.uint8)
+            view = memoryview(out).cast("B")
+            if len(view) < num_of_bytes:
+                raise ValueError("Output buffer holds {} bytes, but the "
+                                 "binary block contains {} "
+                                 "bytes.".format(len(view), num_of_bytes))
+            view = view[:num_of_bytes]
+
+            # Read in the data bytes, and pass them to numpy using the specified
+            # data type (format).
+            self._read_binblock_data(view)
+            return np.frombuffer(view, dtype=fmt)
+
+    def binblockread_iter(self, data_width, fmt=None, chunk_size=2 ** 16):
+        """
+        Read a binary data block from attached instrument, as with
+        `binblockread`, yielding the data points in chunks as they arrive.
+        Long records can thus be processed in bounded memory, overlapping
+        the transfer with downstream processing.
+
+        The connection is locked until the generator is exhausted or
+        closed, so it should be consumed promptly by the thread that
+        created it.
+
+        :param int data_width: Specify the number of bytes wide each data
+            point is. One of [1,2,4].
+        :param str fmt: Format string as specified by the :mod:`struct` module,
+            or `None` to choose a format automatically based on the data
+            width.
+        :param int chunk_size: Number of data points in each chunk. The last
+            chunk may be shorter.
+
+        :return: Generator of `numpy.ndarray` chunks of the data points.
+        """
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+        chunk_bytes = chunk_size * np.dtype(fmt).itemsize
+        if chunk_bytes < 1:
+            raise ValueError("Chunk size must be at least 1.")
+
+        with self._file.lock:
+            remaining = self._read_binblock_header()
+            while remaining > 0:
+                chunk = np.empty(min(chunk_bytes, remaining), dtype=np.uint8)
+                self._read_binblock_data(memoryview(chunk))
+                remaining -= len(chunk)
+                yield np.frombuffer(chunk, dtype=fmt)
+
+    def binblockread_to_file(self, fileobj, chunk_size=2 ** 20):
+        """
+        Read a binary data block from attached instrument, as with
+        `binblockread`, writing the data bytes to an open binary file as
+        they arrive. A single buffer of ``chunk_size`` bytes is reused for
+        the whole transfer.
+
+        :param fileobj: File-like object opened for writing in binary mode.
+        :param int chunk_size: Number of bytes read from the instrument
+            before each write to ``fileobj``.
+
+        :return: The number of data bytes written.
+        :rtype: `int`
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        with self._file.lock:
+            num_of_bytes = self._read_binblock_header()
+            buf = memoryview(bytearray(min(chunk_size, num_of_bytes)))
+            remaining = num_of_bytes
+            while remaining > 0:
+                view = buf[:min(len(buf), remaining)]
+                self._read_binblock_data(view)
+                fileobj.write(view)
+                remaining -= len(view)
+            return num_of_bytes
+
+    def binblockwrite(self, cmd, data, fmt=None, chunk_size=2 ** 20):
+        """
+        Write a binary data block to attached instrument, as an IEEE-488.2
+        definite length block following the command ``cmd``:
+
+        {cmd}#{number of following digits:1-9}{num of bytes}{data bytes}
+
+        The data bytes are sent straight from the buffer of ``data`` in
+        chunks of ``chunk_size`` bytes, without being copied or converted to
+        a string, followed by the termination character. The message is sent
+        by the communicator's
+        `~instruments.abstract_instruments.comm.AbstractCommunicator.write_block`,
+        which handles addressing and escaping where the connection needs it,
+        such as for GPIB adapters.
+
+        >>> inst.binblockwrite("CURVE ", waveform, fmt="<u2")
+
+        :param str cmd: Command preceding the block, including any separator
+            between the command and the block.
+        :param data: Data points to send.
+        :type data: `numpy.ndarray` or array-like
+        :param str fmt: Format string as specified by the :mod:`struct`
+            module, such as ``">h"``, giving the data type and byte order of
+            the data points sent, or `None` to send ``data`` as it is. The
+            data is only converted if its type differs.
+        :param int chunk_size: Number of bytes sent by each write to the
+            connection.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        data = np.ascontiguousarray(data, dtype=fmt)
+        view = memoryview(data).cast("B")
+        size = str(len(view))
+        header = "{}#{}{}".format(cmd, len(size), size)
+
+        self._file.write_block(header.encode("utf-8"), view, chunk_size)
+
+    def _read_binblock_header(self):
+        """
+        Reads the header of a binary data block, returning the number of data
+        bytes that follow it.
+
+        :rtype: `int`
         """
         # This needs to be a # symbol for valid binary block
         symbol = self._file.read_raw(1)
@@ -259,33 +677,158 @@ class Instrument:
             raise IOError("Not a valid binary block start. Binary blocks "
                           "require the first character to be #, instead got "
                           "{}".format(symbol))
-        else:
-            # Read in the num of digits for next part
-            digits = int(self._file.read_raw(1))
+        # Read in the num of digits for next part
+        digits = int(self._file.read_raw(1))
 
-            # Read in the num of bytes to be read
-            num_of_bytes = int(self._file.read_raw(digits))
+        # Read in the num of bytes to be read
+        return int(self._file.read_raw(digits))
 
-            # Make or use the required format string.
-            if fmt is None:
-                fmt = _DEFAULT_FORMATS[data_width]
+    def _read_binblock_data(self, view):
+        """
+        Fills a byte `memoryview` with data bytes of a binary data block.
 
-            # Read in the data bytes, and pass them to numpy using the specified
-            # data type (format).
-            # This is looped in case a communication timeout occurs midway
-            # through transfer and multiple reads are required
-            tries = 3
-            data = self._file.read_raw(num_of_bytes)
-            while len(data) < num_of_bytes:
-                old_len = len(data)
-                data += self._file.read_raw(num_of_bytes - old_len)
-                if old_len == len(data):
-                    tries -= 1
-                if tries == 0:
-                    raise IOError("Did not read in the required number of bytes"
-                                  "during binblock read. Got {}, expected "
-                                  "{}".format(len(data), num_of_bytes))
-            return np.frombuffer(data, dtype=fmt)
+        :param memoryview view: Buffer to fill.
+        """
+        # This is looped in case a communication timeout occurs midway
+        # through transfer and multiple reads are required
+        tries = 3
+        count = self._file.readinto(view)
+        while count < len(view):
+            old_count = count
+            count += self._file.readinto(view[count:])
+            if old_count == count:
+                tries -= 1
+            if tries == 0:
+                raise IOError("Did not read in the required number of bytes"
+                              "during binblock read. Got {}, expected "
+                              "{}".format(count, len(view)))
+
+    # ASYNC I/O METHODS #
+
+    async def sendcmd_async(self, cmd):
+        """
+        Coroutine version of `sendcmd`, for instruments opened with
+        `open_tcpip_async`. The shadow state is not consulted.
+
+        :param str cmd: String containing the command to
+            be sent.
+        """
+        async with self._file.transaction():
+            await self._file.sendcmd_async(str(cmd))
+            await self._read_acks_async(cmd)
+            await self._read_prompt_async()
+
+    async def query_async(self, cmd, size=-1):
+        """
+        Coroutine version of `query`, for instruments opened with
+        `open_tcpip_async`. Queries to several instruments can be run
+        concurrently with `asyncio.gather`. The query cache and shadow state
+        are not consulted.
+
+        :param str cmd: String containing the query to
+            execute.
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the query as returned by the
+            connected instrument.
+        :rtype: `str`
+        """
+        async with self._file.transaction():
+            if self._ack_expected(cmd) is None:  # pylint: disable=assignment-from-none
+                value = await self._file.query_async(cmd, size)
+            else:
+                await self._file.sendcmd_async(cmd)
+                await self._read_acks_async(cmd)
+                value = await self._file.read_async(size)
+            await self._read_prompt_async()
+        return value
+
+    async def read_async(self, size=-1, encoding="utf-8"):
+        """
+        Coroutine version of `read`, for instruments opened with
+        `open_tcpip_async`.
+
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :rtype: `str`
+        """
+        return await self._file.read_async(size, encoding)
+
+    async def binblockread_async(self, data_width, fmt=None):
+        """
+        Coroutine version of `binblockread`, for instruments opened with
+        `open_tcpip_async`.
+
+        :param int data_width: Specify the number of bytes wide each data
+            point is. One of [1,2,4].
+        :param str fmt: Format string as specified by the :mod:`struct` module,
+            or `None` to choose a format automatically based on the data
+            width.
+        :rtype: `numpy.ndarray`
+        """
+        async with self._file.transaction():
+            symbol = await self._file.read_raw_async(1)
+            if symbol != b"#":
+                raise IOError("Not a valid binary block start. Binary blocks "
+                              "require the first character to be #, instead "
+                              "got {}".format(symbol))
+            digits = int(await self._file.read_raw_async(1))
+            num_of_bytes = int(await self._file.read_raw_async(digits))
+            data = await self._file.read_raw_async(num_of_bytes)
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+        return np.frombuffer(data, dtype=fmt)
+
+    async def _read_acks_async(self, cmd):
+        ack_expected_list = self._ack_expected(cmd)  # pylint: disable=assignment-from-none
+        if not isinstance(ack_expected_list, (list, tuple)):
+            ack_expected_list = [ack_expected_list]
+        for ack_expected in ack_expected_list:
+            if ack_expected is None:
+                break
+            ack = await self._file.read_async()
+            if ack != ack_expected:
+                raise AcknowledgementError(
+                    "Incorrect ACK message received: got {} "
+                    "expected {}".format(ack, ack_expected)
+                )
+
+    async def _read_prompt_async(self):
+        if self.prompt is not None:
+            prompt = await self._file.read_async(len(self.prompt))
+            if prompt != self.prompt:
+                raise PromptError(
+                    "Incorrect prompt message received: got {} "
+                    "expected {}".format(prompt, self.prompt)
+                )
+
+    def start_recording(self):
+        """
+        Starts recording the traffic to and from the instrument, such that
+        the session can be served back by `open_replay`.
+
+        :return: The communicator holding the recording.
+        :rtype: `~instruments.abstract_instruments.comm.RecordingCommunicator`
+        """
+        if isinstance(self._file, RecordingCommunicator):
+            raise RuntimeError("Instrument is already being recorded.")
+        self._file = RecordingCommunicator(self._file)
+        return self._file
+
+    def stop_recording(self):
+        """
+        Stops recording the traffic to and from the instrument.
+
+        :return: The communicator holding the recording, whose
+            `~instruments.abstract_instruments.comm.RecordingCommunicator.save`
+            method writes it to a file.
+        :rtype: `~instruments.abstract_instruments.comm.RecordingCommunicator`
+        """
+        if not isinstance(self._file, RecordingCommunicator):
+            raise RuntimeError("Instrument is not being recorded.")
+        recording = self._file
+        self._file = recording.comm
+        return recording
 
     # CLASS METHODS #
 
@@ -422,6 +965,45 @@ class Instrument:
         conn.connect((host, port))
         return cls(SocketCommunicator(conn))
 
+    @classmethod
+    async def open_tcpip_async(cls, host, port, timeout=None):
+        """
+        Coroutine opening an instrument, connecting via TCP/IP to a given
+        host and TCP port with `asyncio.open_connection`.
+
+        The returned instrument uses an `AsyncSocketCommunicator`, and is
+        used through coroutines such as `query_async`, or through
+        `~instruments.util_fns.async_getattr` for its properties. Drivers
+        which communicate with the instrument when initialized can't be
+        opened this way.
+
+        >>> async def main():
+        ...     insts = await asyncio.gather(*(
+        ...         ik.generic_scpi.SCPIInstrument.open_tcpip_async(host, 5025)
+        ...         for host in hosts
+        ...     ))
+        ...     return await asyncio.gather(*(
+        ...         inst.query_async("*IDN?") for inst in insts
+        ...     ))
+
+        :param str host: Name or IP address of the instrument.
+        :param int port: TCP port on which the insturment is listening.
+        :param float timeout: Timeout for each read, in seconds, or `None`
+            to wait indefinitely.
+
+        :rtype: `Instrument`
+        :return: Object representing the connected instrument.
+        """
+        # Imported here, such that asyncio is only loaded when needed.
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+        from instruments.abstract_instruments.comm import (
+            AsyncSocketCommunicator
+        )
+
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(AsyncSocketCommunicator(reader, writer, timeout))
+
     # pylint: disable=too-many-arguments
     @classmethod
     def open_serial(cls, port=None, baud=9600, vid=None, pid=None,
@@ -469,6 +1051,10 @@ class Instrument:
                              "a serial connection via a USB VID/PID pair.")
 
         if port is None:
+            # Imported here, as listing ports is rarely needed.
+            # pylint: disable=import-outside-toplevel
+            from serial.tools.list_ports import comports
+
             match_count = 0
             for _port in comports():
                 # If no match on vid/pid, go to next comport
@@ -509,7 +1095,8 @@ class Instrument:
         return cls(ser)
 
     @classmethod
-    def open_gpibusb(cls, port, gpib_address, timeout=3, write_timeout=3, model="gi"):
+    def open_gpibusb(cls, port, gpib_address, timeout=3, write_timeout=3,
+                     model="gi", auto_read=False):
         """
         Opens an instrument, connecting via a
         `Galvant Industries GPIB-USB adapter`_.
@@ -526,6 +1113,9 @@ class Instrument:
             instrument before timing out.
         :param str model: The brand of adapter to be connected to. Currently supported
             is "gi" for Galvant Industries, and "pl" for Prologix LLC.
+        :param bool auto_read: Use the ``++auto`` read-after-write mode of
+            Prologix adapters for queries. See
+            `~instruments.abstract_instruments.comm.GPIBCommunicator.auto_read`.
 
         :rtype: `Instrument`
         :return: Object representing the connected instrument.
@@ -541,10 +1131,11 @@ class Instrument:
             timeout=timeout,
             write_timeout=write_timeout
         )
-        return cls(GPIBCommunicator(ser, gpib_address, model))
+        return cls(GPIBCommunicator(ser, gpib_address, model, auto_read))
 
     @classmethod
-    def open_gpibethernet(cls, host, port, gpib_address, model="pl"):
+    def open_gpibethernet(cls, host, port, gpib_address, model="pl",
+                          auto_read=False):
         """
         Opens an instrument, connecting via a Prologix GPIBETHERNET adapter.
 
@@ -554,13 +1145,15 @@ class Instrument:
             the instrument.
         :param str model: The brand of adapter to be connected to. Currently supported
             is "gi" for Galvant Industries, and "pl" for Prologix LLC.
+        :param bool auto_read: Use the ``++auto`` read-after-write mode of
+            Prologix adapters for queries.
 
         .. warning:: This function has been setup for use with the Prologix
             GPIBETHERNET adapter but has not been tested as confirmed working.
         """
         conn = socket.socket()
         conn.connect((host, port))
-        return cls(GPIBCommunicator(conn, gpib_address, model))
+        return cls(GPIBCommunicator(conn, gpib_address, model, auto_read))
 
     @classmethod
     def open_visa(cls, resource_name):
@@ -581,9 +1174,17 @@ class Instrument:
 
         .. _PyVISA: http://pyvisa.sourceforge.net/
         """
+        # Imported here, as PyVISA is slow to import.
+        # pylint: disable=import-outside-toplevel
+        try:
+            import visa
+        except ImportError:
+            visa = None
         if visa is None:
             raise ImportError("PyVISA is required for loading VISA "
                               "instruments.")
+        from instruments.abstract_instruments.comm import VisaCommunicator
+
         version = list(map(int, visa.__version__.split(".")))
         while len(version) < 3:
             version += [0]
@@ -612,6 +1213,28 @@ class Instrument:
         """
         return cls(LoopbackCommunicator(stdin, stdout))
 
+    @classmethod
+    def open_replay(cls, recording, realtime=False, strict=True):
+        """
+        Opens an instrument serving back a session recorded with
+        `start_recording`, without requiring the instrument. This is useful
+        to benchmark changes to a driver against real traffic.
+
+        :param recording: Path of the file written by
+            `~instruments.abstract_instruments.comm.RecordingCommunicator.save`,
+            binary file-like object, or
+            `~instruments.abstract_instruments.comm.RecordingCommunicator`.
+        :param bool realtime: If `True`, each exchange takes as long as when
+            it was recorded.
+        :param bool strict: If `True`, the driver must send exactly the
+            recorded traffic.
+        :return: Object representing the replayed instrument
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.ReplayCommunicator`
+        """
+        return cls(ReplayCommunicator(recording, realtime, strict))
+
     @classmethod
     def open_usbtmc(cls, *args, **kwargs):
         """
@@ -627,6 +1250,9 @@ class Instrument:
 
         :return: Object representing the connected instrument
         """
+        # Imported here, such that usbtmc is only loaded when needed.
+        # pylint: disable=import-outside-toplevel
+        from instruments.abstract_instruments.comm import USBTMCCommunicator
         usbtmc_comm = USBTMCCommunicator(*args, **kwargs)
         return cls(usbtmc_comm)
 
@@ -642,6 +1268,9 @@ class Instrument:
 
         .. _python-vxi11: https://github.com/python-ivi/python-vxi11
         """
+        # Imported here, such that vxi11 is only loaded when needed.
+        # pylint: disable=import-outside-toplevel
+        from instruments.abstract_instruments.comm import VXI11Communicator
         vxi11_comm = VXI11Communicator(*args, **kwargs)
         return cls(vxi11_comm)
 
@@ -667,7 +1296,14 @@ class Instrument:
         :rtype: `Instrument`
         :return: Object representing the connected instrument.
         """
-        # pylint: disable=no-member
+        # Imported here, such that PyUSB is only loaded when needed.
+        # pylint: disable=no-member,import-outside-toplevel
+        try:
+            import usb
+            import usb.core
+            import usb.util
+        except ImportError:
+            usb = None
         if usb is None:
             raise ImportError("USB support not imported. Do you have PyUSB "
                               "version 1.0 or later?")
@@ -8,6 +8,7 @@ Provides support for the Agilent 34410a digital multimeter.
 
 from instruments.generic_scpi import SCPIMultimeter
 import instruments.units as u
+from instruments.util_fns import parse_ascii_array, with_units
 
 # CLASSES #####################################################################
 
@@ -78,7 +79,8 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
 
         :param int count: Number of samples to take.
 
-        :rtype: `~quantities.quantity.Quantity` with `numpy.array`
+        :rtype: `~quantities.quantity.Quantity` with `numpy.array`, or
+            `numpy.array` in raw units mode
         """
         mode = self.mode
         units = UNITS[mode]
@@ -91,7 +93,7 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         self.sendcmd('FORM:DATA REAL,64')
         self.sendcmd(msg)
         data = self.binblockread(8, fmt=">d")
-        return data * units
+        return with_units(self, data, units)
 
     # DATA READING METHODS #
 
@@ -107,10 +109,12 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         recommended to transfer a large number of
         data points using this method.
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `list` of `~quantities.quantity.Quantity` elements, or
+            `numpy.array` in raw units mode
         """
         units = UNITS[self.mode]
-        return list(map(float, self.query('FETC?').split(','))) * units
+        data = parse_ascii_array(self.query('FETC?'))
+        return with_units(self, data, units)
 
     def read_data(self, sample_count):
         """
@@ -123,7 +127,8 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             output buffer. If set to -1, all points in memory will be
             transfered.
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `list` of `~quantities.quantity.Quantity` elements, or
+            `numpy.array` in raw units mode
         """
         if not isinstance(sample_count, int):
             raise TypeError('Parameter "sample_count" must be an integer.')
@@ -132,18 +137,21 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             sample_count = self.data_point_count
         units = UNITS[self.mode]
         self.sendcmd('FORM:DATA ASC')
-        data = self.query('DATA:REM? {}'.format(sample_count)).split(',')
-        return list(map(float, data)) * units
+        data = parse_ascii_array(
+            self.query('DATA:REM? {}'.format(sample_count))
+        )
+        return with_units(self, data, units)
 
     def read_data_nvmem(self):
         """
         Returns all readings in non-volatile memory (NVMEM).
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `list` of `~quantities.quantity.Quantity` elements, or
+            `numpy.array` in raw units mode
         """
         units = UNITS[self.mode]
-        data = list(map(float, self.query('DATA:DATA? NVMEM').split(',')))
-        return data * units
+        data = parse_ascii_array(self.query('DATA:DATA? NVMEM'))
+        return with_units(self, data, units)
 
     def read_last_data(self):
         """
@@ -179,11 +187,11 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         This is similar to calling `~Agilent34410a.init` and then immediately
         following `~Agilent34410a.fetch`.
 
-        :rtype: `~quantities.Quantity`
+        :rtype: `~quantities.Quantity`, or `float` in raw units mode
         """
         mode = self.mode
         units = UNITS[mode]
-        return float(self.query('READ?')) * units
+        return with_units(self, float(self.query('READ?')), units)
 
 # UNITS #######################################################################
 
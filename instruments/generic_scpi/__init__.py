@@ -5,6 +5,7 @@ Module containing generic SCPI instruments
 """
 
 
+from .scpi_batch import SCPIBatch, BatchResult
 from .scpi_instrument import SCPIInstrument
 from .scpi_multimeter import SCPIMultimeter
 from .scpi_function_generator import SCPIFunctionGenerator
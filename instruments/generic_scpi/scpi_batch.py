@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides batching of SCPI commands and queries into compound messages
+"""
+
+# IMPORTS #####################################################################
+
+
+import threading
+
+from instruments.abstract_instruments import Instrument
+
+# CLASSES #####################################################################
+
+
+class _DeferredQuery(BaseException):
+
+    """
+    Raised by `SCPIBatch` to interrupt a property getter at its first query,
+    once that query has been queued. Derives from `BaseException` so that it
+    is not swallowed by getters catching `Exception`.
+    """
+
+
+class BatchResult:
+
+    """
+    Deferred result of a query queued in an `SCPIBatch`. The result is
+    available from `value` once the batch has been sent.
+    """
+
+    __slots__ = ("_batch", "_done", "_value", "_error")
+
+    def __init__(self, batch):
+        self._batch = batch
+        self._done = False
+        self._value = None
+        self._error = None
+
+    def __repr__(self):
+        if not self._done:
+            return "<BatchResult pending>"
+        return "<BatchResult {!r}>".format(self._value)
+
+    @property
+    def done(self):
+        """
+        Gets whether the result has been received from the instrument.
+
+        :type: `bool`
+        """
+        return self._done
+
+    @property
+    def value(self):
+        """
+        Gets the result of the query. If the batch holding the query has not
+        been sent yet, it is sent first.
+        """
+        if not self._done:
+            self._batch.flush()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _set(self, value=None, error=None):
+        self._value = value
+        self._error = error
+        self._done = True
+
+
+class SCPIBatch:
+
+    """
+    Queues the commands and queries sent to an `SCPIInstrument` and sends
+    them as compound SCPI messages, which saves a round trip to the
+    instrument for each command. Batches are created by
+    `SCPIInstrument.batch`, for use as a ``with`` block:
+
+    >>> with inst.batch() as batch:
+    ...     inst.display_brightness = 0.5
+    ...     inst.display_contrast = 0.8
+    ...     name = batch.query("*IDN?")
+    ...     contrast = batch.get(inst, "display_contrast")
+    >>> print(name.value, contrast.value)
+
+    Within the block, commands sent by the thread that opened it, including
+    those sent by property setters, are queued. Queries queued with `query`
+    and property reads queued with `get` return a `BatchResult`. Any other
+    query, such as a property read through normal attribute access, first
+    sends the commands queued so far, then runs immediately.
+
+    Queued messages are joined with ``;``, prefixing each command but
+    common (``*``) commands with ``:`` so that it is interpreted from the
+    root of the command tree. The combined response to the queries of a
+    message is split at ``;`` characters outside of quoted strings.
+
+    The queue is sent when the ``with`` block exits, when `flush` is
+    called, or when the value of a pending `BatchResult` is read. If the
+    block exits with an exception, queued messages are discarded.
+
+    :param inst: Instrument the messages are sent to.
+    :type inst: `SCPIInstrument`
+    :param int max_length: Maximum length, in characters, of each compound
+        message. Commands longer than this are sent on their own.
+    """
+
+    def __init__(self, inst, max_length=256):
+        if max_length < 1:
+            raise ValueError("Maximum message length must be at least 1.")
+        self.max_length = max_length
+        self._inst = inst
+        self._owner = threading.get_ident()
+        self._depth = 0
+        self._pending = []
+        self._getters = []
+        self._recording = None
+        self._replay = None
+
+    def __enter__(self):
+        if self._depth == 0:
+            self._inst._batch = self  # pylint: disable=protected-access
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._depth == 1:
+                if exc_type is None:
+                    self.flush()
+                else:
+                    self._discard()
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._inst._batch = None  # pylint: disable=protected-access
+
+    # PROPERTIES #
+
+    @property
+    def active(self):
+        """
+        Gets whether the calling thread is the one queuing messages in this
+        batch.
+
+        :type: `bool`
+        """
+        return self._depth > 0 and self._owner == threading.get_ident()
+
+    # METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Queues a command.
+
+        :param str cmd: Command to send.
+        """
+        if self._replay is not None:
+            # Commands of a getter being replayed were already sent when the
+            # getter was queued.
+            if self._replay and self._replay[0][0] == "sendcmd":
+                self._replay.pop(0)
+                return
+            Instrument.sendcmd(self._inst, cmd)
+            return
+        if self._recording is not None:
+            self._recording.append(("sendcmd", cmd))
+        self._pending.append((str(cmd), None))
+
+    def query(self, cmd):
+        """
+        Queues a query.
+
+        :param str cmd: Query to send.
+        :return: Deferred result of the query.
+        :rtype: `BatchResult`
+        """
+        result = BatchResult(self)
+        self._pending.append((str(cmd), result))
+        return result
+
+    def get(self, obj, name):
+        """
+        Queues the read of a property, such as those created by the property
+        factories of `instruments.util_fns`.
+
+        The getter of the property is run until its first query, which is
+        queued. Once the response has been received, the getter is run again
+        to parse it, with any further query made immediately.
+
+        :param obj: Instrument, or object such as a channel that sends its
+            messages through the instrument, to read the property of.
+        :param str name: Name of the property.
+        :return: Deferred value of the property.
+        :rtype: `BatchResult`
+        """
+        result = BatchResult(self)
+        self._recording = []
+        try:
+            value = getattr(obj, name)
+        except _DeferredQuery:
+            self._getters.append((result, obj, name, self._recording))
+        except Exception as e:  # pylint: disable=broad-except
+            result._set(error=e)  # pylint: disable=protected-access
+        else:
+            result._set(value)  # pylint: disable=protected-access
+        finally:
+            self._recording = None
+        return result
+
+    def flush(self):
+        """
+        Sends the queued commands and queries, and resolves the results of
+        the queued queries and property reads.
+        """
+        pending, self._pending = self._pending, []
+        getters, self._getters = self._getters, []
+
+        try:
+            message, results = [], []
+            for cmd, result in pending:
+                joined = _join_commands(message + [cmd])
+                if message and len(joined) > self.max_length:
+                    self._send(message, results)
+                    message, results = [], []
+                message.append(cmd)
+                if result is not None:
+                    results.append(result)
+            if message:
+                self._send(message, results)
+        except Exception as e:
+            self._forget_shadow_state()
+            for _, result in pending:
+                if result is not None and not result.done:
+                    result._set(error=e)  # pylint: disable=protected-access
+            for result, _, _, _ in getters:
+                result._set(error=e)  # pylint: disable=protected-access
+            raise
+
+        for result, obj, name, recording in getters:
+            self._replay = recording
+            try:
+                value = getattr(obj, name)
+            except Exception as e:  # pylint: disable=broad-except
+                result._set(error=e)  # pylint: disable=protected-access
+            else:
+                result._set(value)  # pylint: disable=protected-access
+            finally:
+                self._replay = None
+
+    def _discard(self):
+        """
+        Drops the queued messages, setting an error as the result of any
+        queued query.
+        """
+        self._forget_shadow_state()
+        error = RuntimeError("Batch was discarded before being sent.")
+        for _, result in self._pending:
+            if result is not None:
+                result._set(error=error)  # pylint: disable=protected-access
+        for result, _, _, _ in self._getters:
+            result._set(error=error)  # pylint: disable=protected-access
+        self._pending = []
+        self._getters = []
+
+    def _forget_shadow_state(self):
+        """
+        Clears the shadow state of the instrument, which may hold settings
+        queued but never applied.
+        """
+        shadow = self._inst._shadow_state  # pylint: disable=protected-access
+        if shadow is not None:
+            shadow.forget()
+
+    def _instrument_query(self, cmd, size=-1):
+        """
+        Handles a query made through `SCPIInstrument.query` while the batch
+        is active.
+        """
+        if self._replay is not None:
+            if self._replay and self._replay[0][0] == "query":
+                return self._replay.pop(0)[1].value
+            return Instrument.query(self._inst, cmd, size)
+        if self._recording is not None and size == -1:
+            result = self.query(cmd)
+            self._recording.append(("query", result))
+            raise _DeferredQuery
+        self.flush()
+        return Instrument.query(self._inst, cmd, size)
+
+    def _send(self, message, results):
+        """
+        Sends one compound message, and sets the results of its queries.
+        """
+        msg = _join_commands(message)
+        if not results:
+            Instrument.sendcmd(self._inst, msg)
+            return
+        responses = _split_response(Instrument.query(self._inst, msg))
+        if len(responses) != len(results):
+            raise IOError("Expected {} responses to compound message {}, "
+                          "got {}.".format(len(results), msg, len(responses)))
+        for result, response in zip(results, responses):
+            result._set(response)  # pylint: disable=protected-access
+
+# FUNCTIONS ###################################################################
+
+
+def _join_commands(cmds):
+    """
+    Joins SCPI commands into a compound message.
+    """
+    return ";".join(
+        cmd if idx == 0 or cmd.startswith((":", "*")) else ":" + cmd
+        for idx, cmd in enumerate(cmds)
+    )
+
+
+def _split_response(resp):
+    """
+    Splits the response to a compound message at the ``;`` characters that
+    are not within a quoted string.
+    """
+    fields = []
+    start = 0
+    quote = None
+    for idx, char in enumerate(resp):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == ";":
+            fields.append(resp[start:idx])
+            start = idx + 1
+    fields.append(resp[start:])
+    return fields
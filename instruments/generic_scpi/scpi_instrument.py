@@ -9,6 +9,7 @@ Provides support for SCPI compliant instruments
 from enum import IntEnum
 
 from instruments.abstract_instruments import Instrument
+from instruments.generic_scpi.scpi_batch import SCPIBatch
 import instruments.units as u
 from instruments.util_fns import assume_units
 
@@ -32,6 +33,68 @@ class SCPIInstrument(Instrument):
     >>> print(inst.name)
     """
 
+    _batch = None
+
+    # COMMAND-HANDLING METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command without waiting for a response. Within a `batch`
+        block, the command is queued instead.
+
+        :param str cmd: String containing the command to
+            be sent.
+        """
+        batch = self._batch
+        if batch is not None and batch.active:
+            self._send_setting(cmd, batch.sendcmd)
+        else:
+            super(SCPIInstrument, self).sendcmd(cmd)
+
+    def query(self, cmd, size=-1):
+        """
+        Executes the given query. Within a `batch` block, the commands queued
+        so far are sent first.
+
+        :param str cmd: String containing the query to
+            execute.
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the query as returned by the
+            connected instrument.
+        :rtype: `str`
+        """
+        batch = self._batch
+        if batch is not None and batch.active:
+            return batch._instrument_query(cmd, size)  # pylint: disable=protected-access
+        return super(SCPIInstrument, self).query(cmd, size)
+
+    def batch(self, max_length=256):
+        """
+        Returns a context manager that sends the commands and queries made
+        within its ``with`` block as compound SCPI messages, cutting the
+        number of round trips to the instrument:
+
+        >>> with inst.batch() as batch:
+        ...     inst.display_brightness = 0.5
+        ...     contrast = batch.get(inst, "display_contrast")
+        >>> contrast.value
+        0.8
+
+        Batches opened within the block of another batch of the same
+        instrument join the outer batch.
+
+        .. seealso:: `~instruments.generic_scpi.SCPIBatch`
+
+        :param int max_length: Maximum length, in characters, of each
+            compound message sent to the instrument.
+        :rtype: `~instruments.generic_scpi.SCPIBatch`
+        """
+        batch = self._batch
+        if batch is not None and batch.active:
+            return batch
+        return SCPIBatch(self, max_length)
+
     # PROPERTIES #
 
     @property
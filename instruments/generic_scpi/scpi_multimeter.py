@@ -13,7 +13,9 @@ import instruments.units as u
 
 from instruments.abstract_instruments import Multimeter
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import assume_units, enum_property, unitful_property
+from instruments.util_fns import (
+    assume_units, enum_property, unitful_property, with_units
+)
 
 # CONSTANTS ###################################################################
 
@@ -151,7 +153,8 @@ class SCPIMultimeter(SCPIInstrument, Multimeter):
         :type: `~SCPIMultimeter.Mode`
         """,
         input_decoration=lambda x: SCPIMultimeter._mode_parse(x),
-        set_fmt="{}:{}"
+        set_fmt="{}:{}",
+        cacheable=True
     )
 
     trigger_mode = enum_property(
@@ -198,6 +201,7 @@ class SCPIMultimeter(SCPIInstrument, Multimeter):
             newval = newval.value
         else:
             newval = assume_units(newval, units).rescale(units).magnitude
+        self._forget_configuration()
         self.sendcmd("CONF:{} {}".format(mode.value, newval))
 
     @property
@@ -231,6 +235,7 @@ class SCPIMultimeter(SCPIInstrument, Multimeter):
         elif not isinstance(newval, (float, int)):
             raise TypeError("Resolution must be specified as an int, float, "
                             "or SCPIMultimeter.Resolution value.")
+        self._forget_configuration()
         self.sendcmd("CONF:{} {},{}".format(mode.value, input_range, newval))
 
     @property
@@ -377,7 +382,8 @@ class SCPIMultimeter(SCPIInstrument, Multimeter):
 
         Method returns a Python quantity consisting of a numpy array with the
         instrument value and appropriate units. If no appropriate units exist,
-        (for example, continuity), then return type is `float`.
+        (for example, continuity), then return type is `float`. In raw units
+        mode, the value is returned as a `float` in the units of the mode.
 
         :param mode: Desired measurement mode. If set to `None`, will default
             to the current mode.
@@ -388,12 +394,24 @@ class SCPIMultimeter(SCPIInstrument, Multimeter):
         if not isinstance(mode, SCPIMultimeter.Mode):
             raise TypeError("Mode must be specified as a SCPIMultimeter.Mode "
                             "value, got {} instead.".format(type(mode)))
+        # MEAS reconfigures the multimeter for the requested mode.
+        self._forget_configuration()
         # pylint: disable=no-member
         value = float(self.query('MEAS:{}?'.format(mode.value)))
-        return value * UNITS[mode]
+        return with_units(self, value, UNITS[mode])
 
     # INTERNAL FUNCTIONS ##
 
+    def _forget_configuration(self):
+        """
+        Discards the cached response to ``CONF?``, and the mode held in the
+        shadow state, before sending a command which reconfigures the
+        multimeter other than through `mode`.
+        """
+        self.invalidate_cache("CONF?")
+        if self._shadow_state is not None:
+            self._shadow_state.forget("CONF?")
+
     @staticmethod
     def _mode_parse(val):
         """
@@ -244,7 +244,7 @@ class HS9000(SignalGenerator):
         :return: A channel object for the HS9000
         :rtype: `~HS9000.Channel`
         """
-        return ProxyList(self, self.Channel, self._channel_idxs())
+        return ProxyList(self, self.Channel, self._channel_idxs(), cached=True)
 
     # OTHER PROPERTIES #
 
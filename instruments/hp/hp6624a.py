@@ -239,7 +239,9 @@ class HP6624a(PowerSupply):
         .. seealso::
             `HP6624a` for example using this property.
         """
-        return ProxyList(self, HP6624a.Channel, range(self.channel_count))
+        return ProxyList(
+            self, HP6624a.Channel, range(self.channel_count), cached=True
+        )
 
     @property
     def voltage(self):
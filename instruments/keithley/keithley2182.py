@@ -11,7 +11,7 @@ import instruments.units as u
 
 from instruments.generic_scpi import SCPIMultimeter
 from instruments.abstract_instruments import Multimeter
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -136,7 +136,7 @@ class Keithley2182(SCPIMultimeter):
 
         :rtype: `Keithley2182.Channel`
         """
-        return ProxyList(self, Keithley2182.Channel, range(2))
+        return ProxyList(self, Keithley2182.Channel, range(2), cached=True)
 
     @property
     def relative(self):
@@ -214,7 +214,7 @@ class Keithley2182(SCPIMultimeter):
         :return: Measurement readings from the instrument output buffer.
         :rtype: `list` of `~quantities.quantity.Quantity` elements
         """
-        return list(map(float, self.query("FETC?").split(","))) * self.units
+        return parse_ascii_array(self.query("FETC?")) * self.units
 
     def measure(self, mode=None):
         """
@@ -17,7 +17,6 @@ import instruments.units as u
 
 from instruments.abstract_instruments import Instrument
 from instruments.util_fns import ProxyList
-from instruments.abstract_instruments.comm import VisaCommunicator
 #from pyvisa import constants
 
 # CLASSES #####################################################################
@@ -284,7 +283,7 @@ class Keithley775A(Instrument):
 
         :rtype: `Keithley775A.Channel`
         """
-        return ProxyList(self, Keithley775A.Channel, range(2))
+        return ProxyList(self, Keithley775A.Channel, range(2), cached=True)
 
     @property
     def mode(self):
@@ -478,6 +477,9 @@ class Keithley775A(Instrument):
         """
         Returns True if the comminicator is VisaCommunicator
         """
+        # Imported here, such that PyVISA is only loaded when needed.
+        # pylint: disable=import-outside-toplevel
+        from instruments.abstract_instruments.comm import VisaCommunicator
         return isinstance(self._file, VisaCommunicator)
 
     def assertGPIB(self):
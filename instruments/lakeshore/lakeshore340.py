@@ -72,4 +72,4 @@ class Lakeshore340(SCPIInstrument):
 
         :rtype: `~Lakeshore340.Sensor`
         """
-        return ProxyList(self, Lakeshore340.Sensor, range(2))
+        return ProxyList(self, Lakeshore340.Sensor, range(2), cached=True)
@@ -77,4 +77,4 @@ class Lakeshore370(SCPIInstrument):
 
         :rtype: `~Lakeshore370.Channel`
         """
-        return ProxyList(self, Lakeshore370.Channel, range(16))
+        return ProxyList(self, Lakeshore370.Channel, range(16), cached=True)
@@ -210,7 +210,9 @@ class MHS5200(FunctionGenerator):
 
         :rtype: `list`[`MHS5200.Channel`]
         """
-        return ProxyList(self, MHS5200.Channel, range(self._channel_count))
+        return ProxyList(
+            self, MHS5200.Channel, range(self._channel_count), cached=True
+        )
 
     @property
     def serial_number(self):
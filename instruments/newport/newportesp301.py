@@ -115,7 +115,9 @@ class NewportESP301(Instrument):
 
         :type: :class:`NewportESP301Axis`
         """
-
+        # The axis objects are not cached, as each one reads the units of
+        # its axis when created, and these may be changed other than
+        # through that object.
         return ProxyList(self, NewportESP301Axis, range(100))
         # return _AxisList(self)
 
@@ -74,4 +74,4 @@ class OxfordITC503(Instrument):
 
         :type: `OxfordITC503.Sensor`
         """
-        return ProxyList(self, OxfordITC503.Sensor, range(3))
+        return ProxyList(self, OxfordITC503.Sensor, range(3), cached=True)
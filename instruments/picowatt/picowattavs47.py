@@ -89,7 +89,7 @@ class PicowattAVS47(SCPIInstrument):
         .. seealso::
             `PicowattAVS47` for an example using this property.
         """
-        return ProxyList(self, PicowattAVS47.Sensor, range(8))
+        return ProxyList(self, PicowattAVS47.Sensor, range(8), cached=True)
 
     remote = bool_property(
         command="REM",
@@ -318,7 +318,9 @@ class CC1(SCPIInstrument):
 
         :rtype: `CC1.Channel`
         """
-        return ProxyList(self, CC1.Channel, range(self._channel_count))
+        return ProxyList(
+            self, CC1.Channel, range(self._channel_count), cached=True
+        )
 
     # METHODS #
 
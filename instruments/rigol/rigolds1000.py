@@ -129,7 +129,7 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
     def channel(self):
         # Rigol DS1000 series oscilloscopes all have two channels,
         # according to the documentation.
-        return ProxyList(self, self.Channel, range(2))
+        return ProxyList(self, self.Channel, range(2), cached=True)
 
     @property
     def math(self):
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Provides a simulated SCPI instrument served over TCP, for exercising socket
+connections and drivers without hardware.
+"""
+
+# IMPORTS #####################################################################
+
+
+import asyncio
+import threading
+
+import numpy as np
+
+from instruments.generic_scpi.scpi_batch import _split_response
+
+# CLASSES #####################################################################
+
+
+class Setting:
+
+    """
+    Entry of an `SCPISimulator` table for a setting, which is set by the
+    command ``HEADER value`` and read by the query ``HEADER?``.
+
+    :param str value: Initial value, as returned by the query.
+    """
+
+    def __init__(self, value=""):
+        self.value = str(value)
+
+    def __repr__(self):
+        return "Setting({!r})".format(self.value)
+
+
+class BinaryBlock:
+
+    """
+    Response of an `SCPISimulator` query sent as an IEEE-488.2 definite
+    length binary block, such as the waveform returned by ``CURV?``.
+
+    :param data: Bytes-like object or `numpy.ndarray` holding the data of
+        the block. Arrays are sent in their own byte order.
+    """
+
+    def __init__(self, data):
+        if isinstance(data, np.ndarray):
+            data = data.tobytes()
+        self.data = bytes(data)
+
+    def __repr__(self):
+        return "BinaryBlock(<{} bytes>)".format(len(self.data))
+
+    def encode(self):
+        """
+        Returns the block, with its header.
+
+        :rtype: `bytes`
+        """
+        size = str(len(self.data))
+        return "#{}{}".format(len(size), size).encode("utf-8") + self.data
+
+
+class SCPISimulator:
+
+    """
+    TCP server impersonating an instrument from a declarative table of
+    commands, for testing socket connections, concurrent polling and
+    batching without hardware. Any number of clients may connect at once,
+    and they all see the same simulated instrument.
+
+    The table maps each header, such as ``"*IDN?"`` or ``"CH1:SCALE"``, to
+    one of:
+
+    - a `str` or `bytes` response to the query, sent followed by the
+      terminator,
+    - a `BinaryBlock`, sent followed by the terminator,
+    - a `Setting`, set by ``HEADER value`` and read by ``HEADER?``,
+    - a callable, called with the simulator and the arguments of the
+      message as a `str`, returning the response as above, or `None` to
+      send nothing,
+    - `None`, for a command accepted without a response.
+
+    Headers are matched without a leading ``:`` and ignoring case. Compound
+    messages are split at ``;`` and their responses joined with ``;``. Other
+    messages are appended to `unhandled` and answered with nothing.
+
+    The simulator runs in an asyncio event loop, either in the current one
+    with ``async with``, or in a background thread with ``with``:
+
+    >>> table = {
+    ...     "*IDN?": "ACME,SIM,0,1.0",
+    ...     "VOLT": Setting("0.0"),
+    ...     "CURV?": BinaryBlock(np.arange(1000, dtype=">i2")),
+    ... }
+    >>> with SCPISimulator(table, latency={"CURV?": 0.01}) as sim:
+    ...     inst = ik.Instrument.open_tcpip(sim.host, sim.port)
+    ...     inst.query("*IDN?")
+    'ACME,SIM,0,1.0'
+
+    :param dict table: Commands of the simulated instrument.
+    :param dict latency: Seconds waited before answering each header, in
+        addition to ``default_latency``.
+    :param float default_latency: Seconds waited before handling any
+        message.
+    :param float bandwidth: Maximum rate at which responses are sent to each
+        client, in bytes per second, or `None` for no limit.
+    :param str terminator: Termination character of messages and responses.
+    :param str host: Address to listen on.
+    :param int port: Port to listen on, or 0 to choose a free port.
+    """
+
+    def __init__(self, table, latency=None, default_latency=0.0,
+                 bandwidth=None, terminator="\n", host="127.0.0.1", port=0):
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError("Bandwidth must be a positive number of bytes "
+                             "per second.")
+        self.table = {_normalize(key): value for key, value in table.items()}
+        self.latency = {
+            _normalize(key): value for key, value in (latency or {}).items()
+        }
+        self.default_latency = default_latency
+        self.bandwidth = bandwidth
+        self.terminator = terminator
+        self.host = host
+        self.port = port
+
+        #: Messages received, in order, from every client.
+        self.received = []
+        #: Messages whose header is not in the table.
+        self.unhandled = []
+
+        self._server = None
+        self._clients = set()
+        self._loop = None
+        self._thread = None
+
+    def __repr__(self):
+        return "<SCPISimulator on {}:{}>".format(self.host, self.port)
+
+    # PROPERTIES #
+
+    @property
+    def connections(self):
+        """
+        Gets the number of clients currently connected.
+
+        :type: `int`
+        """
+        return len(self._clients)
+
+    # ASYNC INTERFACE #
+
+    async def start(self):
+        """
+        Starts serving in the running event loop. Once started, `port` holds
+        the port the simulator listens on.
+        """
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Disconnects every client and stops serving.
+        """
+        self._server.close()
+        for task in list(self._clients):
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    # THREADED INTERFACE #
+
+    def __enter__(self):
+        started = threading.Event()
+        errors = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            try:
+                loop.run_until_complete(self.start())
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+                started.set()
+                loop.close()
+                return
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
+
+    # METHODS #
+
+    def respond(self, message):
+        """
+        Handles a message, without any latency, as it would be handled when
+        received from a client.
+
+        :param str message: Message received.
+        :return: Response to send, or `None` if there is none.
+        :rtype: `bytes` or `None`
+        """
+        responses = []
+        for part in _split_response(message):
+            response = self._respond_one(part)
+            if response is not None:
+                responses.append(response)
+        if not responses:
+            return None
+        term = self.terminator.encode("utf-8")
+        return b";".join(responses) + term
+
+    def _respond_one(self, message):
+        header, _, args = message.strip().partition(" ")
+        key = _normalize(header)
+        query = key.endswith("?")
+        entry = self.table.get(key, _MISSING)
+        if entry is _MISSING and query:
+            entry = self.table.get(key[:-1], _MISSING)
+            if not isinstance(entry, Setting):
+                entry = _MISSING
+        if entry is _MISSING:
+            self.unhandled.append(message)
+            return None
+        if isinstance(entry, Setting):
+            if query:
+                return entry.value.encode("utf-8")
+            entry.value = args.strip()
+            return None
+        if callable(entry):
+            entry = entry(self, args.strip())
+        if entry is None:
+            return None
+        if isinstance(entry, BinaryBlock):
+            return entry.encode()
+        if isinstance(entry, str):
+            return entry.encode("utf-8")
+        return bytes(entry)
+
+    def _latency_of(self, message):
+        latency = self.default_latency
+        for part in _split_response(message):
+            header = part.strip().partition(" ")[0]
+            latency += self.latency.get(_normalize(header), 0)
+        return latency
+
+    async def _handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self._clients.add(task)
+        term = self.terminator.encode("utf-8")
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(term)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                message = line[:-len(term)].decode("utf-8")
+                self.received.append(message)
+                latency = self._latency_of(message)
+                if latency > 0:
+                    await asyncio.sleep(latency)
+                response = self.respond(message)
+                if response is not None:
+                    await self._send(writer, response)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._clients.discard(task)
+            writer.close()
+
+    async def _send(self, writer, data):
+        if self.bandwidth is None:
+            writer.write(data)
+            await writer.drain()
+            return
+        # Send in slices taking about 10 ms each at the given bandwidth.
+        step = max(int(self.bandwidth / 100), 1)
+        for idx in range(0, len(data), step):
+            chunk = data[idx:idx + step]
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(len(chunk) / self.bandwidth)
+
+# FUNCTIONS ###################################################################
+
+
+_MISSING = object()
+
+
+def _normalize(header):
+    return header.lstrip(":").upper()
@@ -22,7 +22,8 @@ from instruments.abstract_instruments.comm import (
 from instruments.generic_scpi import SCPIInstrument
 import instruments.units as u
 from instruments.util_fns import (
-    bool_property, bounded_unitful_property, enum_property, unitful_property
+    bool_property, bounded_unitful_property, enum_property, parse_ascii_array,
+    unitful_property
 )
 
 # CONSTANTS ###################################################################
@@ -517,10 +518,7 @@ class SRS830(SCPIInstrument):
         # Query device for entire buffer, returning in ASCII, then
         # converting to a list of floats before returning to the
         # calling method
-        return np.fromstring(
-            self.query('TRCA?{},0,{}'.format(channel, N)).strip(),
-            sep=','
-        )
+        return parse_ascii_array(self.query('TRCA?{},0,{}'.format(channel, N)))
 
     def clear_data_buffer(self):
         """
@@ -13,7 +13,7 @@ import numpy as np
 
 from instruments.generic_scpi import SCPIInstrument
 import instruments.units as u
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -229,12 +229,9 @@ class SRSCTC100(SCPIInstrument):
             if units is None:
                 units = self.units
 
-            point = [
-                s.strip() for s in
-                self._ctc.query(
-                    'getLog.xy {}, {}'.format(self._chan_name, which)
-                ).split(',')
-            ]
+            point = parse_ascii_array(self._ctc.query(
+                'getLog.xy {}, {}'.format(self._chan_name, which)
+            ))
             return u.Quantity(point[0], 'ms'), u.Quantity(point[1], units)
 
         def get_log(self):
@@ -356,7 +353,9 @@ class SRSCTC100(SCPIInstrument):
         :type: `SRSCTC100.Channel`
         """
         # Note that since the names can change, we need to query channel names
-        # each time. This is inefficient, but alas.
+        # each time. This is inefficient, but alas. For the same reason, the
+        # channel objects are not cached, as renaming a channel changes the
+        # name it is addressed by.
         return ProxyList(self, self.Channel, self._channel_names())
 
     @property
@@ -251,7 +251,9 @@ class SRSDG645(SCPIInstrument):
 
         :rtype: `_SRSDG645Channel`
         """
-        return ProxyList(self, _SRSDG645Channel, SRSDG645.Channels)
+        return ProxyList(
+            self, _SRSDG645Channel, SRSDG645.Channels, cached=True
+        )
 
     @property
     def output(self):
@@ -260,7 +262,7 @@ class SRSDG645(SCPIInstrument):
 
         :type: :class:`SRSDG645.Output`
         """
-        return ProxyList(self, self.Output, self.Outputs)
+        return ProxyList(self, self.Output, self.Outputs, cached=True)
 
     @property
     def display(self):
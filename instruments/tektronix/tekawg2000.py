@@ -209,7 +209,7 @@ class TekAWG2000(SCPIInstrument):
         :return: A channel object for the AWG2000
         :rtype: `TekAWG2000.Channel`
         """
-        return ProxyList(self, self.Channel, range(2))
+        return ProxyList(self, self.Channel, range(2), cached=True)
 
     # METHODS #
 
@@ -250,11 +250,8 @@ class TekAWG2000(SCPIInstrument):
         if np.max(np.abs(waveform)) > 1:
             raise ValueError("The max value for an element in waveform is 1.")
 
-        waveform *= (2**12 - 1)
-        waveform = waveform.astype("<u2").tostring()
-        wfm_header_2 = str(len(waveform))
-        wfm_header_1 = len(wfm_header_2)
+        # Scale straight into the transmitted data type.
+        points = np.empty(waveform.shape, dtype="<u2")
+        np.multiply(waveform, 2**12 - 1, out=points, casting="unsafe")
 
-        bin_str = "#{}{}{}".format(wfm_header_1, wfm_header_2, waveform)
-
-        self.sendcmd("CURVE {}".format(bin_str))
+        self.binblockwrite("CURVE ", points)
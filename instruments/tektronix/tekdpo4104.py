@@ -18,7 +18,7 @@ from instruments.abstract_instruments import (
     Oscilloscope,
 )
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # FUNCTIONS ###################################################################
 
@@ -109,10 +109,7 @@ class _TekDPO4104DataSource(OscilloscopeDataSource):
                 # Set data encoding format to ASCII
                 self._tek.sendcmd("DAT:ENC ASCI")
                 sleep(0.02)  # Work around issue with 2.48 firmware.
-                raw = self._tek.query("CURVE?")
-                raw = raw.split(",")  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
+                raw = parse_ascii_array(self._tek.query("CURVE?"))
             else:
                 # Set encoding to signed, big-endian
                 self._tek.sendcmd("DAT:ENC RIB")
@@ -219,7 +216,7 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
 
         :rtype: `_TekDPO4104Channel`
         """
-        return ProxyList(self, _TekDPO4104Channel, range(4))
+        return ProxyList(self, _TekDPO4104Channel, range(4), cached=True)
 
     @property
     def ref(self):
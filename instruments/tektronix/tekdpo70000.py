@@ -468,7 +468,8 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             "VERT:POS",
             doc="""
             The vertical position, in divisions from the center graticule.
-            """
+            """,
+            cacheable=True
         )
 
         scale = unitful_property(
@@ -477,7 +478,8 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             doc="""
             The scale in volts per division. The range is from
             ``100e-36`` to ``100e+36``.
-            """
+            """,
+            cacheable=True
         )
 
         def _scale_raw_data(self, data):
@@ -596,7 +598,8 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             doc="""
             The vertical offset in units of volts. Voltage is given by
             ``offset+scale*(5*raw/2^15 - position)``.
-            """
+            """,
+            cacheable=True
         )
 
         position = unitless_property(
@@ -605,7 +608,8 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             The vertical position, in divisions from the center graticule,
             ranging from ``-8`` to ``8``. Voltage is given by
             ``offset+scale*(5*raw/2^15 - position)``.
-            """
+            """,
+            cacheable=True
         )
 
         scale = unitful_property(
@@ -614,7 +618,8 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             doc="""
             Vertical channel scale in units volts/division. Voltage is given
             by ``offset+scale*(5*raw/2^15 - position)``.
-            """
+            """,
+            cacheable=True
         )
 
         def _scale_raw_data(self, data):
@@ -627,11 +632,11 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
 
     @property
     def channel(self):
-        return ProxyList(self, self.Channel, range(4))
+        return ProxyList(self, self.Channel, range(4), cached=True)
 
     @property
     def math(self):
-        return ProxyList(self, self.Math, range(4))
+        return ProxyList(self, self.Math, range(4), cached=True)
 
     @property
     def ref(self):
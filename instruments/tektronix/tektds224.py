@@ -18,7 +18,7 @@ from instruments.abstract_instruments import (
     Oscilloscope,
 )
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 import instruments.units as u
 
 
@@ -70,10 +70,7 @@ class _TekTDS224DataSource(OscilloscopeDataSource):
             if not bin_format:
                 self._tek.sendcmd("DAT:ENC ASCI")
                 # Set the data encoding format to ASCII
-                raw = self._tek.query("CURVE?")
-                raw = raw.split(',')  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
+                raw = parse_ascii_array(self._tek.query("CURVE?"))
             else:
                 self._tek.sendcmd("DAT:ENC RIB")
                 # Set encoding to signed, big-endian
@@ -180,7 +177,7 @@ class TekTDS224(SCPIInstrument, Oscilloscope):
 
         :rtype: `_TekTDS224Channel`
         """
-        return ProxyList(self, _TekTDS224Channel, range(4))
+        return ProxyList(self, _TekTDS224Channel, range(4), cached=True)
 
     @property
     def ref(self):
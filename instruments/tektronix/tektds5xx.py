@@ -49,7 +49,7 @@ from instruments.abstract_instruments import (
     Oscilloscope,
 )
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -124,10 +124,7 @@ class _TekTDS5xxDataSource(OscilloscopeDataSource):
             if not bin_format:
                 # Set the data encoding format to ASCII
                 self._parent.sendcmd('DAT:ENC ASCI')
-                raw = self._parent.query('CURVE?')
-                raw = raw.split(',')  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
+                raw = parse_ascii_array(self._parent.query('CURVE?'))
             else:
                 # Set encoding to signed, big-endian
                 self._parent.sendcmd('DAT:ENC RIB')
@@ -359,7 +356,7 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
 
         :rtype: `_TekTDS5xxChannel`
         """
-        return ProxyList(self, _TekTDS5xxChannel, range(4))
+        return ProxyList(self, _TekTDS5xxChannel, range(4), cached=True)
 
     @property
     def ref(self):
@@ -59,6 +59,25 @@ def test_agilent34410a_r():
         unit_eq(dmm.r(1), np.array([1]) * u.volt)
 
 
+def test_agilent34410a_r_raw_units():
+    with expected_protocol(
+            ik.agilent.Agilent34410a,
+            [
+                "CONF?",
+                "FORM:DATA REAL,64",
+                "R? 1"
+            ], [
+                "VOLT +1.000000E+01,+3.000000E-06",
+                # pylint: disable=no-member
+                b"#18" + bytes.fromhex("3FF0000000000000")
+            ]
+    ) as dmm:
+        dmm.raw_units = True
+        data = dmm.r(1)
+        assert not isinstance(data, u.Quantity)
+        np.testing.assert_array_equal(data, [1.0])
+
+
 def test_agilent34410a_fetch():
     with expected_protocol(
             ik.agilent.Agilent34410a,
@@ -4,11 +4,17 @@
 Module containing tests for the base Instrument class
 """
 
+# The tests follow the layout of the Instrument class they cover.
+# pylint: disable=too-many-lines
+
 # IMPORTS ####################################################################
 
 
 import socket
 import io
+import threading
+import time
+
 import serial
 from serial.tools.list_ports_common import ListPortInfo
 
@@ -16,7 +22,7 @@ import pytest
 import numpy as np
 
 import instruments as ik
-from instruments.tests import expected_protocol
+from instruments.tests import expected_protocol, unit_eq
 # pylint: disable=unused-import
 from instruments.abstract_instruments.comm import (
     SocketCommunicator, USBCommunicator, VisaCommunicator, FileCommunicator,
@@ -24,6 +30,10 @@ from instruments.abstract_instruments.comm import (
     USBTMCCommunicator, VXI11Communicator, serial_manager, SerialCommunicator
 )
 from instruments.errors import AcknowledgementError, PromptError
+from instruments.util_fns import (
+    ProxyList, bool_property, raw_units, unitful_property
+)
+import instruments.units as u
 
 from . import mock
 
@@ -79,6 +89,118 @@ def test_instrument_binblockread_bad_block_start():
         _ = inst.binblockread(2)
 
 
+def test_instrument_binblockread_out():
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", data[:6], data[6:]]
+    )
+    out = np.zeros(8, dtype=">h")
+
+    result = inst.binblockread(2, out=out)
+    np.testing.assert_array_equal(result, [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(out, [0, 1, 2, 3, 4, 0, 0, 0])
+    assert np.shares_memory(result, out)
+
+
+def test_instrument_binblockread_out_too_small():
+    inst = ik.Instrument.open_test()
+    inst._file.read_raw = mock.MagicMock(side_effect=[b"#", b"2", b"10"])
+
+    with pytest.raises(ValueError):
+        _ = inst.binblockread(2, out=bytearray(8))
+
+
+def test_instrument_binblockread_memmap(tmpdir):
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(side_effect=[b"#", b"2", b"10", data])
+    out = np.memmap(str(tmpdir.join("data.bin")), dtype=">h", mode="w+",
+                    shape=(5,))
+
+    inst.binblockread(2, out=out)
+    out.flush()
+    assert tmpdir.join("data.bin").read_binary() == data
+
+
+def test_instrument_binblockread_iter():
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", data[:3], data[3:4], data[4:8],
+                     data[8:]]
+    )
+
+    chunks = list(inst.binblockread_iter(2, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    np.testing.assert_array_equal(np.concatenate(chunks), [0, 1, 2, 3, 4])
+
+    calls_expected = [1, 1, 2, 4, 1, 4, 2]
+    calls_actual = [call[0][0] for call in inst._file.read_raw.call_args_list]
+    assert calls_actual == calls_expected
+
+
+def test_instrument_binblockread_iter_invalid_chunk_size():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(ValueError):
+        _ = list(inst.binblockread_iter(2, chunk_size=0))
+
+
+def test_instrument_binblockread_to_file():
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", data[:4], data[4:8], data[8:]]
+    )
+    fileobj = io.BytesIO()
+
+    assert inst.binblockread_to_file(fileobj, chunk_size=4) == 10
+    assert fileobj.getvalue() == data
+
+
+def test_instrument_binblockread_to_file_too_few_bytes():
+    inst = ik.Instrument.open_test()
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", b"\x00", b"", b"", b""]
+    )
+
+    with pytest.raises(IOError):
+        inst.binblockread_to_file(io.BytesIO())
+
+
+# BINBLOCKWRITE TESTS
+
+def test_instrument_binblockwrite():
+    with expected_protocol(
+            ik.Instrument,
+            [
+                b"CURVE #16" + bytes.fromhex("000100020003")
+            ],
+            [],
+            sep="\n"
+    ) as inst:
+        inst.binblockwrite("CURVE ", [1, 2, 3], fmt=">h")
+
+
+def test_instrument_binblockwrite_chunks():
+    inst = ik.Instrument.open_test()
+    inst._file.write_raw = mock.MagicMock()
+    data = np.arange(5, dtype="<u2")
+
+    inst.binblockwrite("DATA ", data, chunk_size=4)
+    written = [bytes(call[0][0]) for call in inst._file.write_raw.call_args_list]
+    assert written == [
+        b"DATA #210", data.tobytes()[:4], data.tobytes()[4:8],
+        data.tobytes()[8:], b"\n"
+    ]
+
+
+def test_instrument_binblockwrite_invalid_chunk_size():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(ValueError):
+        inst.binblockwrite("DATA ", [1], chunk_size=0)
+
+
 # OPEN CONNECTION TESTS
 
 @mock.patch("instruments.abstract_instruments.instrument.SocketCommunicator")
@@ -147,7 +269,7 @@ def fake_comports():
     return [fake_device, fake_device2]
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids(mock_serial_manager):
     mock_serial_manager.new_serial_connection.return_value.__class__ = SerialCommunicator
@@ -162,7 +284,7 @@ def test_instrument_open_serial_by_usb_ids(mock_serial_manager):
     )
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids_and_serial_number(mock_serial_manager):
     mock_serial_manager.new_serial_connection.return_value.__class__ = SerialCommunicator
@@ -177,7 +299,7 @@ def test_instrument_open_serial_by_usb_ids_and_serial_number(mock_serial_manager
     )
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports")
+@mock.patch("serial.tools.list_ports.comports")
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids_multiple_matches(_, mock_comports):
     with pytest.raises(serial.SerialException):
@@ -198,7 +320,7 @@ def test_instrument_open_serial_by_usb_ids_multiple_matches(_, mock_comports):
         _ = ik.Instrument.open_serial(baud=1234, vid=0, pid=1000)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids_incorrect_serial_num(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -206,7 +328,7 @@ def test_instrument_open_serial_by_usb_ids_incorrect_serial_num(mock_serial_mana
         _ = ik.Instrument.open_serial(baud=1234, vid=0, pid=1000, serial_number="xyz")
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids_cant_find(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -214,7 +336,7 @@ def test_instrument_open_serial_by_usb_ids_cant_find(mock_serial_manager):
         _ = ik.Instrument.open_serial(baud=1234, vid=1234, pid=1000)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_no_port(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -222,7 +344,7 @@ def test_instrument_open_serial_no_port(mock_serial_manager):
         _ = ik.Instrument.open_serial(baud=1234)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_ids_and_port(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -230,7 +352,7 @@ def test_instrument_open_serial_by_usb_ids_and_port(mock_serial_manager):
         _ = ik.Instrument.open_serial(port="COM1", baud=1234, vid=1234, pid=1000)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_vid_no_pid(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -238,7 +360,7 @@ def test_instrument_open_serial_by_usb_vid_no_pid(mock_serial_manager):
         _ = ik.Instrument.open_serial(baud=1234, vid=1234)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.comports", new=fake_comports)
+@mock.patch("serial.tools.list_ports.comports", new=fake_comports)
 @mock.patch("instruments.abstract_instruments.instrument.serial_manager")
 def test_instrument_open_serial_by_usb_pid_no_vid(mock_serial_manager):
     with pytest.raises(ValueError):
@@ -268,24 +390,26 @@ def test_instrument_open_gpibusb(mock_serial_manager, mock_gpib_comm):
     mock_gpib_comm.assert_called_with(
         mock_serial_manager.new_serial_connection.return_value,
         1,
-        "gi"
+        "gi",
+        False
     )
 
 
-@mock.patch("instruments.abstract_instruments.instrument.visa", new=None)
+@mock.patch.dict("sys.modules", {"visa": None})
 def test_instrument_open_visa_import_error():
     with pytest.raises(ImportError):
         _ = ik.Instrument.open_visa("abc123")
 
 
-@mock.patch("instruments.abstract_instruments.instrument.VisaCommunicator")
-@mock.patch("instruments.abstract_instruments.instrument.visa")
-def test_instrument_open_visa_new_version(mock_visa, mock_visa_comm):
+@mock.patch("instruments.abstract_instruments.comm.VisaCommunicator")
+def test_instrument_open_visa_new_version(mock_visa_comm):
+    mock_visa = mock.MagicMock()
     mock_visa_comm.return_value.__class__ = VisaCommunicator
     mock_visa.__version__ = "1.8"
     visa_open_resource = mock_visa.ResourceManager.return_value.open_resource
 
-    inst = ik.Instrument.open_visa("abc123")
+    with mock.patch.dict("sys.modules", {"visa": mock_visa}):
+        inst = ik.Instrument.open_visa("abc123")
 
     assert isinstance(inst._file, VisaCommunicator) is True
 
@@ -293,13 +417,14 @@ def test_instrument_open_visa_new_version(mock_visa, mock_visa_comm):
     mock_visa_comm.assert_called_with(visa_open_resource("abc123"))
 
 
-@mock.patch("instruments.abstract_instruments.instrument.VisaCommunicator")
-@mock.patch("instruments.abstract_instruments.instrument.visa")
-def test_instrument_open_visa_old_version(mock_visa, mock_visa_comm):
+@mock.patch("instruments.abstract_instruments.comm.VisaCommunicator")
+def test_instrument_open_visa_old_version(mock_visa_comm):
+    mock_visa = mock.MagicMock()
     mock_visa_comm.return_value.__class__ = VisaCommunicator
     mock_visa.__version__ = "1.5"
 
-    inst = ik.Instrument.open_visa("abc123")
+    with mock.patch.dict("sys.modules", {"visa": mock_visa}):
+        inst = ik.Instrument.open_visa("abc123")
 
     assert isinstance(inst._file, VisaCommunicator) is True
 
@@ -319,7 +444,7 @@ def test_instrument_open_test():
     assert inst._file._stdout == b
 
 
-@mock.patch("instruments.abstract_instruments.instrument.VXI11Communicator")
+@mock.patch("instruments.abstract_instruments.comm.VXI11Communicator")
 def test_instrument_open_vxi11(mock_vxi11_comm):
     mock_vxi11_comm.return_value.__class__ = VXI11Communicator
 
@@ -330,7 +455,7 @@ def test_instrument_open_vxi11(mock_vxi11_comm):
     mock_vxi11_comm.assert_called_with("string", 1, key1="value")
 
 
-@mock.patch("instruments.abstract_instruments.instrument.USBTMCCommunicator")
+@mock.patch("instruments.abstract_instruments.comm.USBTMCCommunicator")
 def test_instrument_open_usbtmc(mock_usbtmc_comm):
     mock_usbtmc_comm.return_value.__class__ = USBTMCCommunicator
 
@@ -726,6 +851,397 @@ def test_instrument_write():
     inst._file.write.assert_called_with("foobar")
 
 
+# LOCKING TESTS
+
+
+def test_instrument_lock_shared_by_connection():
+    conn = serial.Serial()
+    inst1 = ik.Instrument(SerialCommunicator(conn))
+    inst2 = ik.Instrument(SerialCommunicator(conn))
+    inst3 = ik.Instrument(SerialCommunicator(serial.Serial()))
+
+    assert inst1.lock is inst2.lock
+    assert inst1.lock is not inst3.lock
+
+    with inst1.lock:
+        with inst2.lock:  # Reentrant
+            pass
+
+
+def test_instrument_lock_loopback():
+    inst = ik.Instrument.open_test()
+    assert inst.lock is inst.lock
+    assert inst.lock is not ik.Instrument.open_test().lock
+
+
+def test_instrument_query_is_atomic():
+    inst = ik.Instrument.open_test()
+    inst._ack_expected = lambda msg: "ACK"
+    active = []
+
+    def fake_query(cmd, size=-1):  # pylint: disable=unused-argument
+        active.append(cmd)
+        assert len(active) == 1, "Transactions interleaved."
+        time.sleep(0.001)
+        return ""
+
+    def fake_read(size=-1, encoding="utf-8"):  # pylint: disable=unused-argument
+        assert len(active) == 1, "Transactions interleaved."
+        if size == -1 and active[0] != "ACKED":
+            active[0] = "ACKED"
+            return "ACK"
+        active.pop()
+        return "value"
+
+    inst._file.query = fake_query
+    inst._file.read = fake_read
+
+    results = []
+
+    def poll():
+        for _ in range(10):
+            results.append(inst.query("VAL?", size=5))
+
+    threads = [threading.Thread(target=poll) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 40
+
+
+# QUERY CACHE TESTS
+
+class CachedInstrument(ik.Instrument):
+    """
+    Instrument with cacheable properties, for testing the query cache.
+    """
+    output = bool_property("OUTP", cacheable=True)
+    voltage = unitful_property("VOLT", u.volt, cacheable=0.5)
+    current = unitful_property("CURR", u.amp)
+
+    class Channel:
+        """
+        Channel prefixing the commands it sends with its index.
+        """
+        scale = unitful_property("SCALE", u.volt, cacheable=True)
+
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def sendcmd(self, cmd):
+            self._parent.sendcmd("CH{}:{}".format(self._idx, cmd))
+
+        def query(self, cmd, size=-1):
+            return self._parent.query("CH{}:{}".format(self._idx, cmd), size)
+
+    @property
+    def channel(self):
+        """
+        Gets the channels of the mock instrument.
+        """
+        return ProxyList(self, self.Channel, range(2))
+
+
+def test_instrument_query_cache_disabled_by_default():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP?",
+                "OUTP?"
+            ],
+            [
+                "ON",
+                "ON"
+            ]
+    ) as inst:
+        assert inst.query_cache_ttl is None
+        assert inst.output is True
+        assert inst.output is True
+
+
+def test_instrument_query_cache():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP?",
+                "CURR?",
+                "CURR?",
+                "OUTP OFF",
+                "OUTP?"
+            ],
+            [
+                "ON",
+                "1",
+                "1",
+                "OFF"
+            ]
+    ) as inst:
+        inst.query_cache_ttl = 60
+        assert inst.query_cache_ttl == 60 * u.second
+        assert inst.output is True
+        assert inst.output is True
+        # Properties are only cached if declared cacheable.
+        assert inst.current == 1 * u.amp
+        assert inst.current == 1 * u.amp
+        inst.output = False
+        assert inst.output is False
+        assert inst.output is False
+
+
+def test_instrument_query_cache_ttl(mocker):
+    monotonic = mocker.patch("time.monotonic", return_value=0)
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP?",
+                "VOLT?",
+                "VOLT?",
+                "OUTP?"
+            ],
+            [
+                "ON",
+                "1",
+                "2",
+                "OFF"
+            ]
+    ) as inst:
+        inst.query_cache_ttl = 10
+        assert inst.output is True
+        assert inst.voltage == 1 * u.volt
+        monotonic.return_value = 1
+        assert inst.output is True
+        # The voltage has its own time to live of 0.5 s.
+        assert inst.voltage == 2 * u.volt
+        monotonic.return_value = 12
+        assert inst.output is False
+
+
+def test_instrument_query_cache_channel():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "CH0:SCALE?",
+                "CH1:SCALE?",
+                "CH1:SCALE 3.000000e+00",
+                "CH1:SCALE?"
+            ],
+            [
+                "1",
+                "2",
+                "3"
+            ]
+    ) as inst:
+        inst.query_cache_ttl = 60
+        assert inst.channel[0].scale == 1 * u.volt
+        assert inst.channel[1].scale == 2 * u.volt
+        inst.channel[1].scale = 3 * u.volt
+        assert inst.channel[0].scale == 1 * u.volt
+        assert inst.channel[1].scale == 3 * u.volt
+
+
+def test_instrument_invalidate_cache():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP?",
+                "OUTP?",
+                "OUTP?"
+            ],
+            [
+                "ON",
+                "OFF",
+                "ON"
+            ]
+    ) as inst:
+        inst.query_cache_ttl = 60
+        assert inst.output is True
+        inst.invalidate_cache("OUTP?")
+        assert inst.output is False
+        inst.query_cache_ttl = None
+        inst.query_cache_ttl = 60
+        assert inst.output is True
+
+
+def test_instrument_query_cache_ttl_negative():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(ValueError):
+        inst.query_cache_ttl = -1
+
+
+def test_instrument_shadow_state_disabled_by_default():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP ON",
+                "OUTP ON"
+            ],
+            [
+            ]
+    ) as inst:
+        assert inst.shadow_state is False
+        inst.output = True
+        inst.output = True
+
+
+def test_instrument_shadow_state_skips_redundant_writes():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP ON",
+                "CURR 1.000000e+00",
+                "OUTP OFF",
+                "CURR 2.000000e+00"
+            ],
+            [
+            ]
+    ) as inst:
+        inst.shadow_state = True
+        inst.output = True
+        inst.output = True
+        inst.current = 1 * u.amp
+        inst.current = 1 * u.amp
+        inst.output = False
+        inst.current = 2 * u.amp
+
+
+def test_instrument_shadow_state_records_reads():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "CURR?",
+                "CH1:SCALE?",
+                "CH0:SCALE 5.000000e-01",
+                "CURR 3.000000e+00"
+            ],
+            [
+                "+2.0",
+                "+0.5"
+            ]
+    ) as inst:
+        inst.shadow_state = True
+        unit_eq(inst.current, 2 * u.amp)
+        unit_eq(inst.channel[1].scale, 0.5 * u.volt)
+        inst.current = 2 * u.amp
+        inst.channel[1].scale = 0.5 * u.volt
+        inst.channel[0].scale = 0.5 * u.volt
+        inst.current = 3 * u.amp
+
+
+def test_instrument_shadow_state_resync():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP ON",
+                "CH0:SCALE 1.000000e+00",
+                "OUTP?",
+                "CH0:SCALE?",
+                "OUTP ON"
+            ],
+            [
+                "OFF",
+                "+1.0"
+            ]
+    ) as inst:
+        inst.shadow_state = True
+        inst.output = True
+        inst.channel[0].scale = 1 * u.volt
+        inst.resync()
+        inst.output = True
+        inst.channel[0].scale = 1 * u.volt
+
+
+def test_instrument_shadow_state_disable_clears():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "OUTP ON",
+                "OUTP ON"
+            ],
+            [
+            ]
+    ) as inst:
+        inst.shadow_state = True
+        inst.output = True
+        inst.shadow_state = False
+        inst.shadow_state = True
+        inst.output = True
+
+
+def test_instrument_shadow_state_invalid_type():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(TypeError):
+        inst.shadow_state = 1
+
+
+def test_instrument_raw_units():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "CURR?",
+                "CURR?",
+                "CURR 2.000000e-03"
+            ],
+            [
+                "1.5",
+                "1.5"
+            ]
+    ) as inst:
+        assert inst.raw_units is False
+        unit_eq(inst.current, 1.5 * u.amp)
+        inst.raw_units = True
+        value = inst.current
+        assert isinstance(value, float)
+        assert value == 1.5
+        inst.current = 2 * u.milliamp
+
+
+def test_instrument_raw_units_channel():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "CH0:SCALE?"
+            ],
+            [
+                "0.5"
+            ]
+    ) as inst:
+        inst.raw_units = True
+        value = inst.channel[0].scale
+        assert isinstance(value, float)
+        assert value == 0.5
+
+
+def test_instrument_raw_units_context_overrides():
+    with expected_protocol(
+            CachedInstrument,
+            [
+                "CURR?",
+                "CURR?"
+            ],
+            [
+                "1.5",
+                "1.5"
+            ]
+    ) as inst:
+        inst.raw_units = True
+        with raw_units(False):
+            unit_eq(inst.current, 1.5 * u.amp)
+        inst.raw_units = False
+        with raw_units():
+            value = inst.current
+        assert isinstance(value, float)
+        assert value == 1.5
+
+
+def test_instrument_raw_units_invalid_type():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(TypeError):
+        inst.raw_units = 1
+
+
 # PROPERTIES #
 
 def test_instrument_timeout():
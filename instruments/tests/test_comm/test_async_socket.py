@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the asyncio socket communication layer
+"""
+
+# IMPORTS ####################################################################
+
+
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+
+import instruments as ik
+import instruments.units as u
+from instruments.abstract_instruments.comm import (
+    AsyncSocketCommunicator, run_async
+)
+from instruments.tests import unit_eq
+from instruments.util_fns import (
+    async_getattr, async_setattr, bool_property, unitful_property
+)
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+RESPONSES = {
+    b"*IDN?": b"MOCK,INSTRUMENT,0,1.0\n",
+    b"OUTP?": b"ON\n",
+    b"VOLT?": b"+1.50000E+00\n",
+    b"LONG?": b"x" * 200000 + b"\n",
+    b"CURV?": b"#210" + struct.pack(">5h", 0, 1, 2, 3, 4) + b"\n",
+}
+
+
+class MockInstrument(ik.generic_scpi.SCPIInstrument):
+    """
+    Instrument with a few property factory properties, for testing.
+    """
+    output = bool_property("OUTP")
+    voltage = unitful_property("VOLT", u.volt)
+
+
+async def _serve(received, handlers):
+    async def handler(reader, writer):
+        handlers.append(asyncio.current_task())
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            line = line.rstrip(b"\n")
+            received.append(line)
+            if line in RESPONSES:
+                writer.write(RESPONSES[line])
+                await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _run_with_server(test):
+    async def main():
+        received, handlers = [], []
+        server, port = await _serve(received, handlers)
+        try:
+            result = await test(port)
+            # Tests close their connections, so that the handlers finish
+            # once they have processed everything that was sent.
+            await asyncio.wait_for(asyncio.gather(*handlers), 5)
+            return result, received
+        finally:
+            server.close()
+            await server.wait_closed()
+    return asyncio.run(main())
+
+
+def test_asyncsocketcomm_init_wrong_type():
+    with pytest.raises(TypeError):
+        _ = AsyncSocketCommunicator("derp", None)
+
+
+def test_asyncsocketcomm_query_async():
+    async def test(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        comm = AsyncSocketCommunicator(reader, writer)
+        assert comm.address[1] == port
+        resp = await comm.query_async("*IDN?")
+        await comm.sendcmd_async("*RST")
+        await comm.write_raw_async(b"OUTP?\n")
+        raw = await comm.read_raw_async(2)
+        rest = await comm.read_async()
+        comm.close()
+        return resp, raw, rest
+
+    (resp, raw, rest), received = _run_with_server(test)
+    assert resp == "MOCK,INSTRUMENT,0,1.0"
+    assert raw == b"ON"
+    assert rest == ""
+    assert received == [b"*IDN?", b"*RST", b"OUTP?"]
+
+
+def test_asyncsocketcomm_read_raw_async_long_response():
+    async def test(port):
+        reader, writer = await asyncio.open_connection(
+            "127.0.0.1", port, limit=1024
+        )
+        comm = AsyncSocketCommunicator(reader, writer)
+        await comm.write_raw_async(b"LONG?\n")
+        resp = await comm.read_raw_async()
+        comm.close()
+        return resp
+
+    resp, _ = _run_with_server(test)
+    assert resp == b"x" * 200000
+
+
+def test_asyncsocketcomm_timeout():
+    async def test(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        comm = AsyncSocketCommunicator(reader, writer, timeout=0.05)
+        unit_eq(comm.timeout, 0.05 * u.second)
+        with pytest.raises(IOError):
+            await comm.query_async("SILENT?")
+        comm.timeout = None
+        assert comm.timeout is None
+        comm.close()
+
+    _run_with_server(test)
+
+
+def test_asyncsocketcomm_blocking_io_outside_run_async():
+    async def test(port):
+        inst = await ik.Instrument.open_tcpip_async("127.0.0.1", port)
+        with pytest.raises(RuntimeError):
+            inst.query("*IDN?")
+        inst._file.close()
+
+    _run_with_server(test)
+
+
+def test_instrument_open_tcpip_async():
+    async def test(port):
+        inst = await MockInstrument.open_tcpip_async("127.0.0.1", port)
+        assert isinstance(inst._file, AsyncSocketCommunicator)
+        output = await async_getattr(inst, "output")
+        voltage = await async_getattr(inst, "voltage")
+        await async_setattr(inst, "voltage", 2 * u.volt)
+        await inst.sendcmd_async("*CLS")
+        inst._file.close()
+        return output, voltage
+
+    (output, voltage), received = _run_with_server(test)
+    assert output is True
+    unit_eq(voltage, 1.5 * u.volt)
+    assert received == [b"OUTP?", b"VOLT?", b"VOLT 2.000000e+00", b"*CLS"]
+
+
+def test_async_getattr_rejects_other_properties():
+    async def test(port):
+        inst = await MockInstrument.open_tcpip_async("127.0.0.1", port)
+        # The name property is not made by a property factory.
+        with pytest.raises(TypeError):
+            await async_getattr(inst, "name")
+        with pytest.raises(TypeError):
+            await async_setattr(inst, "name", "derp")
+        inst._file.close()
+
+    _, received = _run_with_server(test)
+    assert received == []
+
+
+def test_instrument_binblockread_async():
+    async def test(port):
+        inst = await ik.Instrument.open_tcpip_async("127.0.0.1", port)
+        await inst.sendcmd_async("CURV?")
+        data = await inst.binblockread_async(2)
+        inst._file.close()
+        return data
+
+    data, _ = _run_with_server(test)
+    np.testing.assert_array_equal(data, [0, 1, 2, 3, 4])
+
+
+def test_instrument_query_async_gather():
+    async def test(port):
+        insts = await asyncio.gather(*(
+            ik.Instrument.open_tcpip_async("127.0.0.1", port)
+            for _ in range(5)
+        ))
+        # Several concurrent queries on each instrument must not interleave.
+        names = await asyncio.gather(*(
+            inst.query_async(cmd) for inst in insts
+            for cmd in ("*IDN?", "OUTP?")
+        ))
+        for inst in insts:
+            inst._file.close()
+        return names
+
+    names, _ = _run_with_server(test)
+    assert names == ["MOCK,INSTRUMENT,0,1.0", "ON"] * 5
+
+
+def test_run_async_nondeterministic_io():
+    async def test(port):
+        inst = await ik.Instrument.open_tcpip_async("127.0.0.1", port)
+        commands = iter(["*IDN?", "OUTP?", "VOLT?"])
+
+        def flaky():
+            inst.query(next(commands))
+            return inst.query("OUTP?")
+
+        with pytest.raises(RuntimeError):
+            await run_async(flaky)
+        inst._file.close()
+
+    _run_with_server(test)
+
+
+def test_run_async_single_io_operation():
+    async def test(port):
+        inst = await ik.Instrument.open_tcpip_async("127.0.0.1", port)
+        calls = []
+
+        def getter():
+            calls.append(None)
+            return inst.query("*IDN?")
+
+        def two_queries():
+            inst.query("*IDN?")
+            return inst.query("OUTP?")
+
+        name = await run_async(getter)
+        with pytest.raises(RuntimeError):
+            await run_async(two_queries)
+        inst._file.close()
+        return name, len(calls)
+
+    (name, calls), received = _run_with_server(test)
+    assert name == "MOCK,INSTRUMENT,0,1.0"
+    # The blocking code is called twice, but only performs its query once.
+    assert calls == 2
+    assert received == [b"*IDN?", b"*IDN?"]
+
+
+def test_asyncsocketcomm_transaction_nested():
+    async def test(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        comm = AsyncSocketCommunicator(reader, writer)
+        async with comm.transaction():
+            async with comm.transaction():
+                await comm.write_raw_async(b"OUTP?\n")
+            other = asyncio.ensure_future(comm.query_async("*IDN?"))
+            await asyncio.sleep(0.01)
+            # The other task waits for the transaction to end.
+            assert not other.done()
+            resp = await comm.read_async()
+        name = await other
+        comm.close()
+        return resp, name
+
+    (resp, name), received = _run_with_server(test)
+    assert resp == "ON"
+    assert name == "MOCK,INSTRUMENT,0,1.0"
+    assert received == [b"OUTP?", b"*IDN?"]
+
+
+def test_instrument_query_async_prompt():
+    async def test(port):
+        inst = await ik.Instrument.open_tcpip_async("127.0.0.1", port)
+        inst.prompt = "O"
+        # The response to OUTP? is consumed as a prompt.
+        await inst.sendcmd_async("OUTP?")
+        resp = await inst.read_async()
+        inst.prompt = None
+        inst._file.close()
+        return resp
+
+    resp, _ = _run_with_server(test)
+    assert resp == "N"
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the communicator statistics
+"""
+
+# IMPORTS ####################################################################
+
+
+import io
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import (
+    AbstractCommunicator, CommStats, FileCommunicator, GPIBCommunicator,
+    LatencyHistogram, LoopbackCommunicator, aggregate_stats
+)
+from instruments.tests import expected_protocol
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def test_latency_histogram():
+    hist = LatencyHistogram()
+    assert hist.mean_ns is None
+    assert hist.percentile(50) is None
+    for duration in (0, 3, 5, 100):
+        hist.record(duration)
+    assert hist.count == 4
+    assert hist.total_ns == 108
+    assert hist.mean_ns == 27
+    assert hist.min_ns == 0
+    assert hist.max_ns == 100
+    assert hist.buckets == {1: 1, 4: 1, 8: 1, 128: 1}
+    assert hist.percentile(50) == 4
+    assert hist.percentile(100) == 100
+
+
+def test_latency_histogram_merge():
+    hist = LatencyHistogram()
+    hist.record(10)
+    other = LatencyHistogram()
+    other.record(1000)
+    hist.merge(other)
+    assert hist.count == 2
+    assert hist.min_ns == 10
+    assert hist.max_ns == 1000
+    copy = hist.copy()
+    copy.record(1)
+    assert hist.count == 2
+
+
+def test_latency_histogram_percentile_invalid():
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(101)
+
+
+def test_comm_stats_disabled_by_default():
+    with expected_protocol(ik.Instrument, ["*CLS"], []) as inst:
+        assert inst.stats_enabled is False
+        assert inst.stats is None
+        inst.sendcmd("*CLS")
+
+
+def test_comm_stats_counts():
+    with expected_protocol(
+            ik.Instrument,
+            [
+                "VOLT 1",
+                "VOLT 2",
+                "*IDN?"
+            ],
+            [
+                "MOCK"
+            ]
+    ) as inst:
+        inst.stats_enabled = True
+        inst.sendcmd("VOLT 1")
+        inst.sendcmd("VOLT 2")
+        assert inst.query("*IDN?") == "MOCK"
+        stats = inst.stats
+        assert stats.commands == {"VOLT": 2, "*IDN?": 1}
+        assert stats.bytes_out == 20
+        assert stats.bytes_in == 5
+        assert stats.write.count == 3
+        assert stats.first_byte.count == 1
+        assert stats.query.count == 1
+
+
+def test_comm_stats_snapshot_reset():
+    with expected_protocol(ik.Instrument, ["*CLS", "*CLS"], []) as inst:
+        inst.stats_enabled = True
+        inst.sendcmd("*CLS")
+        snapshot = inst.stats.snapshot()
+        inst.stats.reset()
+        inst.sendcmd("*CLS")
+        assert snapshot.commands == {"*CLS": 1}
+        assert snapshot.bytes_out == 5
+        assert inst.stats.commands == {"*CLS": 1}
+        assert inst.stats.write.count == 1
+
+
+def test_comm_stats_disable():
+    with expected_protocol(ik.Instrument, ["*CLS"], []) as inst:
+        inst.stats_enabled = True
+        stats = inst.stats
+        inst.stats_enabled = False
+        assert inst.stats is None
+        inst.sendcmd("*CLS")
+        assert stats.bytes_out == 0
+
+
+def test_comm_stats_readinto_counted_once():
+    inst = ik.Instrument.open_test(io.BytesIO(b"abcd"), io.BytesIO())
+    inst.stats_enabled = True
+    buf = bytearray(4)
+    assert inst._file.readinto(buf) == 4
+    assert buf == b"abcd"
+    assert inst.stats.bytes_in == 4
+
+
+def test_comm_stats_readinto_without_filelike_readinto():
+    class Reader:
+        """
+        File-like object without readinto.
+        """
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def read(self, size=-1):
+            return self._data.read(size)
+
+    comm = FileCommunicator(Reader(b"abcd"))
+    comm.stats_enabled = True
+    buf = bytearray(4)
+    assert comm.readinto(buf) == 4
+    assert buf == b"abcd"
+    assert comm.stats.bytes_in == 4
+    comm.stats_enabled = False
+
+
+def test_comm_stats_gpib_eoi_terminator():
+    adapter = LoopbackCommunicator(stdin=io.BytesIO(b"MOCK\r"),
+                                   stdout=io.BytesIO())
+    comm = GPIBCommunicator(adapter, 1, model="pl")
+    assert comm.terminator == "eoi"
+    comm.stats_enabled = True
+    assert comm.query("*IDN?") == "MOCK"
+    # The response and the carriage return ending it on the connection to
+    # the adapter, rather than the "eoi" pseudo-terminator.
+    assert comm.stats.bytes_in == 5
+    comm.stats_enabled = False
+
+
+def test_comm_stats_legacy_read_raw_write_raw():
+    # pylint: disable=abstract-method,abstract-class-instantiated
+    class LegacyCommunicator(AbstractCommunicator):
+        """
+        Implements read_raw and write_raw, as communicators did before
+        _read_raw and _write_raw were introduced.
+        """
+        address = terminator = timeout = None
+
+        def __init__(self):
+            super(LegacyCommunicator, self).__init__()
+            self.written = b""
+
+        def read_raw(self, size=-1):
+            return b"MOCK"
+
+        def write_raw(self, msg):
+            self.written += msg
+
+        def _sendcmd(self, msg):
+            self.write_raw(msg.encode("utf-8"))
+
+        def _query(self, msg, size=-1):
+            self._sendcmd(msg)
+            return self.read_raw(size).decode("utf-8")
+
+        def flush_input(self):
+            pass
+
+    comm = LegacyCommunicator()
+    comm.stats_enabled = True
+    assert comm.query("*IDN?") == "MOCK"
+    assert comm.written == b"*IDN?"
+    assert comm.stats.bytes_out == 5
+    assert comm.stats.bytes_in == 4
+    comm.stats_enabled = False
+
+
+def test_comm_stats_invalid_type():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(TypeError):
+        inst.stats_enabled = 1
+
+
+def test_comm_stats_aggregate():
+    inst1 = ik.Instrument.open_test()
+    inst2 = ik.Instrument.open_test()
+    inst1.stats_enabled = True
+    inst2.stats_enabled = True
+    inst1.sendcmd("*CLS")
+    inst2.sendcmd("*RST")
+    inst2.sendcmd("*RST")
+    total = aggregate_stats()
+    assert isinstance(total, CommStats)
+    assert total.commands["*CLS"] >= 1
+    assert total.commands["*RST"] >= 2
+    inst1.stats_enabled = False
+    inst2.stats_enabled = False
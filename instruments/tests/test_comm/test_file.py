@@ -7,6 +7,8 @@ Unit tests for the file communication layer
 # IMPORTS ####################################################################
 
 
+import io
+
 import pytest
 
 from instruments.abstract_instruments.comm import FileCommunicator
@@ -95,6 +97,27 @@ def test_filecomm_read_raw():
     comm._filelike.read.assert_called_with(10)
 
 
+def test_filecomm_readinto():
+    comm = FileCommunicator(io.BytesIO(b"abcdef"))
+
+    buf = bytearray(4)
+    assert comm.readinto(buf) == 4
+    assert buf == b"abcd"
+    assert comm.readinto(buf) == 2
+    assert buf[:2] == b"ef"
+
+
+def test_filecomm_readinto_without_filelike_readinto():
+    filelike = mock.MagicMock(spec=["read"])
+    filelike.read.return_value = b"abcd"
+    comm = FileCommunicator(filelike)
+
+    buf = bytearray(4)
+    assert comm.readinto(buf) == 4
+    assert buf == b"abcd"
+    filelike.read.assert_called_with(4)
+
+
 def test_filecomm_write_raw():
     comm = FileCommunicator(mock.MagicMock())
 
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the GPIB bus scheduler
+"""
+
+# IMPORTS ####################################################################
+
+
+import threading
+import time
+
+import pytest
+
+from instruments.abstract_instruments.comm import (
+    GPIBBusScheduler, GPIBCommunicator
+)
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def _wait_for_depth(bus, depth):
+    deadline = time.time() + 5
+    while bus.queue_depth() < depth:
+        assert time.time() < deadline, "Timed out waiting for queued calls."
+        time.sleep(0.001)
+
+
+def test_gpibbus_run():
+    bus = GPIBBusScheduler()
+    assert bus.run(1, lambda x, y=0: x + y, 1, y=2) == 3
+    assert bus.address == 1
+
+    stats = bus.statistics()
+    assert stats[1]["count"] == 1
+    assert stats[1]["depth"] == 0
+    assert stats[1]["max_depth"] == 1
+    assert stats[1]["max_wait"] >= 0
+
+
+def test_gpibbus_run_reentrant():
+    bus = GPIBBusScheduler()
+    assert bus.run(1, lambda: bus.run(2, lambda: "inner")) == "inner"
+    assert bus.statistics()[1]["count"] == 1
+    assert 2 not in bus.statistics()
+
+
+def test_gpibbus_run_releases_on_exception():
+    bus = GPIBBusScheduler()
+
+    def fail():
+        raise IOError
+
+    with pytest.raises(IOError):
+        bus.run(1, fail)
+    assert bus.run(1, lambda: "ok") == "ok"
+
+
+def test_gpibbus_lock_reentrant():
+    bus = GPIBBusScheduler()
+    lock = bus.lock(3)
+    with lock:
+        with lock:
+            assert bus.address == 3
+        assert bus.run(4, lambda: "nested") == "nested"
+    assert bus.statistics()[3]["count"] == 1
+    assert bus.run(4, lambda: "ok") == "ok"
+    assert bus.address == 4
+
+
+def test_gpibbus_release_not_held():
+    bus = GPIBBusScheduler()
+    with pytest.raises(RuntimeError):
+        bus.release()
+
+
+def test_gpibbus_communicator_lock():
+    comm = GPIBCommunicator(mock.MagicMock(), 5)
+    with comm.lock:
+        assert comm.bus.address == 5
+
+
+def test_gpibbus_max_burst_invalid():
+    with pytest.raises(ValueError):
+        _ = GPIBBusScheduler(max_burst=0)
+
+
+def _run_queued(bus, first_address, queued, max_wait=5):
+    """
+    Holds the bus with a transaction for ``first_address``, queues one
+    transaction for each address in ``queued`` from separate threads,
+    then releases the bus and returns the order the addresses were served.
+    """
+    order = []
+    release = threading.Event()
+    holder = threading.Thread(
+        target=bus.run, args=(first_address, release.wait, max_wait)
+    )
+    holder.start()
+    while bus.address != first_address:
+        time.sleep(0.001)
+
+    threads = []
+    for idx, address in enumerate(queued):
+        thread = threading.Thread(
+            target=bus.run, args=(address, order.append, address)
+        )
+        thread.start()
+        threads.append(thread)
+        _wait_for_depth(bus, idx + 1)
+
+    assert bus.queue_depth() == len(queued)
+    assert bus.queue_depth(queued[0]) == queued.count(queued[0])
+    release.set()
+    holder.join()
+    for thread in threads:
+        thread.join()
+    return order
+
+
+def test_gpibbus_groups_by_address():
+    bus = GPIBBusScheduler()
+    order = _run_queued(bus, 1, [2, 1, 2, 1])
+    assert order == [1, 1, 2, 2]
+    assert bus.address_switches == 1
+    assert bus.statistics()[2]["max_depth"] == 2
+
+
+def test_gpibbus_max_burst():
+    bus = GPIBBusScheduler(max_burst=2)
+    order = _run_queued(bus, 1, [2, 1, 1, 1])
+    assert order == [1, 2, 1, 1]
+
+
+def test_gpibbus_reset_statistics():
+    bus = GPIBBusScheduler()
+    bus.run(1, lambda: None)
+    bus.run(2, lambda: None)
+    assert bus.address_switches == 1
+
+    bus.reset_statistics()
+    assert bus.statistics() == {}
+    assert bus.address_switches == 0
+
+
+def test_gpibbus_shared_by_communicators():
+    adapter = mock.MagicMock()
+    comm1 = GPIBCommunicator(adapter, 1)
+    comm2 = GPIBCommunicator(adapter, 2)
+    assert comm1.bus is comm2.bus
+    assert comm1._adapter_state is comm1.bus.state
+
+    assert GPIBCommunicator(mock.MagicMock(), 1).bus is not comm1.bus
+
+
+def test_gpibbus_threads_do_not_interleave():
+    adapter = mock.MagicMock()
+    comm1 = GPIBCommunicator(adapter, 1, model="pl")
+    comm2 = GPIBCommunicator(adapter, 2, model="pl")
+    comm1._version = comm2._version = 5
+
+    log = []
+    adapter.sendcmd = mock.MagicMock(side_effect=log.append)
+
+    def read(size=-1):  # pylint: disable=unused-argument
+        # The response belongs to the last address selected on the adapter.
+        addr = [msg for msg in log if msg.startswith("++addr")][-1]
+        time.sleep(0.0005)
+        return addr.split()[-1]
+
+    adapter.read = mock.MagicMock(side_effect=read)
+
+    def poll(comm, results):
+        for _ in range(20):
+            results.append(comm.query("VAL?"))
+
+    results1, results2 = [], []
+    threads = [
+        threading.Thread(target=poll, args=(comm1, results1)),
+        threading.Thread(target=poll, args=(comm2, results2))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results1 == ["1"] * 20
+    assert results2 == ["2"] * 20
+    stats = comm1.bus.statistics()
+    assert stats[1]["count"] >= 20
+    assert stats[2]["count"] >= 20
@@ -167,6 +167,7 @@ def test_gpibusbcomm_eos_invalid():
 def test_gpibusbcomm_eos_old_firmware():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 4
+    comm.invalidate_adapter_state()
 
     comm._file.sendcmd = mock.MagicMock()
     comm.eos = "\n"
@@ -240,6 +241,137 @@ def test_gpibusbcomm_sendcmd():
     ])
 
 
+def test_gpibusbcomm_sendcmd_only_changed_settings():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+
+    comm._sendcmd("mock")
+    comm._file.sendcmd = mock.MagicMock()
+    comm._sendcmd("mock")
+    comm._file.sendcmd.assert_called_once_with("mock")
+
+    comm.address = 2
+    comm._sendcmd("mock")
+    assert comm._file.sendcmd.call_args_list[1:] == [
+        mock.call("+a:2"),
+        mock.call("mock")
+    ]
+
+
+def test_gpibusbcomm_adapter_state_shared():
+    adapter = mock.MagicMock()
+    comm1 = GPIBCommunicator(adapter, 1)
+    comm2 = GPIBCommunicator(adapter, 2)
+    comm1._version = comm2._version = 5
+    comm2.timeout = 3 * u.second
+
+    comm1._sendcmd("one")
+    adapter.sendcmd = mock.MagicMock()
+    comm2._sendcmd("two")
+    comm1._sendcmd("one")
+    adapter.sendcmd.assert_has_calls([
+        mock.call("+a:2"),
+        mock.call("++read_tmo_ms 3000"),
+        mock.call("two"),
+        mock.call("+a:1"),
+        mock.call("++read_tmo_ms 1000"),
+        mock.call("one")
+    ])
+    assert adapter.sendcmd.call_count == 6
+    unit_eq(adapter.timeout.rescale(u.second), 1 * u.second)
+
+
+def test_gpibusbcomm_invalidate_adapter_state():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+
+    comm._sendcmd("mock")
+    comm.invalidate_adapter_state()
+    comm._file.sendcmd = mock.MagicMock()
+    comm._sendcmd("mock")
+    assert comm._file.sendcmd.call_count == 5
+
+
+def test_gpibusbcomm_command_delay(mocker):
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+    comm._sendcmd("mock")
+    sleep = mocker.patch("time.sleep")
+
+    unit_eq(comm.command_delay, 0 * u.second)
+    comm._sendcmd("mock")
+    sleep.assert_not_called()
+
+    comm.command_delay = 5 * u.millisecond
+    unit_eq(comm.command_delay, 0.005 * u.second)
+    comm._sendcmd("mock")
+    sleep.assert_called_once_with(0.005)
+
+    with pytest.raises(ValueError):
+        comm.command_delay = -1
+
+
+def test_gpibusbcomm_auto_read():
+    comm = GPIBCommunicator(mock.MagicMock(), 1, model="pl")
+    assert comm.auto_read is False
+
+    comm.auto_read = True
+    assert comm.auto_read is True
+
+    comm = GPIBCommunicator(mock.MagicMock(), 1, model="pl", auto_read=True)
+    assert comm.auto_read is True
+
+    with pytest.raises(TypeError):
+        comm.auto_read = 1
+
+
+def test_gpibusbcomm_auto_read_galvant():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    with pytest.raises(NotImplementedError):
+        comm.auto_read = True
+
+
+def test_gpibusbcomm_query_auto_read():
+    comm = GPIBCommunicator(mock.MagicMock(), 1, model="pl", auto_read=True)
+    comm._file.read = mock.MagicMock(return_value="answer")
+
+    assert comm._query("mock?") == "answer"
+    comm._file.sendcmd.assert_has_calls([
+        mock.call("++addr 1"),
+        mock.call("++eoi 1"),
+        mock.call("++read_tmo_ms 1000"),
+        mock.call("++auto 1"),
+        mock.call("mock?")
+    ])
+    comm._file.read.assert_called_with(-1)
+
+    # Repeated queries need neither ++read nor ++auto switching.
+    comm._file.sendcmd = mock.MagicMock()
+    assert comm._query("mock?") == "answer"
+    comm._file.sendcmd.assert_called_once_with("mock?")
+
+    # Plain commands switch the adapter back to manual reads.
+    comm._file.sendcmd = mock.MagicMock()
+    comm._sendcmd("mock")
+    assert comm._file.sendcmd.call_args_list == [
+        mock.call("++auto 0"),
+        mock.call("mock")
+    ]
+
+
+def test_gpibusbcomm_query_prologix_manual_read():
+    comm = GPIBCommunicator(mock.MagicMock(), 1, model="pl")
+    comm._file.read = mock.MagicMock(return_value="answer")
+    comm._sendcmd("mock")
+    comm._file.sendcmd = mock.MagicMock()
+
+    assert comm._query("mock?") == "answer"
+    assert comm._file.sendcmd.call_args_list == [
+        mock.call("mock?"),
+        mock.call("++read")
+    ]
+
+
 def test_gpibusbcomm_sendcmd_empty_string():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 5
@@ -284,3 +416,30 @@ def test_serialcomm_flush_input():
 
     comm.flush_input()
     comm._file.flush_input.assert_called_with()
+
+
+def test_gpibusbcomm_write_block():
+    adapter = mock.MagicMock()
+    other = GPIBCommunicator(adapter, 2, model="pl")
+    comm = GPIBCommunicator(adapter, 1, model="pl")
+    other.sendcmd("*CLS")
+    adapter.sendcmd = mock.MagicMock()
+    adapter.write_raw = mock.MagicMock()
+
+    comm.write_block(b"DATA #14", bytearray(b"\r\n\x1b+"), chunk_size=2)
+    # Only the address differs from the settings applied for the other
+    # instrument on the adapter.
+    adapter.sendcmd.assert_called_once_with("++addr 1")
+    written = [bytes(call[0][0]) for call in adapter.write_raw.call_args_list]
+    assert written == [b"DATA #14", b"\x1b\r\x1b\n", b"\x1b\x1b\x1b+", b"\r"]
+    assert comm.terminator == "eoi"
+
+
+def test_gpibusbcomm_write_block_command_delay(mocker):
+    sleep = mocker.patch("time.sleep")
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._command_delay = 0.01
+    sleep.reset_mock()
+
+    comm.write_block(b"A", b"")
+    sleep.assert_called_with(0.01)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the recording and replay communicators
+"""
+
+# IMPORTS ####################################################################
+
+
+import io
+
+import numpy as np
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import (
+    RecordingCommunicator, ReplayCommunicator
+)
+from instruments.tests import expected_protocol
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def _record_session():
+    """
+    Records a session with a command, queries and a binary block.
+    """
+    with expected_protocol(
+            ik.Instrument,
+            [
+                "*CLS",
+                "*IDN?",
+                "CURV?",
+                "*IDN?"
+            ],
+            [
+                "MOCK",
+                b"#14" + bytes.fromhex("00010002"),
+                "MOCK"
+            ]
+    ) as inst:
+        recording = inst.start_recording()
+        inst.sendcmd("*CLS")
+        assert inst.query("*IDN?") == "MOCK"
+        inst.sendcmd("CURV?")
+        np.testing.assert_array_equal(inst.binblockread(2), [1, 2])
+        inst.read()
+        assert inst.query("*IDN?") == "MOCK"
+        assert inst.stop_recording() is recording
+    return recording
+
+
+def _run_session(inst):
+    inst.sendcmd("*CLS")
+    assert inst.query("*IDN?") == "MOCK"
+    inst.sendcmd("CURV?")
+    np.testing.assert_array_equal(inst.binblockread(2), [1, 2])
+    inst.read()
+    assert inst.query("*IDN?") == "MOCK"
+
+
+def test_recording_events():
+    recording = _record_session()
+    kinds = [event.kind for event in recording.events]
+    assert kinds[:3] == [
+        RecordingCommunicator.SENDCMD,
+        RecordingCommunicator.QUERY,
+        RecordingCommunicator.SENDCMD
+    ]
+    assert recording.events[1].msg == b"*IDN?"
+    assert recording.events[1].data == b"MOCK"
+    assert all(event.duration_ns >= 0 for event in recording.events)
+
+
+def test_replay_strict():
+    inst = ik.Instrument.open_replay(_record_session())
+    _run_session(inst)
+    assert inst._file.remaining == 0
+
+
+def test_replay_save_load():
+    buf = io.BytesIO()
+    _record_session().save(buf)
+    buf.seek(0)
+    inst = ik.Instrument.open_replay(buf)
+    assert inst.terminator == "\n"
+    _run_session(inst)
+
+
+def test_replay_strict_diverged():
+    inst = ik.Instrument.open_replay(_record_session())
+    with pytest.raises(IOError):
+        inst.query("*IDN?")
+
+
+def test_replay_exhausted():
+    inst = ik.Instrument.open_replay(_record_session())
+    _run_session(inst)
+    with pytest.raises(IOError):
+        inst.sendcmd("*CLS")
+
+
+def test_replay_not_strict():
+    inst = ik.Instrument.open_replay(_record_session(), strict=False)
+    assert inst.query("*IDN?") == "MOCK"
+    assert inst.query("*IDN?") == "MOCK"
+    assert inst.query("*IDN?") == "MOCK"
+    inst.sendcmd("UNRECORDED")
+    np.testing.assert_array_equal(inst.binblockread(2), [1, 2])
+    with pytest.raises(IOError):
+        inst.query("UNRECORDED?")
+
+
+@mock.patch("instruments.abstract_instruments.comm.replay_communicator.time")
+def test_replay_realtime(mock_time):
+    recording = _record_session()
+    inst = ik.Instrument.open_replay(recording, realtime=True)
+    _run_session(inst)
+    assert mock_time.sleep.call_count == sum(
+        1 for event in recording.events if event.duration_ns > 0
+    )
+
+
+def test_recording_already_started():
+    inst = ik.Instrument.open_test()
+    inst.start_recording()
+    with pytest.raises(RuntimeError):
+        inst.start_recording()
+    inst.stop_recording()
+    with pytest.raises(RuntimeError):
+        inst.stop_recording()
+
+
+def test_replay_load_invalid():
+    with pytest.raises(ValueError):
+        _ = ReplayCommunicator(io.BytesIO(bytes(10)))
+
+
+def test_replay_binblockwrite():
+    with expected_protocol(
+            ik.Instrument,
+            [b"CURVE #14" + bytes.fromhex("00010002")],
+            []
+    ) as inst:
+        recording = inst.start_recording()
+        inst.binblockwrite("CURVE ", [1, 2], fmt=">h")
+        inst.stop_recording()
+    assert recording.events[0].kind == RecordingCommunicator.WRITE_BLOCK
+    assert recording.events[0].msg == b"CURVE #14" + bytes.fromhex("00010002")
+
+    inst = ik.Instrument.open_replay(recording)
+    inst.binblockwrite("CURVE ", [1, 2], fmt=">h")
+    assert inst._file.remaining == 0
+
+    inst = ik.Instrument.open_replay(recording)
+    with pytest.raises(IOError):
+        inst.binblockwrite("CURVE ", [1, 3], fmt=">h")
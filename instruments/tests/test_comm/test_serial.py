@@ -97,6 +97,23 @@ def test_serialcomm_read_raw():
     comm._conn.read.assert_called_with(10)
 
 
+def test_serialcomm_readinto():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._rx_buf += b"ab"
+
+    def readinto(view):
+        view[:2] = b"cd"
+        return 2
+
+    comm._conn.readinto = mock.MagicMock(side_effect=readinto)
+
+    buf = bytearray(4)
+    assert comm.readinto(buf) == 4
+    assert buf == b"abcd"
+    assert comm._rx_buf == b""
+
+
 def test_loopbackcomm_read_raw_2char_terminator():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
@@ -108,6 +125,60 @@ def test_loopbackcomm_read_raw_2char_terminator():
     assert comm._conn.read.call_count == 5
 
 
+def test_serialcomm_buffered():
+    comm = SerialCommunicator(serial.Serial())
+    assert comm.buffered is False
+
+    comm.buffered = True
+    assert comm.buffered is True
+
+    comm = SerialCommunicator(serial.Serial(), buffered=True)
+    assert comm.buffered is True
+
+    with pytest.raises(TypeError):
+        comm.buffered = 1
+
+
+def test_serialcomm_read_raw_buffered():
+    comm = SerialCommunicator(serial.Serial(), buffered=True)
+    comm._conn = mock.MagicMock()
+    type(comm._conn).in_waiting = mock.PropertyMock(side_effect=[0, 7, 3])
+    comm._conn.read = mock.MagicMock(
+        side_effect=[b"a", b"bc\r\nde\r", b"\nfg"]
+    )
+    comm._terminator = "\r\n"
+
+    assert comm.read_raw() == b"abc"
+    assert comm.read_raw() == b"de"
+    comm._conn.read.assert_has_calls([mock.call(1), mock.call(7), mock.call(3)])
+    assert comm._rx_buf == b"fg"
+
+    comm._conn.read = mock.MagicMock(return_value=b"h")
+    assert comm.read_raw(3) == b"fgh"
+    comm._conn.read.assert_called_with(1)
+    assert comm._rx_buf == b""
+
+
+def test_serialcomm_read_raw_buffered_empty_terminator():
+    comm = SerialCommunicator(serial.Serial(), buffered=True)
+    comm._conn = mock.MagicMock()
+    type(comm._conn).in_waiting = mock.PropertyMock(side_effect=[3, 0, 0])
+    comm._conn.read = mock.MagicMock(side_effect=[b"abc", b"d", b""])
+    comm._terminator = ""
+
+    assert comm.read_raw() == b"abcd"
+
+
+def test_serialcomm_read_raw_buffered_timeout():
+    comm = SerialCommunicator(serial.Serial(), buffered=True)
+    comm._conn = mock.MagicMock()
+    type(comm._conn).in_waiting = mock.PropertyMock(return_value=0)
+    comm._conn.read = mock.MagicMock(side_effect=[b"a", b""])
+
+    with pytest.raises(IOError):
+        _ = comm.read_raw(-1)
+
+
 def test_serialcomm_read_raw_timeout():
     with pytest.raises(IOError):
         comm = SerialCommunicator(serial.Serial())
@@ -162,6 +233,8 @@ def test_serialcomm_tell():
 def test_serialcomm_flush_input():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
+    comm._rx_buf += b"stale"
     comm.flush_input()
 
     comm._conn.flushInput.assert_called_with()
+    assert comm._rx_buf == b""
@@ -91,13 +91,32 @@ def test_socketcomm_close():
     comm._conn.close.assert_called_with()
 
 
+def test_socketcomm_chunk_size():
+    comm = SocketCommunicator(socket.socket())
+    assert comm.chunk_size == 4096
+
+    comm.chunk_size = 65536
+    assert comm.chunk_size == 65536
+
+    comm = SocketCommunicator(socket.socket(), chunk_size=16)
+    assert comm.chunk_size == 16
+
+
+def test_socketcomm_chunk_size_invalid():
+    comm = SocketCommunicator(socket.socket())
+    with pytest.raises(TypeError):
+        comm.chunk_size = 1.5
+    with pytest.raises(ValueError):
+        comm.chunk_size = 0
+
+
 def test_socketcomm_read_raw():
     comm = SocketCommunicator(socket.socket())
     comm._conn = mock.MagicMock()
     comm._conn.recv = mock.MagicMock(side_effect=[b"a", b"b", b"c", b"\n"])
 
     assert comm.read_raw() == b"abc"
-    comm._conn.recv.assert_has_calls([mock.call(1)]*4)
+    comm._conn.recv.assert_has_calls([mock.call(4096)]*4)
     assert comm._conn.recv.call_count == 4
 
     comm._conn.recv = mock.MagicMock()
@@ -105,6 +124,50 @@ def test_socketcomm_read_raw():
     comm._conn.recv.assert_called_with(10)
 
 
+def test_socketcomm_read_raw_chunked():
+    comm = SocketCommunicator(socket.socket(), chunk_size=8)
+    comm._conn = mock.MagicMock()
+    comm._conn.recv = mock.MagicMock(side_effect=[b"abc\ndef\ngh", b"i\n"])
+
+    assert comm.read_raw() == b"abc"
+    assert comm.read_raw() == b"def"
+    assert comm.read_raw() == b"ghi"
+    comm._conn.recv.assert_has_calls([mock.call(8)]*2)
+    assert comm._conn.recv.call_count == 2
+    assert comm._rx_buf == b""
+
+
+def test_socketcomm_read_raw_sized_uses_buffer():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv = mock.MagicMock(side_effect=[b"ok\n#3abc", b"def"])
+
+    assert comm.read_raw() == b"ok"
+    assert comm.read_raw(2) == b"#3"
+    assert comm.read_raw(6) == b"abcdef"
+    comm._conn.recv.assert_called_with(3)
+
+
+def test_socketcomm_readinto():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv = mock.MagicMock(return_value=b"ok\n#3abc")
+
+    def recv_into(view):
+        view[:3] = b"def"
+        return 3
+
+    comm._conn.recv_into = mock.MagicMock(side_effect=recv_into)
+
+    assert comm.read_raw() == b"ok"
+    assert comm.read_raw(2) == b"#3"
+    buf = bytearray(6)
+    assert comm.readinto(buf) == 6
+    assert buf == b"abcdef"
+    assert comm._rx_buf == b""
+    assert len(comm._conn.recv_into.call_args[0][0]) == 3
+
+
 def test_loopbackcomm_read_raw_2char_terminator():
     comm = SocketCommunicator(socket.socket())
     comm._conn = mock.MagicMock()
@@ -112,10 +175,20 @@ def test_loopbackcomm_read_raw_2char_terminator():
     comm._terminator = "\r\n"
 
     assert comm.read_raw() == b"abc"
-    comm._conn.recv.assert_has_calls([mock.call(1)] * 5)
+    comm._conn.recv.assert_has_calls([mock.call(4096)] * 5)
     assert comm._conn.recv.call_count == 5
 
 
+def test_socketcomm_read_raw_2char_terminator_split_chunks():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv = mock.MagicMock(side_effect=[b"abc\r", b"\nrest"])
+    comm._terminator = "\r\n"
+
+    assert comm.read_raw() == b"abc"
+    assert comm._rx_buf == b"rest"
+
+
 def test_serialcomm_read_raw_timeout():
     with pytest.raises(IOError):
         comm = SocketCommunicator(socket.socket())
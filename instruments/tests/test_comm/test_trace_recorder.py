@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the trace recorder
+"""
+
+# IMPORTS ####################################################################
+
+
+import io
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import TraceRecorder
+from instruments.tests import expected_protocol
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def test_trace_recorder_wraps_around():
+    tracer = TraceRecorder(capacity=2, max_bytes=4)
+    tracer.record(tracer.WRITE, b"first", 10, 15)
+    tracer.record(tracer.READ, b"second", 20, 30)
+    tracer.record(tracer.WRITE, b"third", 40, 41)
+    assert len(tracer) == 2
+    entries = tracer.entries()
+    assert [entry.direction for entry in entries] == ["read", "write"]
+    assert [entry.data for entry in entries] == [b"seco", b"thir"]
+    assert [entry.length for entry in entries] == [6, 5]
+    assert [entry.duration_ns for entry in entries] == [10, 1]
+    assert entries[1].timestamp_ns - entries[0].timestamp_ns == 20
+
+
+def test_trace_recorder_clear():
+    tracer = TraceRecorder()
+    tracer.record(tracer.WRITE, b"data", 0, 1)
+    tracer.clear()
+    assert len(tracer) == 0
+    assert not tracer.entries()
+
+
+def test_trace_recorder_dump_load():
+    tracer = TraceRecorder(max_bytes=3)
+    tracer.record(tracer.WRITE, b"*IDN?\n", 100, 200)
+    tracer.record(tracer.READ, b"MOCK", 300, 1300)
+    buf = io.BytesIO()
+    tracer.dump(buf)
+    buf.seek(0)
+    assert TraceRecorder.load(buf) == tracer.entries()
+
+
+def test_trace_recorder_load_invalid():
+    with pytest.raises(ValueError):
+        TraceRecorder.load(io.BytesIO(bytes(24)))
+
+
+def test_trace_recorder_invalid_args():
+    with pytest.raises(ValueError):
+        _ = TraceRecorder(capacity=0)
+    with pytest.raises(ValueError):
+        _ = TraceRecorder(max_bytes=0x10000)
+
+
+def test_trace_recorder_attached():
+    with expected_protocol(
+            ik.Instrument,
+            [
+                "*IDN?",
+                "*CLS"
+            ],
+            [
+                "MOCK"
+            ]
+    ) as inst:
+        tracer = TraceRecorder()
+        inst.tracer = tracer
+        assert inst.tracer is tracer
+        assert inst.query("*IDN?") == "MOCK"
+        inst.tracer = None
+        inst.sendcmd("*CLS")
+        entries = tracer.entries()
+        assert [entry.direction for entry in entries] == ["write", "read"]
+        assert entries[0].data == b"*IDN?\n"
+        assert entries[1].data == b"MOCK"
+
+
+def test_trace_recorder_with_stats():
+    with expected_protocol(ik.Instrument, ["*CLS", "*CLS"], []) as inst:
+        inst.tracer = TraceRecorder()
+        inst.stats_enabled = True
+        inst.sendcmd("*CLS")
+        inst.tracer = None
+        inst.sendcmd("*CLS")
+        assert inst.stats.bytes_out == 10
+
+
+def test_trace_recorder_invalid_type():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(TypeError):
+        inst.tracer = []
@@ -109,6 +109,14 @@ def test_usbtmccomm_write_raw(mock_usbtmc):
     comm._filelike.write_raw.assert_called_with(b"mock")
 
 
+@mock.patch(patch_path)
+def test_usbtmccomm_write_block(mock_usbtmc):
+    comm = USBTMCCommunicator()
+
+    comm.write_block(b"DATA #13", bytearray(b"abc"), chunk_size=1)
+    comm._filelike.write_raw.assert_called_once_with(b"DATA #13abc")
+
+
 @mock.patch(patch_path)
 def test_usbtmccomm_sendcmd(mock_usbtmc):
     comm = USBTMCCommunicator()
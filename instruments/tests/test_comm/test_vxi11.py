@@ -114,6 +114,14 @@ def test_vxi11comm_write(mock_vxi11):
     comm._inst.write_raw.assert_called_with(b"mock")
 
 
+@mock.patch(import_base)
+def test_vxi11comm_write_block(mock_vxi11):
+    comm = VXI11Communicator()
+
+    comm.write_block(b"DATA #13", bytearray(b"abc"), chunk_size=1)
+    comm._inst.write_raw.assert_called_once_with(b"DATA #13abc")
+
+
 @mock.patch(import_base)
 def test_vxi11comm_sendcmd(mock_vxi11):
     comm = VXI11Communicator()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for batching of SCPI commands
+"""
+
+# IMPORTS ####################################################################
+
+
+import threading
+
+import pytest
+
+import instruments as ik
+import instruments.units as u
+from instruments.tests import expected_protocol, unit_eq
+from instruments.util_fns import bool_property, unitful_property
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+class MockInstrument(ik.generic_scpi.SCPIInstrument):
+    """
+    Instrument with a few property factory properties, for testing.
+    """
+    output = bool_property("OUTP")
+    voltage = unitful_property("VOLT", u.volt)
+
+
+def test_scpi_batch_sets():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "VOLT 1.000000e+00;:OUTP ON;*CLS"
+            ], [
+            ]
+    ) as inst:
+        with inst.batch():
+            inst.voltage = 1 * u.volt
+            inst.output = True
+            inst.clear()
+
+
+def test_scpi_batch_queries():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP OFF;:VOLT?;*IDN?;:OUTP?"
+            ], [
+                '+2.000000E+00;"MOCK;INST";OFF'
+            ]
+    ) as inst:
+        with inst.batch() as batch:
+            inst.output = False
+            voltage = batch.get(inst, "voltage")
+            name = batch.query("*IDN?")
+            output = batch.get(inst, "output")
+            assert not voltage.done
+        unit_eq(voltage.value, 2 * u.volt)
+        assert name.value == '"MOCK;INST"'
+        assert output.value is False
+
+
+def test_scpi_batch_max_length():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "VOLT 1.000000e+00;:OUTP ON",
+                "VOLT?"
+            ], [
+                "+1.000000E+00"
+            ]
+    ) as inst:
+        with inst.batch(max_length=30) as batch:
+            inst.voltage = 1 * u.volt
+            inst.output = True
+            voltage = batch.get(inst, "voltage")
+        unit_eq(voltage.value, 1 * u.volt)
+
+
+def test_scpi_batch_direct_query_flushes():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP ON",
+                "VOLT?",
+                "OUTP OFF"
+            ], [
+                "+1.000000E+00"
+            ]
+    ) as inst:
+        with inst.batch():
+            inst.output = True
+            unit_eq(inst.voltage, 1 * u.volt)
+            inst.output = False
+
+
+def test_scpi_batch_value_flushes():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "*IDN?",
+                "*CLS"
+            ], [
+                "MOCK"
+            ]
+    ) as inst:
+        with inst.batch() as batch:
+            name = batch.query("*IDN?")
+            assert name.value == "MOCK"
+            inst.clear()
+
+
+def test_scpi_batch_nested():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP ON;*CLS"
+            ], [
+            ]
+    ) as inst:
+        with inst.batch() as outer:
+            with inst.batch() as inner:
+                assert inner is outer
+                inst.output = True
+            inst.clear()
+
+
+def test_scpi_batch_discarded_on_exception():
+    with expected_protocol(
+            MockInstrument,
+            [
+            ], [
+            ]
+    ) as inst:
+        with pytest.raises(ZeroDivisionError):
+            with inst.batch() as batch:
+                inst.output = True
+                name = batch.query("*IDN?")
+                _ = 1 / 0
+        assert inst._batch is None
+        with pytest.raises(RuntimeError):
+            _ = name.value
+
+
+def test_scpi_batch_wrong_response_count():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP?;:VOLT?"
+            ], [
+                "ON"
+            ]
+    ) as inst:
+        with pytest.raises(IOError):
+            with inst.batch() as batch:
+                output = batch.get(inst, "output")
+                _ = batch.get(inst, "voltage")
+        with pytest.raises(IOError):
+            _ = output.value
+
+
+def test_scpi_batch_other_thread_not_batched():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP ON",
+                "*CLS"
+            ], [
+            ]
+    ) as inst:
+        with inst.batch():
+            inst.clear()
+            thread = threading.Thread(target=setattr,
+                                      args=(inst, "output", True))
+            thread.start()
+            thread.join()
+
+
+def test_scpi_batch_max_length_invalid():
+    with pytest.raises(ValueError):
+        _ = ik.generic_scpi.SCPIBatch(None, max_length=0)
+
+
+def test_scpi_batch_shadow_state():
+    with expected_protocol(
+            MockInstrument,
+            [
+                "OUTP ON",
+                "VOLT 1.000000e+00"
+            ], [
+            ]
+    ) as inst:
+        inst.shadow_state = True
+        with pytest.raises(ZeroDivisionError):
+            with inst.batch():
+                inst.output = True
+                _ = 1 / 0
+        inst.output = True
+        with inst.batch():
+            inst.output = True
+            inst.voltage = 1 * u.volt
+        inst.voltage = 1 * u.volt
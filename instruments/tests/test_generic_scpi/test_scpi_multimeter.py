@@ -181,3 +181,61 @@ def test_scpi_multimeter_measure():
             ]
     ) as dmm:
         unit_eq(dmm.measure(dmm.Mode.voltage_dc), 4.2345e-03 * u.volt)
+
+
+def test_scpi_multimeter_measure_raw_units():
+    with expected_protocol(
+            ik.generic_scpi.SCPIMultimeter,
+            [
+                "MEAS:VOLT:DC?",
+            ], [
+                "+4.23450000E-03",
+            ]
+    ) as dmm:
+        dmm.raw_units = True
+        value = dmm.measure(dmm.Mode.voltage_dc)
+        assert isinstance(value, float)
+        assert value == 4.2345e-03
+
+
+def test_scpi_multimeter_measure_invalidates_mode():
+    with expected_protocol(
+            ik.generic_scpi.SCPIMultimeter,
+            [
+                "CONF?",
+                "MEAS:CURR:AC?",
+                "CONF?",
+                "CONF:VOLT:DC"
+            ], [
+                "VOLT +1.000000E+01,+3.000000E-06",
+                "+1.00000000E-03",
+                "CURR:AC +1.000000E+01,+3.000000E-06"
+            ]
+    ) as dmm:
+        dmm.query_cache_ttl = 10 * u.second
+        dmm.shadow_state = True
+        assert dmm.mode == dmm.Mode.voltage_dc
+        assert dmm.mode == dmm.Mode.voltage_dc
+        unit_eq(dmm.measure(dmm.Mode.current_ac), 1e-03 * u.amp)
+        assert dmm.mode == dmm.Mode.current_ac
+        dmm.mode = dmm.Mode.voltage_dc
+
+
+def test_scpi_multimeter_input_range_invalidates_mode():
+    with expected_protocol(
+            ik.generic_scpi.SCPIMultimeter,
+            [
+                "CONF?",
+                "CONF?",
+                "CONF:VOLT:DC 1.0",
+                "CONF?"
+            ], [
+                "VOLT +1.000000E+01,+3.000000E-06",
+                "VOLT +1.000000E+01,+3.000000E-06",
+                "VOLT +1.000000E+00,+3.000000E-06"
+            ]
+    ) as dmm:
+        dmm.query_cache_ttl = 10 * u.second
+        assert dmm.mode == dmm.Mode.voltage_dc
+        dmm.input_range = 1 * u.volt
+        assert dmm.mode == dmm.Mode.voltage_dc
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests that importing instruments stays lightweight
+"""
+
+# IMPORTS ####################################################################
+
+
+import subprocess
+import sys
+
+import pytest
+
+import instruments as ik
+from instruments.config import load_instruments
+
+# TESTS ######################################################################
+
+
+# Modules which must only be imported once a driver or transport needing them
+# is used.
+LAZY_MODULES = [
+    "asyncio",
+    "pyvisa",
+    "ruamel.yaml",
+    "usb",
+    "usbtmc",
+    "visa",
+    "vxi11",
+    "instruments.config",
+    "instruments.generic_scpi",
+    "instruments.keithley",
+    "instruments.srs",
+    "instruments.tektronix",
+    "instruments.abstract_instruments.comm.visa_communicator",
+    "instruments.abstract_instruments.comm.usbtmc_communicator",
+    "instruments.abstract_instruments.comm.vxi11_communicator",
+]
+
+
+def _modules_imported_by(statement):
+    # Imports are checked in a fresh interpreter, as the modules are likely
+    # already imported by other tests.
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import sys\n{}\nprint('\\n'.join(sys.modules))".format(statement)
+    ])
+    return set(output.decode("utf-8").split())
+
+
+def test_import_does_not_load_backends():
+    modules = _modules_imported_by("import instruments")
+    assert sorted(modules.intersection(LAZY_MODULES)) == []
+
+
+def test_subpackage_loaded_on_access():
+    modules = _modules_imported_by(
+        "import instruments as ik\nik.srs.SRS830"
+    )
+    assert "instruments.srs" in modules
+    assert "instruments.tektronix" not in modules
+
+
+@pytest.mark.parametrize("name", [
+    "agilent", "generic_scpi", "fluke", "glassman", "holzworth", "hp",
+    "keithley", "lakeshore", "minghe", "newport", "oxford", "phasematrix",
+    "picowatt", "qubitekk", "rigol", "srs", "tektronix", "thorlabs",
+    "toptica", "wavetek", "yokogawa",
+])
+def test_subpackage_attribute(name):
+    assert getattr(ik, name).__name__ == "instruments." + name
+    assert name in dir(ik)
+
+
+def test_load_instruments_attribute():
+    assert ik.load_instruments is load_instruments
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        _ = ik.not_a_subpackage
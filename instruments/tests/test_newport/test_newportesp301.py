@@ -28,3 +28,25 @@ def test_axis_returns_axis_class():
     ) as inst:
         axis = inst.axis[0]
         assert isinstance(axis, ik.newport.NewportESP301Axis) is True
+
+
+def test_axis_reads_current_units():
+    with expected_protocol(
+            ik.newport.NewportESP301,
+            [
+                "1SN?",
+                "TB?",
+                "1SN?",
+                "TB?"
+            ],
+            [
+                "1",
+                "0,0,0",
+                "2",
+                "0,0,0"
+            ],
+            sep="\r"
+    ) as inst:
+        units = inst.axis[0]._units  # pylint: disable=protected-access
+        # The units were changed other than through the first axis object.
+        assert inst.axis[0]._units != units  # pylint: disable=protected-access
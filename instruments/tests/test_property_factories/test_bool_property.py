@@ -92,3 +92,20 @@ def test_bool_property_set_cmd():
     mock_inst.mock1 = True
 
     assert mock_inst.value == 'MOCK1?\nFOOBAR ON\n'
+
+
+def test_bool_property_cacheable_negative_ttl():
+    with pytest.raises(ValueError):
+        class BoolMock(MockInstrument):  # pylint: disable=unused-variable
+            mock1 = bool_property('MOCK1', cacheable=-1)
+
+
+def test_bool_property_cacheable_without_cache():
+    class BoolMock(MockInstrument):
+        mock1 = bool_property('MOCK1', cacheable=True)
+
+    mock_inst = BoolMock({'MOCK1?': 'OFF'})
+
+    assert mock_inst.mock1 is False
+    mock_inst.mock1 = True
+    assert mock_inst.value == 'MOCK1?\nMOCK1 ON\n'
@@ -161,3 +161,24 @@ def test_bounded_unitful_property_returns_none():
 
     assert mock_inst.property_min is None
     assert mock_inst.property_max is None
+
+
+def test_bounded_unitful_property_raw_units():
+    class BoundedUnitfulMock(MockInstrument):
+        _raw_units = True
+        property, property_min, property_max = bounded_unitful_property(
+            'MOCK',
+            units=u.hertz
+        )
+
+    mock_inst = BoundedUnitfulMock(
+        {'MOCK?': '1000', 'MOCK:MIN?': '10', 'MOCK:MAX?': '1 kHz'})
+
+    assert mock_inst.property == 1000.0
+    assert mock_inst.property_min == 10.0
+    assert mock_inst.property_max == 1000.0
+    assert isinstance(mock_inst.property_max, float)
+    assert BoundedUnitfulMock.property_max.units == u.hertz
+
+    mock_inst.property = 500 * u.hertz
+    assert mock_inst.value.endswith('MOCK {:e}\n'.format(500))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the properties returned by the property factories
+"""
+
+# IMPORTS ####################################################################
+
+
+from enum import Enum
+
+import pytest
+import quantities as u
+
+from instruments.util_fns import (
+    FactoryProperty, bool_property, bounded_unitful_property, enum_property,
+    int_property, string_property, unitful_property, unitless_property
+)
+from . import MockInstrument
+
+# TEST CASES #################################################################
+
+# pylint: disable=missing-docstring
+
+
+class SillyEnum(Enum):
+    a = "aa"
+    b = "bb"
+
+
+class FactoryMock(MockInstrument):
+    flag = bool_property("FLAG", set_cmd="FLAG:SET", readonly=False)
+    mode = enum_property("MODE", SillyEnum, readonly=True,
+                         doc="Gets the mode.")
+    gain = unitless_property("GAIN", writeonly=True)
+    count = int_property("COUNT", cacheable=0.5)
+    freq = unitful_property("FREQ", u.hertz)
+    name = string_property("NAME")
+    volt, volt_min, volt_max = bounded_unitful_property(
+        "VOLT", u.volt, valid_range=("query", 10)
+    )
+
+
+@pytest.mark.parametrize("name", [
+    "flag", "mode", "gain", "count", "freq", "name", "volt", "volt_min",
+    "volt_max"
+])
+def test_factory_property_is_property(name):
+    prop = getattr(FactoryMock, name)
+    assert isinstance(prop, FactoryProperty)
+    assert isinstance(prop, property)
+
+
+def test_factory_property_commands():
+    assert FactoryMock.flag.command == "FLAG"
+    assert FactoryMock.flag.set_cmd == "FLAG:SET"
+    assert FactoryMock.flag.query_cmd == "FLAG?"
+    assert FactoryMock.freq.set_cmd == "FREQ"
+    assert FactoryMock.volt_min.query_cmd == "VOLT:MIN?"
+    assert FactoryMock.volt_max.query_cmd == "VOLT:MAX?"
+
+
+def test_factory_property_units():
+    assert FactoryMock.freq.units is u.hertz
+    assert FactoryMock.volt_min.units is u.volt
+    assert FactoryMock.flag.units is None
+    assert FactoryMock.count.units is None
+
+
+def test_factory_property_access():
+    assert not FactoryMock.flag.readonly
+    assert FactoryMock.mode.readonly
+    assert FactoryMock.volt_max.readonly
+    assert FactoryMock.gain.writeonly
+    assert FactoryMock.mode.fset is None
+    assert FactoryMock.gain.fget is None
+
+
+def test_factory_property_cacheable():
+    assert FactoryMock.count.cacheable == 0.5
+    assert FactoryMock.freq.cacheable is False
+
+
+def test_factory_property_doc():
+    assert FactoryMock.mode.__doc__ == "Gets the mode."
+    assert FactoryMock.freq.__doc__ is None
+
+
+def test_factory_property_no_instance_dict():
+    with pytest.raises(AttributeError):
+        FactoryMock.flag.extra = 1
+
+
+def test_factory_property_readonly_writeonly():
+    with pytest.raises(ValueError):
+        _ = bool_property("MOCK", readonly=True, writeonly=True)
+
+
+def test_factory_property_set_fmt_with_format_spec():
+    class FormatMock(MockInstrument):
+        a = enum_property("MOCK:A", SillyEnum, set_fmt="{}={:>4}")
+        b = string_property("MOCK:B", set_fmt="{}:{}{:.2}{}")
+
+    mock_inst = FormatMock()
+    mock_inst.a = SillyEnum.a
+    mock_inst.b = "abcd"
+
+    assert mock_inst.value == 'MOCK:A=  aa\nMOCK:B:"ab"\n'
+
+
+def test_factory_property_set_fmt_reordered():
+    class FormatMock(MockInstrument):
+        a = int_property("MOCK:A", set_fmt="{1}->{0}")
+
+    mock_inst = FormatMock()
+    mock_inst.a = 5
+
+    assert mock_inst.value == "5->MOCK:A\n"
+
+
+def test_factory_property_defaults():
+    class BareProperty(FactoryProperty):
+        __slots__ = ("__doc__",)
+
+    class BareMock(MockInstrument):
+        setting = BareProperty("SETTING")
+
+    prop = BareMock.setting
+    assert prop._to_msg("5\n") == "SETTING 5"  # pylint: disable=protected-access
+    with pytest.raises(AttributeError):
+        _ = BareMock().setting
+    with pytest.raises(AttributeError):
+        BareMock().setting = 5
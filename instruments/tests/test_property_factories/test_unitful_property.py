@@ -10,7 +10,7 @@ Module containing tests for the unitful property factories
 import pytest
 import instruments.units as u
 
-from instruments.util_fns import unitful_property
+from instruments.util_fns import UnitfulProperty, raw_units, unitful_property
 from . import MockInstrument
 
 # TEST CASES #################################################################
@@ -256,3 +256,55 @@ def test_unitful_property_name_read_not_none():
     mock_inst.a = 1000 * u.hertz
 
     assert mock_inst.value == 'MOCK?\nFOOBAR {:e}\n'.format(1000)
+
+
+def test_unitful_property_units_attribute():
+    class UnitfulMock(MockInstrument):
+        a = unitful_property('MOCK', units=u.hertz)
+
+    assert isinstance(UnitfulMock.a, UnitfulProperty)
+    assert UnitfulMock.a.units == u.hertz
+
+
+def test_unitful_property_raw_units():
+    class UnitfulMock(MockInstrument):
+        _raw_units = True
+        a = unitful_property('MOCK', units=u.hertz)
+
+    mock_inst = UnitfulMock({'MOCK?': '1 kHz'})
+    value = mock_inst.a
+    assert isinstance(value, float)
+    assert value == 1000
+
+    mock_inst.a = 2 * u.kilohertz
+    assert mock_inst.value == 'MOCK?\nMOCK {:e}\n'.format(2000)
+
+
+def test_unitful_property_raw_units_context():
+    class UnitfulMock(MockInstrument):
+        a = unitful_property('MOCK', units=u.hertz)
+
+    mock_inst = UnitfulMock({'MOCK?': '1000'})
+    with raw_units():
+        assert mock_inst.a == 1000.0
+        assert not isinstance(mock_inst.a, u.Quantity)
+        with raw_units(False):
+            assert mock_inst.a == 1000 * u.hertz
+    assert mock_inst.a == 1000 * u.hertz
+
+
+def test_unitful_property_raw_units_context_overrides_instance():
+    class UnitfulMock(MockInstrument):
+        _raw_units = True
+        a = unitful_property('MOCK', units=u.hertz)
+
+    mock_inst = UnitfulMock({'MOCK?': '1000'})
+    with raw_units(False):
+        assert mock_inst.a == 1000 * u.hertz
+    assert mock_inst.a == 1000.0
+
+
+def test_unitful_property_raw_units_context_invalid_type():
+    with pytest.raises(TypeError):
+        with raw_units(1):
+            pass
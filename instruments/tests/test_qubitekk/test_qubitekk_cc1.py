@@ -35,6 +35,28 @@ def test_cc1_count():
         assert cc.channel[0].count == 20.0
 
 
+def test_cc1_channel_cached():
+    with expected_protocol(
+            ik.qubitekk.CC1,
+            [
+                ":ACKN OF",
+                "FIRM?",
+                "COUN:C1?"
+            ],
+            [
+                "",
+                "Firmware v2.010",
+                "20"
+            ],
+            sep="\n"
+    ) as cc:
+        channel = cc.channel[0]
+        assert cc.channel[0] is channel
+        _ = channel.count
+        assert cc.channel[0]._count == 20  # pylint: disable=protected-access
+        assert list(cc.channel)[0] is channel
+
+
 def test_cc1_window():
     with expected_protocol(
             ik.qubitekk.CC1,
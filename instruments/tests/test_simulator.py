@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the simulated SCPI instrument
+"""
+
+# IMPORTS ####################################################################
+
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import instruments as ik
+import instruments.units as u
+from instruments.simulator import BinaryBlock, SCPISimulator, Setting
+from instruments.tests import unit_eq
+from instruments.util_fns import bool_property, unitful_property
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+class MockInstrument(ik.generic_scpi.SCPIInstrument):
+    """
+    Instrument with a few property factory properties, for testing.
+    """
+    output = bool_property("OUTP")
+    voltage = unitful_property("VOLT", u.volt)
+
+
+def _table():
+    return {
+        "*IDN?": "ACME,SIM,0,1.0",
+        "*CLS": None,
+        "OUTP": Setting("OFF"),
+        "VOLT": Setting("+1.000000E+00"),
+        "CURV?": BinaryBlock(np.arange(5, dtype=">i2")),
+        "ECHO?": lambda sim, args: args,
+    }
+
+
+def test_simulator_respond():
+    sim = SCPISimulator(_table())
+    assert sim.respond("*IDN?") == b"ACME,SIM,0,1.0\n"
+    assert sim.respond(":outp ON") is None
+    assert sim.respond("OUTP?;:VOLT?") == b"ON;+1.000000E+00\n"
+    assert sim.respond("ECHO? 42") == b"42\n"
+    assert sim.respond("CURV?") == b"#210" + bytes.fromhex(
+        "00000001000200030004"
+    ) + b"\n"
+    assert sim.respond("BOGUS?") is None
+    assert sim.unhandled == ["BOGUS?"]
+
+
+def test_simulator_tcpip():
+    with SCPISimulator(_table()) as sim:
+        inst = MockInstrument.open_tcpip(sim.host, sim.port)
+        assert inst.name == "ACME,SIM,0,1.0"
+        inst.output = True
+        assert inst.output is True
+        inst.sendcmd("CURV?")
+        np.testing.assert_array_equal(inst.binblockread(2), [0, 1, 2, 3, 4])
+        inst.read()
+        inst._file.close()
+    assert sim.received[:3] == ["*IDN?", "OUTP ON", "OUTP?"]
+
+
+def test_simulator_open_from_uri():
+    with SCPISimulator(_table()) as sim:
+        inst = MockInstrument.open_from_uri(
+            "tcpip://{}:{}".format(sim.host, sim.port)
+        )
+        assert inst.query("*IDN?") == "ACME,SIM,0,1.0"
+        inst._file.close()
+
+
+def test_simulator_batch():
+    with SCPISimulator(_table()) as sim:
+        inst = MockInstrument.open_tcpip(sim.host, sim.port)
+        with inst.batch() as batch:
+            inst.voltage = 2 * u.volt
+            voltage = batch.get(inst, "voltage")
+            name = batch.query("*IDN?")
+        unit_eq(voltage.value, 2 * u.volt)
+        assert name.value == "ACME,SIM,0,1.0"
+        inst._file.close()
+    assert len(sim.received) == 1
+
+
+def test_simulator_concurrent_clients():
+    results = []
+
+    def poll(port):
+        inst = MockInstrument.open_tcpip("127.0.0.1", port)
+        for _ in range(20):
+            results.append(inst.query("*IDN?"))
+        inst._file.close()
+
+    with SCPISimulator(_table()) as sim:
+        threads = [
+            threading.Thread(target=poll, args=(sim.port,)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert results == ["ACME,SIM,0,1.0"] * 80
+
+
+def test_simulator_latency():
+    with SCPISimulator(_table(), latency={"*IDN?": 0.05}) as sim:
+        inst = MockInstrument.open_tcpip(sim.host, sim.port)
+        start = time.perf_counter()
+        inst.query("*IDN?")
+        assert time.perf_counter() - start >= 0.05
+        inst._file.close()
+
+
+def test_simulator_bandwidth():
+    table = {"CURV?": BinaryBlock(bytes(1000))}
+    with SCPISimulator(table, bandwidth=20000) as sim:
+        inst = MockInstrument.open_tcpip(sim.host, sim.port)
+        start = time.perf_counter()
+        inst.sendcmd("CURV?")
+        assert len(inst.binblockread(1)) == 1000
+        assert time.perf_counter() - start >= 0.04
+        inst._file.close()
+
+
+def test_simulator_async():
+    async def run():
+        async with SCPISimulator(_table()) as sim:
+            inst = await MockInstrument.open_tcpip_async(sim.host, sim.port)
+            names = await asyncio.gather(
+                inst.query_async("*IDN?"), inst.query_async("*IDN?")
+            )
+            inst._file.close()
+        return names
+
+    assert asyncio.run(run()) == ["ACME,SIM,0,1.0"] * 2
+
+
+def test_simulator_bandwidth_invalid():
+    with pytest.raises(ValueError):
+        _ = SCPISimulator({}, bandwidth=0)
@@ -7,11 +7,12 @@ Module containing tests for the util_fns.split_unit_str utility function
 # IMPORTS ####################################################################
 
 
+import numpy as np
 import pytest
 
 import instruments.units as u
 from instruments.util_fns import (
-    split_unit_str
+    split_unit_str, split_unit_str_array
 )
 
 # TEST CASES #################################################################
@@ -146,3 +147,61 @@ def test_split_unit_str_only_units():
     """
     with pytest.raises(ValueError):
         _ = split_unit_str("foobars")
+
+
+def test_split_unit_str_exact_exponent():
+    """
+    split_unit_str: Given a magnitude in scientific notation, I expect the
+    same value as parsed by `float`.
+    """
+    mag, _ = split_unit_str("1.5E-3 V")
+    assert mag == float("1.5E-3")
+
+
+def test_split_unit_str_lookup_memoised():
+    """
+    split_unit_str: Given the same units several times, I expect the lookup
+    to be called once for them.
+    """
+    calls = []
+
+    def lookup(units):
+        calls.append(units)
+        return units.lower()
+
+    for _ in range(3):
+        assert split_unit_str("42 FOO", lookup=lookup) == (42, "foo")
+    assert calls == ["FOO"]
+
+
+def test_split_unit_str_array():
+    """
+    split_unit_str_array: Given strings in different but compatible units,
+    I expect an array of their magnitudes in the units of the first string.
+    """
+    mags, units = split_unit_str_array(["500 mV", "1 V", "20"], u.mV)
+    assert units == "mV"
+    np.testing.assert_array_equal(mags, [500, 1000, 20])
+
+
+def test_split_unit_str_array_default_units():
+    """
+    split_unit_str_array: Given strings without units, I expect the default
+    units to be returned, including for no strings at all.
+    """
+    mags, units = split_unit_str_array(np.array(["1", "2.5E1"]), u.volt)
+    assert units is u.volt
+    np.testing.assert_array_equal(mags, [1, 25])
+
+    mags, units = split_unit_str_array([], u.volt)
+    assert units is u.volt
+    assert mags.shape == (0,)
+
+
+def test_split_unit_str_array_incompatible_units():
+    """
+    split_unit_str_array: Given strings in incompatible units, I expect a
+    ValueError.
+    """
+    with pytest.raises(ValueError):
+        _ = split_unit_str_array(["1 V", "1 s"])
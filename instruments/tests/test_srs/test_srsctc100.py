@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the SRS CTC-100 cryogenic temperature controller
+"""
+
+# IMPORTS #####################################################################
+
+
+import instruments as ik
+from instruments.tests import expected_protocol
+
+# TESTS #######################################################################
+
+
+def test_srsctc100_channel_rename():
+    with expected_protocol(
+            ik.srs.SRSCTC100,
+            [
+                "getOutput.names?",
+                'A.name = "tmp"',
+                "getOutput.names?",
+                'B.name = "A"',
+                "getOutput.names?",
+                "A.sensor?"
+            ],
+            [
+                "A, B",
+                "tmp, B",
+                "tmp, A",
+                "Diode"
+            ]
+    ) as inst:
+        inst.error_check_toggle = False
+        inst.channel["A"].name = "tmp"
+        inst.channel["B"].name = "A"
+        # The renamed channel must be addressed by its new name.
+        assert inst.channel["A"].sensor_type == inst.SensorType.diode
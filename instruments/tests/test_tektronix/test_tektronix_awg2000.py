@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Tektronix AWG2000
+"""
+
+# IMPORTS ####################################################################
+
+import numpy as np
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import GPIBCommunicator
+from instruments.tests import expected_protocol
+from .. import mock
+
+# TESTS ######################################################################
+
+
+def test_tekawg2000_upload_waveform():
+    with expected_protocol(
+            ik.tektronix.TekAWG2000,
+            [
+                "WFMP:YZERO 0",
+                "WFMP:YMULT 1",
+                "WFMP:XINCR 0.001",
+                b"CURVE #16" + bytes.fromhex("0000ff0fff07")
+            ], [
+            ]
+    ) as awg:
+        waveform = np.array([0.0, 1.0, 0.5])
+        awg.upload_waveform(0, 1, 0.001, waveform)
+        np.testing.assert_array_equal(waveform, [0.0, 1.0, 0.5])
+
+
+def test_tekawg2000_upload_waveform_out_of_range():
+    with pytest.raises(ValueError), expected_protocol(
+            ik.tektronix.TekAWG2000,
+            [
+                "WFMP:YZERO 0",
+                "WFMP:YMULT 1",
+                "WFMP:XINCR 0.001"
+            ], [
+            ]
+    ) as awg:
+        awg.upload_waveform(0, 1, 0.001, np.array([0.0, 2.0]))
+
+
+def test_tekawg2000_upload_waveform_gpib():
+    adapter = mock.MagicMock()
+    written = []
+    adapter.sendcmd.side_effect = lambda msg: written.append(
+        msg.encode("utf-8") + b"\r"
+    )
+    adapter.write_raw.side_effect = lambda msg: written.append(bytes(msg))
+    GPIBCommunicator(adapter, 2, model="pl").sendcmd("*CLS")
+    awg = ik.tektronix.TekAWG2000(GPIBCommunicator(adapter, 1, model="pl"))
+    del written[:]
+
+    awg.upload_waveform(0, 1, 0.001, np.array([13, 43, 4095]) / 4095)
+    assert b"".join(written) == (
+        b"++addr 1\r++eoi 1\rWFMP:YZERO 0\rWFMP:YMULT 1\rWFMP:XINCR 0.001\r"
+        b"CURVE #16\x1b\r\x00\x1b+\x00\xff\x0f\r"
+    )
@@ -102,3 +102,35 @@ def test_tektds224_data_source_read_waveform():
         (x, y) = tek.channel[1].read_waveform()
         assert (x == data).all()
         assert (y == data).all()
+
+
+def test_tektds224_data_source_read_waveform_ascii():
+    with expected_protocol(
+            ik.tektronix.TekTDS224,
+            [
+                "DAT:SOU?",
+                "DAT:SOU CH2",
+                "DAT:ENC ASCI",
+                "CURVE?",
+                "WFMP:CH2:YOF?",
+                "WFMP:CH2:YMU?",
+                "WFMP:CH2:YZE?",
+                "WFMP:XZE?",
+                "WFMP:XIN?",
+                "WFMP:CH2:NR_P?",
+                "DAT:SOU CH1"
+            ], [
+                "CH1",
+                "0,1,2,3,4",
+                "0",
+                "1",
+                "0",
+                "0",
+                "1",
+                "5"
+            ]
+    ) as tek:
+        data = np.array([0, 1, 2, 3, 4])
+        (x, y) = tek.channel[1].read_waveform(bin_format=False)
+        assert (x == data).all()
+        assert (y == data).all()
@@ -6,14 +6,17 @@ Module containing tests for util_fns.py
 
 # IMPORTS ####################################################################
 
-from enum import Enum
+from enum import Enum, IntEnum
+import gc
+import weakref
 
+import numpy as np
 import pytest
 
 import instruments.units as u
 from instruments.util_fns import (
     ProxyList,
-    assume_units, convert_temperature,
+    assume_units, convert_temperature, parse_ascii_array,
     setattr_expression
 )
 
@@ -122,6 +125,65 @@ def test_ProxyList_invalid_idx():
         _ = proxy_list[10]  # Should raise IndexError
 
 
+class _ProxyParent:
+    pass
+
+
+class _ProxyChild:
+
+    def __init__(self, parent, name):
+        self._parent = parent
+        self._name = name
+
+
+def test_ProxyList_cached():
+    parent = _ProxyParent()
+
+    child = ProxyList(parent, _ProxyChild, range(5), cached=True)[2]
+    child.state = 42
+
+    proxy_list = ProxyList(parent, _ProxyChild, range(5), cached=True)
+    assert proxy_list[2] is child
+    assert proxy_list[2].state == 42
+    assert list(proxy_list)[2] is child
+    assert ProxyList(_ProxyParent(), _ProxyChild, range(5),
+                     cached=True)[2] is not child
+
+
+def test_ProxyList_not_cached():
+    parent = _ProxyParent()
+
+    proxy_list = ProxyList(parent, _ProxyChild, range(5))
+    assert proxy_list[2] is not proxy_list[2]
+
+    # Parents without a __dict__ can't hold the cache.
+    proxy_list = ProxyList(object(), _ProxyChild, range(5), cached=True)
+    assert proxy_list[2] is not proxy_list[2]
+
+
+def test_ProxyList_cached_enum():
+    class MockEnum(IntEnum):
+        a = 0
+        b = 1
+
+    parent = _ProxyParent()
+
+    proxy_list = ProxyList(parent, _ProxyChild, MockEnum, cached=True)
+    assert proxy_list["a"] is proxy_list[MockEnum.a]
+    assert proxy_list[MockEnum.a]._name == 0
+    assert list(proxy_list)[0]._name is MockEnum.a
+
+
+def test_ProxyList_cached_freed_with_parent():
+    parent = _ProxyParent()
+    child = weakref.ref(ProxyList(parent, _ProxyChild, range(5),
+                                  cached=True)[0])
+
+    del parent
+    gc.collect()
+    assert child() is None
+
+
 def test_assume_units_correct():
     m = u.Quantity(1, 'm')
 
@@ -158,6 +220,19 @@ def test_temperature_conversion():
     assert out.magnitude == 270
 
 
+@pytest.mark.parametrize("source", [u.degC, u.degF, u.degK])
+@pytest.mark.parametrize("target", [u.degC, u.degF, u.degK])
+def test_temperature_conversion_array(source, target):
+    values = np.linspace(-300.0, 300.0, 7)
+    out = convert_temperature(u.Quantity(values, source), target)
+    expected = [
+        convert_temperature(value * source, target).magnitude
+        for value in values
+    ]
+    assert out.shape == values.shape
+    assert (out.magnitude == expected).all()
+
+
 def test_temperater_conversion_failure():
     with pytest.raises(ValueError):
         blo = 70.0 * u.degF
@@ -209,3 +284,32 @@ def test_setattr_expression_both():
     a = A()
     setattr_expression(a, 'b[0].x', 'foo')
     assert a.b[0].x == 'foo'
+
+
+def test_parse_ascii_array():
+    data = parse_ascii_array("+1.0E+00, -2.5e-3,3,\n")
+    assert data.dtype == np.float64
+    np.testing.assert_array_equal(data, [1.0, -2.5e-3, 3.0])
+
+
+def test_parse_ascii_array_bytes_and_separator():
+    data = parse_ascii_array(b"1;2;3", sep=";")
+    np.testing.assert_array_equal(data, [1.0, 2.0, 3.0])
+
+
+def test_parse_ascii_array_single_and_empty():
+    np.testing.assert_array_equal(parse_ascii_array("4.5"), [4.5])
+    assert parse_ascii_array("  ").shape == (0,)
+
+
+def test_parse_ascii_array_overflow():
+    data = parse_ascii_array("1,9.91E+37,-9.9E+37")
+    np.testing.assert_array_equal(data, [1.0, 9.91e37, -9.9e37])
+    data = parse_ascii_array("1,9.91E+37,-9.9E+37", overflow=np.nan)
+    assert data[0] == 1.0
+    assert np.isnan(data[1:]).all()
+
+
+def test_parse_ascii_array_invalid():
+    with pytest.raises(ValueError):
+        parse_ascii_array("1,abc,3")
@@ -10,7 +10,8 @@ Module containing tests for Wavetek 39A
 import instruments.units as u
 
 import instruments as ik
-from instruments.tests import expected_protocol, make_name_test
+from instruments.abstract_instruments.comm import GPIBCommunicator
+from instruments.tests import expected_protocol, make_name_test, mock
 
 # TESTS ######################################################################
 
@@ -250,3 +251,36 @@ def test_wavetek39a_local():
     ) as fg:
         fg.local()
 
+
+
+def test_wavetek39a_arbitrary_define():
+    with expected_protocol(
+            ik.wavetek.Wavetek39A,
+            [
+                b"ARBDEF WAVE,4,#18" + bytes.fromhex("0001fffe07fff800")
+            ], [
+            ],
+            sep = ""
+    ) as fg:
+        fg.arbitrary_define("WAVE", [1, -2, 2047, -2048])
+
+
+def test_wavetek39a_arbitrary_define_gpib():
+    adapter = mock.MagicMock()
+    written = []
+    adapter.sendcmd.side_effect = lambda msg: written.append(
+        msg.encode("utf-8") + b"\r"
+    )
+    adapter.write_raw.side_effect = lambda msg: written.append(bytes(msg))
+    GPIBCommunicator(adapter, 2, model="pl").sendcmd("*CLS")
+    # The driver sets an empty terminator, which GPIB adapters don't accept
+    # as an EOS setting, so swap the adapter in after construction.
+    fg = ik.wavetek.Wavetek39A.open_test()
+    fg._file = GPIBCommunicator(adapter, 1, model="pl")  # pylint: disable=protected-access
+    del written[:]
+
+    fg.arbitrary_define("WAVE", [10, 13, 27, 43])
+    assert b"".join(written) == (
+        b"++addr 1\r++eoi 1\rARBDEF WAVE,4,#18"
+        b"\x00\x1b\n\x00\x1b\r\x00\x1b\x1b\x00\x1b+\r"
+    )
@@ -160,6 +160,9 @@ class PM100USB(SCPIInstrument):
             if any commands are sent to the device either by its local panel,
             or by software other than InstrumentKit.
 
+        .. seealso:: `~instruments.Instrument.query_cache_ttl`, which caches
+            the measurement configuration and is invalidated when it is set.
+
         :type: `bool`
         """
         return bool(self._cache_units)
@@ -191,8 +194,13 @@ class PM100USB(SCPIInstrument):
         doc="""
         Returns the current measurement configuration.
 
+        This property is cacheable, so that `read` does not query it for
+        each measurement once the query cache is enabled with
+        `~instruments.Instrument.query_cache_ttl`.
+
         :rtype: :class:`PM100USB.MeasurementConfiguration`
-        """
+        """,
+        cacheable=True
     )
 
     @property
@@ -365,7 +365,7 @@ class TopMode(Instrument):
 
         :rtype: `~TopMode.Laser`
         """
-        return ProxyList(self, self.Laser, range(2))
+        return ProxyList(self, self.Laser, range(2), cached=True)
 
     @property
     def enable(self):
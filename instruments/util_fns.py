@@ -4,18 +4,73 @@
 Module containing various utility functions
 """
 
+# The property factories and the property classes they return are kept
+# together with the helpers they are built on.
+# pylint: disable=too-many-lines
+
 # IMPORTS #####################################################################
 
 
+import contextlib
+import contextvars
+import functools
 import re
+import string
+import time
 
 from enum import Enum, IntEnum
+
+import numpy as np
+
 import instruments.units as u
 
 # CONSTANTS ###################################################################
 
 _IDX_REGEX = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\[(-?[0-9]*)\]')
 
+# Number, possibly in scientific notation, followed by optional units, as
+# split by `split_unit_str`.
+# Borrowed from:
+# http://stackoverflow.com/questions/430079/how-to-split-strings-into-text-and-number
+# Reg exp tweaked on May 30, 2015 by scasagrande to match on input with
+# scientific notation. General flow borrowed from:
+# http://www.regular-expressions.info/floatingpoint.html
+_UNIT_STR_REGEX = re.compile(
+    r"([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*([a-z]+)?", re.I
+)
+
+# Conversions of magnitudes between temperature scales, by names of the
+# source and target units, for `convert_temperature`. `None` stands for no
+# conversion.
+_TEMPERATURE_CONVERSIONS = {
+    ("degF", "degC"): lambda val: (val - 32.0) * 5.0 / 9.0,
+    ("K", "degC"): lambda val: val - 273.15,
+    ("K", "degF"): lambda val: val / 1.8 - 459 / 57,
+    ("degC", "degF"): lambda val: val * 9.0 / 5.0 + 32.0,
+    ("degF", "K"): lambda val: (val + 459.57) * 5.0 / 9.0,
+    ("degC", "K"): lambda val: val + 273.15,
+    ("degC", "degC"): None,
+    ("degF", "degF"): None,
+    ("K", "K"): None,
+}
+
+# Magnitude from which values returned by SCPI instruments are overflow
+# sentinels, such as 9.9E+37 or 9.91E+37.
+_OVERFLOW_THRESHOLD = 9.9e37
+
+# GLOBALS #####################################################################
+
+# Set by the getters and setters of cacheable properties around the query or
+# command they send, and taken by `~instruments.Instrument` to serve the
+# query from, or invalidate, its `QueryCache`.
+_query_cache_hint = contextvars.ContextVar("_query_cache_hint", default=None)
+
+# Set by `raw_units`, to return bare values from every instrument, or to
+# return values with units from every instrument if `False`. `None` leaves
+# the raw units mode of each instrument in effect.
+_raw_units_context = contextvars.ContextVar("_raw_units_context",
+                                            default=None)
+
 # FUNCTIONS ###################################################################
 
 
@@ -74,6 +129,9 @@ def convert_temperature(temperature, base):
     the package `quantities` does not differentiate between ``degC`` and
     ``degK``.
 
+    The temperature may be a scalar or an array, which is converted as a
+    whole by NumPy.
+
     :param temperature: A quantity with units of Kelvin, Celsius, or Fahrenheit
     :type temperature: `quantities.Quantity`
     :param base: A temperature unit to convert to
@@ -82,30 +140,20 @@ def convert_temperature(temperature, base):
     :return: The converted temperature
     :rtype: `quantities.Quantity`
     """
-    # quantities reports equivalence between degC and degK, so a string
-    # comparison is needed
+    # quantities reports equivalence between degC and degK, so units are
+    # compared by name.
     newval = assume_units(temperature, u.degC)
-    if newval.units == u.degF and str(base).split(" ")[1] == 'degC':
-        return_val = ((newval.magnitude - 32.0) * 5.0 / 9.0) * base
-    elif str(newval.units).split(" ")[1] == 'K' and str(base).split(" ")[1] == 'degC':
-        return_val = (newval.magnitude - 273.15) * base
-    elif str(newval.units).split(" ")[1] == 'K' and base == u.degF:
-        return_val = (newval.magnitude / 1.8 - 459 / 57) * base
-    elif str(newval.units).split(" ")[1] == 'degC' and base == u.degF:
-        return_val = (newval.magnitude * 9.0 / 5.0 + 32.0) * base
-    elif newval.units == u.degF and str(base).split(" ")[1] == 'K':
-        return_val = ((newval.magnitude + 459.57) * 5.0 / 9.0) * base
-    elif str(newval.units).split(" ")[1] == 'degC' and str(base).split(" ")[1] == 'K':
-        return_val = (newval.magnitude + 273.15) * base
-    elif str(newval.units).split(" ")[1] == 'degC' and str(base).split(" ")[1] == 'degC':
-        return_val = newval
-    elif newval.units == u.degF and base == u.degF:
-        return_val = newval
-    elif str(newval.units).split(" ")[1] == 'K' and str(base).split(" ")[1] == 'K':
-        return_val = newval
-    else:
-        raise ValueError(f"Unable to convert {str(newval.units)} to {str(base)}")
-    return return_val
+    source = newval.dimensionality.string
+    target = base.dimensionality.string
+    try:
+        conversion = _TEMPERATURE_CONVERSIONS[source, target]
+    except KeyError:
+        raise ValueError(
+            f"Unable to convert {str(newval.units)} to {str(base)}"
+        ) from None
+    if conversion is None:
+        return newval
+    return conversion(newval.magnitude) * base
 
 
 def split_unit_str(s, default_units=u.dimensionless, lookup=None):
@@ -128,30 +176,19 @@ def split_unit_str(s, default_units=u.dimensionless, lookup=None):
         as the units.
     :param callable lookup: If specified, this function is called on the
         units part of the input string. If `None`, no lookup is performed.
-        Lookups are never performed on the default units.
+        Lookups are never performed on the default units. Results of the
+        lookup are memoised, so it must always return the same value for the
+        same units.
     :rtype: `tuple` of a `float` and a `str` or `u.Quantity`
     """
-    if lookup is None:
-        lookup = lambda x: x
-
-    # Borrowed from:
-    # http://stackoverflow.com/questions/430079/how-to-split-strings-into-text-and-number
-    # Reg exp tweaked on May 30, 2015 by scasagrande to match on input with
-    # scientific notation. General flow borrowed from:
-    # http://www.regular-expressions.info/floatingpoint.html
-    regex = r"([-+]?[0-9]*\.?[0-9]+)([eE][-+]?[0-9]+)?\s*([a-z]+)?"
-    match = re.match(regex, str(s).strip(), re.I)
+    match = _UNIT_STR_REGEX.match(str(s).strip())
     if match:
-        if match.groups()[1] is None:
-            val, _, units = match.groups()
-        else:
-            val = float(match.groups()[0]) * 10**float(match.groups()[1][1:])
-            units = match.groups()[2]
-
+        val, units = match.groups()
         if units is None:
             return float(val), default_units
-
-        return float(val), lookup(units)
+        if lookup is None:
+            return float(val), units
+        return float(val), _lookup_units(lookup, units)
 
     try:
         return float(s), default_units
@@ -159,6 +196,275 @@ def split_unit_str(s, default_units=u.dimensionless, lookup=None):
         raise ValueError(f"Could not split '{repr(s)}' into value and units.")
 
 
+def split_unit_str_array(strings, default_units=u.dimensionless, lookup=None):
+    """
+    Splits each of a sequence of strings of the form "12 C" or "14.7 GHz",
+    as `split_unit_str` does, into an array of their numeric parts and the
+    units they share. Values given in other units than the first one, such
+    as ``"1 V"`` following ``"500 mV"``, are rescaled to the units of the
+    first one::
+
+        >>> split_unit_str_array(["500 mV", "1 V", "20 mV"])
+        (array([ 500., 1000.,   20.]), 'mV')
+
+    :param strings: Input strings that will be split up.
+    :type strings: `list` or `numpy.ndarray` of `str`
+    :param default_units: If no units are specified in a string, this
+        argument is given as its units.
+    :param callable lookup: As for `split_unit_str`.
+    :rtype: `tuple` of a `numpy.ndarray` and a `str` or `u.Quantity`
+    """
+    values = np.empty((len(strings),))
+    shared_units = default_units
+    for idx, item in enumerate(strings):
+        value, units = split_unit_str(item, default_units, lookup)
+        if idx == 0:
+            shared_units = units
+        elif units is not shared_units:
+            value *= _units_factor(units, shared_units)
+        values[idx] = value
+    return values, shared_units
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_lookup(lookup, units):
+    return lookup(units)
+
+
+def _lookup_units(lookup, units):
+    try:
+        return _cached_lookup(lookup, units)
+    except TypeError:
+        # Unhashable lookup, or lookup returning unhashable units.
+        return lookup(units)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_units_factor(units, target):
+    return float(u.Quantity(1.0, units).rescale(target).magnitude)
+
+
+def _units_factor(units, target):
+    """
+    Returns the factor converting magnitudes in ``units`` to ``target``.
+    """
+    try:
+        return _cached_units_factor(units, target)
+    except TypeError:
+        # Unhashable units, such as a `u.Quantity`.
+        return float(u.Quantity(1.0, units).rescale(target).magnitude)
+
+
+def parse_ascii_array(response, sep=",", overflow=None):
+    """
+    Parses a response made of numbers separated by ``sep``, such as
+    ``"+1.23E-03,+4.56E-03"``, into an array of floats. The numbers are
+    converted by NumPy without creating a Python object for each of them,
+    which is much faster than splitting the response and calling `float` on
+    each part for long responses, such as waveforms sent in ASCII.
+
+    Whitespace around each number and trailing separators are ignored.
+
+    :param response: Response of the instrument.
+    :type response: `str` or `bytes`
+    :param str sep: Separator between the numbers.
+    :param float overflow: If not `None`, values whose magnitude is at least
+        that of the overflow sentinel of SCPI instruments, ``9.9E+37``, are
+        replaced by this value, such as `numpy.nan`.
+    :rtype: `numpy.ndarray` of `numpy.float64`
+    """
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        response = bytes(response).decode("ascii")
+    response = response.strip().rstrip(sep).rstrip()
+    if not response:
+        return np.empty((0,))
+    data = np.fromstring(response, sep=sep)
+    # NumPy stops at the first part which isn't a number, rather than
+    # raising an error.
+    if data.size != response.count(sep) + 1:
+        raise ValueError("Response is not made of numbers separated by "
+                         "{!r}.".format(sep))
+    if overflow is not None:
+        data[np.abs(data) >= _OVERFLOW_THRESHOLD] = overflow
+    return data
+
+
+async def async_getattr(obj, name):
+    """
+    Coroutine counterpart of `getattr`, for reading properties of an
+    instrument opened with `~instruments.Instrument.open_tcpip_async`. Only
+    the properties created by the property factories in this module are
+    supported, as their getters send a single query and have no other side
+    effects, so that they can be run through
+    `~instruments.abstract_instruments.comm.run_async`.
+
+    >>> volts = await async_getattr(inst, "voltage")  # doctest: +SKIP
+
+    :param obj: Instrument, or channel of an instrument, to read from.
+    :param str name: Name of the attribute to read.
+    :return: The value of the attribute.
+    :raises TypeError: If the attribute was not created by a property
+        factory.
+    """
+    _check_factory_property(obj, name, "async_getattr")
+    # Imported here, as the communicators import this module.
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from instruments.abstract_instruments.comm import run_async
+    return await run_async(getattr, obj, name)
+
+
+async def async_setattr(obj, name, value):
+    """
+    Coroutine counterpart of `setattr`, for setting properties of an
+    instrument opened with `~instruments.Instrument.open_tcpip_async`. As
+    for `async_getattr`, only the properties created by the property
+    factories in this module are supported.
+
+    >>> await async_setattr(inst, "voltage", 1 * u.V)  # doctest: +SKIP
+
+    :param obj: Instrument, or channel of an instrument, to write to.
+    :param str name: Name of the attribute to set.
+    :param value: The new value of the attribute.
+    :raises TypeError: If the attribute was not created by a property
+        factory.
+    """
+    _check_factory_property(obj, name, "async_setattr")
+    # Imported here, as the communicators import this module.
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from instruments.abstract_instruments.comm import run_async
+    await run_async(setattr, obj, name, value)
+
+
+def _check_factory_property(obj, name, caller):
+    """
+    Raises `TypeError` unless ``name`` is a property of ``obj`` created by
+    one of the property factories, as other getters and setters may perform
+    any number of I/O operations.
+    """
+    if not isinstance(getattr(type(obj), name, None), FactoryProperty):
+        raise TypeError(
+            "{} only supports properties created by the property factories "
+            "of instruments.util_fns, but {}.{} is not one; use the "
+            "coroutine methods of the instrument, such as query_async, "
+            "instead.".format(caller, type(obj).__name__, name)
+        )
+
+
+def _cache_ttl(cacheable):
+    """
+    Normalizes the ``cacheable`` argument of the property factories to
+    `False`, `True` or a time to live in seconds.
+    """
+    if isinstance(cacheable, bool):
+        return cacheable
+    ttl = float(assume_units(cacheable, u.second).rescale(u.second).magnitude)
+    if ttl < 0:
+        raise ValueError("Cache time to live must not be negative.")
+    return ttl
+
+
+def _property_query(obj, cmd, cacheable, to_msg=None):
+    """
+    Sends a query for the getter of a property, allowing the instrument to
+    answer it from its query cache if the property is cacheable, and to
+    record the response in its shadow state if ``to_msg`` is given.
+
+    ``to_msg`` converts a response to the query into the command the setter
+    of the property sends to set the same value.
+    """
+    if cacheable is False and to_msg is None:
+        return obj.query(cmd)
+    token = _query_cache_hint.set(("query", cacheable, cmd, to_msg))
+    try:
+        return obj.query(cmd)
+    finally:
+        _query_cache_hint.reset(token)
+
+
+def _property_sendcmd(obj, msg, cacheable, query_cmd, to_msg=None):
+    """
+    Sends a command for the setter of a property, invalidating the cached
+    response to ``query_cmd`` if the property is cacheable, and allowing the
+    instrument to skip the command if its shadow state shows that the value
+    is already set if ``to_msg`` is given.
+    """
+    if cacheable is False and to_msg is None:
+        obj.sendcmd(msg)
+        return
+    token = _query_cache_hint.set(("sendcmd", msg, query_cmd, to_msg))
+    try:
+        obj.sendcmd(msg)
+    finally:
+        _query_cache_hint.reset(token)
+
+
+@contextlib.contextmanager
+def raw_units(enabled=True):
+    """
+    Context manager enabling the raw units mode of every instrument, including
+    the channels of instruments, within its block, or disabling it if
+    ``enabled`` is `False`. Either way, this overrides the
+    `~instruments.Instrument.raw_units` mode of each instrument.
+
+    >>> with raw_units():  # doctest: +SKIP
+    ...     for _ in range(1000):
+    ...         samples.append(inst.channel[0].voltage)
+
+    The mode is held in a context variable, and thus only applies to the
+    current thread or asyncio task.
+
+    :param bool enabled: Whether raw units are enabled within the block.
+    """
+    if not isinstance(enabled, bool):
+        raise TypeError("Raw units mode must be enabled or disabled with a "
+                        "boolean value.")
+    token = _raw_units_context.set(enabled)
+    try:
+        yield
+    finally:
+        _raw_units_context.reset(token)
+
+
+def _raw_units_enabled(obj):
+    """
+    Returns whether values read from ``obj`` are returned without units,
+    as set by `raw_units`, or else by the `~instruments.Instrument.raw_units`
+    mode of ``obj``.
+
+    Channels follow the mode of the instrument they belong to, found through
+    their ``_parent`` attribute, as channels in InstrumentKit hold it.
+    """
+    enabled = _raw_units_context.get()
+    if enabled is not None:
+        return enabled
+    while obj is not None:
+        enabled = getattr(obj, "_raw_units", None)
+        if enabled is not None:
+            return enabled
+        obj = getattr(obj, "_parent", None)
+    return False
+
+
+def with_units(obj, value, units):
+    """
+    Attaches units to a value read from an instrument, unless the raw units
+    mode is enabled for ``obj``, in which case the value is returned as a
+    `float`, or as a `numpy.ndarray` of floats if it is a sequence.
+
+    :param obj: Instrument, or channel of an instrument, the value was read
+        from.
+    :param value: Magnitude of the value, in ``units``.
+    :type value: `float` or sequence of `float`
+    :param units: Units of the value.
+    :rtype: `~quantities.Quantity`, `float` or `numpy.ndarray`
+    """
+    if _raw_units_enabled(obj):
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return np.asarray(value, dtype=float)
+        return value
+    return value * units
+
+
 def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
     """
     Creates and returns a new property based on the input parameters.
@@ -181,8 +487,424 @@ def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
     return property(fget=fget, fset=fset, doc=doc)
 
 
+def _decoration(fcn):
+    """
+    Resolves an ``input_decoration`` or ``output_decoration`` argument of the
+    property factories, which may be a `staticmethod`, to a callable.
+    """
+    if fcn is not None and hasattr(fcn, "__get__"):
+        return fcn.__get__(None, object)
+    return fcn
+
+
+# Marks where the value goes when splitting the ``set_fmt`` of a property.
+_SET_FMT_MARKER = "\x00"
+
+
+class FactoryProperty(property):
+
+    """
+    Base of the properties returned by the property factories, such as
+    `bool_property` or `unitful_property`. The commands a property sends
+    are prepared once, when the property is created, and are exposed along
+    with the other settings of the property for introspection, such as by
+    batching and caching layers:
+
+    >>> type(inst).voltage.command  # doctest: +SKIP
+    'VOLT'
+    >>> type(inst).voltage.units  # doctest: +SKIP
+    UnitQuantity('volt', 1.0 * J/C, 'V')
+
+    :ivar str command: Command of the property, as given to its factory.
+    :ivar str set_cmd: Command sent to set the property.
+    :ivar str query_cmd: Query sent to get the property.
+    :ivar units: Units of the values of the property, or `None` if they
+        have none.
+    :ivar bool readonly: Whether the property can't be set.
+    :ivar bool writeonly: Whether the property can't be read.
+    :ivar cacheable: `False`, `True`, or the time to live in seconds of the
+        response to `query_cmd` in the query cache of the instrument.
+    """
+
+    __slots__ = ("command", "set_cmd", "query_cmd", "units", "readonly",
+                 "writeonly", "cacheable", "_set_fmt", "_set_prefix",
+                 "_set_suffix", "_shadow")
+
+    def __init__(self, command, set_cmd=None, set_fmt="{} {}", doc=None,
+                 readonly=False, writeonly=False, cacheable=False,
+                 shadow=True):
+        if readonly and writeonly:
+            raise ValueError("Properties cannot be both read- and write-only.")
+        super(FactoryProperty, self).__init__(
+            None if writeonly else self._get,
+            None if readonly else self._set,
+            None,
+            doc
+        )
+        self.__doc__ = doc
+        self.command = command
+        self.set_cmd = command if set_cmd is None else set_cmd
+        self.query_cmd = "{}?".format(command)
+        self.units = None
+        self.readonly = readonly
+        self.writeonly = writeonly
+        self.cacheable = _cache_ttl(cacheable)
+        self._set_fmt = set_fmt
+        self._set_prefix, self._set_suffix = self._split_set_fmt()
+        # Converts a response to the query into the command setting the same
+        # value, to record it in the shadow state of the instrument.
+        self._shadow = self._to_msg if shadow and not readonly else None
+
+    def _set_fmt_args(self, value):
+        return self.set_cmd, value
+
+    def _split_set_fmt(self):
+        """
+        Splits ``set_fmt``, filled with everything but the value, into the
+        parts before and after the value, or returns ``(None, None)`` if it
+        can't be split, such as if it applies a format spec to the value.
+        """
+        try:
+            filled = self._set_fmt.format(*self._set_fmt_args(_SET_FMT_MARKER))
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None, None
+        if filled.count(_SET_FMT_MARKER) != 1:
+            return None, None
+        # Format specs and conversions, such as padding, depend on the value.
+        for _, field, spec, conversion in string.Formatter().parse(
+                self._set_fmt):
+            if field is not None and (spec or conversion):
+                return None, None
+        prefix, _, suffix = filled.partition(_SET_FMT_MARKER)
+        return prefix, suffix
+
+    def _format_set(self, value):
+        """
+        Returns the command setting the property to ``value``, which is
+        already formatted for the instrument.
+        """
+        if self._set_prefix is None or not isinstance(value, str):
+            return self._set_fmt.format(*self._set_fmt_args(value))
+        return self._set_prefix + value + self._set_suffix
+
+    def _get(self, obj):
+        raise AttributeError("unreadable attribute")
+
+    def _set(self, obj, newval):
+        raise AttributeError("can't set attribute")
+
+    def _to_msg(self, raw):
+        """
+        Returns the command setting the value given by ``raw``, a response
+        to `query_cmd`. By default, the response is sent back as is.
+        """
+        return self._format_set(raw.strip())
+
+
+# The subclasses below hold the docstring given to their factory in a
+# ``__doc__`` slot, and thus can't have a docstring of their own.
+
+
+class BoolProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `bool_property`.
+
+    __slots__ = ("__doc__", "inst_true", "inst_false", "_true_msg",
+                 "_false_msg")
+
+    def __init__(self, command, set_cmd=None, inst_true="ON",
+                 inst_false="OFF", doc=None, readonly=False, writeonly=False,
+                 set_fmt="{} {}", cacheable=False):
+        self.inst_true = inst_true
+        self.inst_false = inst_false
+        super(BoolProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable
+        )
+        self._true_msg = self._format_set(inst_true)
+        self._false_msg = self._format_set(inst_false)
+
+    def _get(self, obj):
+        response = _property_query(obj, self.query_cmd, self.cacheable,
+                                   self._shadow)
+        return response.strip() == self.inst_true
+
+    def _set(self, obj, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Bool properties must be specified with a "
+                            "boolean value")
+        msg = self._true_msg if newval else self._false_msg
+        _property_sendcmd(obj, msg, self.cacheable, self.query_cmd,
+                          self._shadow)
+
+    def _to_msg(self, raw):
+        if raw.strip() == self.inst_true:
+            return self._true_msg
+        return self._false_msg
+
+
+class EnumProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `enum_property`.
+
+    __slots__ = ("__doc__", "enum", "_in_decor", "_out_decor", "_by_name",
+                 "_by_value", "_set_msgs")
+
+    def __init__(self, command, enum, set_cmd=None, doc=None,
+                 input_decoration=None, output_decoration=None, readonly=False,
+                 writeonly=False, set_fmt="{} {}", cacheable=False):
+        self.enum = enum
+        self._in_decor = _decoration(input_decoration)
+        self._out_decor = _decoration(output_decoration)
+        # Same lookups as ``enum[...]`` and ``enum(...)``, without their
+        # overhead. Lookups missing these fall back to ``enum(...)``.
+        if isinstance(enum, type) and issubclass(enum, Enum):
+            self._by_name = dict(enum.__members__)
+            self._by_value = {member.value: member for member in enum}
+        else:
+            self._by_name = {}
+            self._by_value = {}
+        # Commands setting each member, built on first use.
+        self._set_msgs = {}
+        super(EnumProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable
+        )
+
+    def _member(self, value):
+        """
+        Returns the member with the value ``value``.
+        """
+        try:
+            return self._by_value[value]
+        except (KeyError, TypeError):
+            return self.enum(value)
+
+    def _set_msg(self, member):
+        try:
+            return self._set_msgs[member]
+        except KeyError:
+            value = member.value
+            if self._out_decor is not None:
+                value = self._out_decor(value)
+            msg = self._format_set(value)
+            self._set_msgs[member] = msg
+            return msg
+
+    def _parse(self, raw):
+        raw = raw.strip()
+        if self._in_decor is not None:
+            raw = self._in_decor(raw)
+        return self._member(raw)
+
+    def _get(self, obj):
+        return self._parse(_property_query(obj, self.query_cmd,
+                                           self.cacheable, self._shadow))
+
+    def _set(self, obj, newval):
+        try:  # First assume newval is Enum.value
+            member = self._by_name[newval]
+        except KeyError:  # Check if newval is Enum.name instead
+            try:
+                member = self._member(newval)
+            except ValueError:
+                raise ValueError("Enum property new value not in enum.")
+        _property_sendcmd(obj, self._set_msg(member), self.cacheable,
+                          self.query_cmd, self._shadow)
+
+    def _to_msg(self, raw):
+        return self._set_msg(self._parse(raw))
+
+
+class UnitlessProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `unitless_property`.
+
+    __slots__ = ("__doc__", "format_code")
+
+    def __init__(self, command, set_cmd=None, format_code='{:e}', doc=None,
+                 readonly=False, writeonly=False, set_fmt="{} {}",
+                 cacheable=False):
+        self.format_code = format_code
+        super(UnitlessProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable,
+            shadow=False
+        )
+
+    def _get(self, obj):
+        return float(_property_query(obj, self.query_cmd, self.cacheable,
+                                     self._shadow))
+
+    def _set(self, obj, newval):
+        if isinstance(newval, u.Quantity):
+            if newval.units == u.dimensionless:
+                newval = float(newval.magnitude)
+            else:
+                raise ValueError
+        msg = self._format_set(self.format_code.format(newval))
+        _property_sendcmd(obj, msg, self.cacheable, self.query_cmd,
+                          self._shadow)
+
+
+class IntProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `int_property`.
+
+    __slots__ = ("__doc__", "format_code", "valid_set")
+
+    def __init__(self, command, set_cmd=None, format_code='{:d}', doc=None,
+                 readonly=False, writeonly=False, valid_set=None,
+                 set_fmt="{} {}", cacheable=False):
+        self.format_code = format_code
+        self.valid_set = valid_set
+        super(IntProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable
+        )
+
+    def _set_msg(self, newval):
+        return self._format_set(self.format_code.format(newval))
+
+    def _get(self, obj):
+        return int(_property_query(obj, self.query_cmd, self.cacheable,
+                                   self._shadow))
+
+    def _set(self, obj, newval):
+        if self.valid_set is not None and newval not in self.valid_set:
+            raise ValueError(
+                "{} is not an allowed value for this property; "
+                "must be one of {}.".format(newval, self.valid_set)
+            )
+        _property_sendcmd(obj, self._set_msg(newval), self.cacheable,
+                          self.query_cmd, self._shadow)
+
+    def _to_msg(self, raw):
+        return self._set_msg(int(raw))
+
+
+class UnitfulProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `unitful_property`.
+
+    __slots__ = ("__doc__", "format_code", "valid_range", "_in_decor",
+                 "_out_decor")
+
+    def __init__(self, command, units, set_cmd=None, format_code='{:e}',
+                 doc=None, input_decoration=None, output_decoration=None,
+                 readonly=False, writeonly=False, set_fmt="{} {}",
+                 valid_range=(None, None), cacheable=False):
+        self.format_code = format_code
+        self.valid_range = valid_range
+        self._in_decor = _decoration(input_decoration)
+        self._out_decor = _decoration(output_decoration)
+        super(UnitfulProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable
+        )
+        self.units = units
+
+    def _set_msg(self, newval):
+        # Rescale to the correct unit before printing. This will also
+        # catch bad units.
+        units = self.units
+        strval = self.format_code.format(
+            assume_units(newval, units).rescale(units).item())
+        if self._out_decor is not None:
+            strval = self._out_decor(strval)
+        return self._format_set(strval)
+
+    def _split(self, raw):
+        if self._in_decor is not None:
+            raw = self._in_decor(raw)
+        return split_unit_str(raw, self.units)
+
+    def _parse(self, raw):
+        return u.Quantity(*self._split(raw)).rescale(self.units)
+
+    def _get(self, obj):
+        response = _property_query(obj, self.query_cmd, self.cacheable,
+                                   self._shadow)
+        if _raw_units_enabled(obj):
+            value, value_units = self._split(response)
+            if value_units is self.units:
+                return value
+            return float(
+                u.Quantity(value, value_units).rescale(self.units).magnitude
+            )
+        return self._parse(response)
+
+    def _set(self, obj, newval):
+        min_value, max_value = self.valid_range
+        if min_value is not None:
+            if callable(min_value):
+                min_value = min_value(obj)  # pylint: disable=not-callable
+            if newval < min_value:
+                raise ValueError(f"Unitful quantity is too low. Got {newval}, "
+                                 f"minimum value is {min_value}")
+        if max_value is not None:
+            if callable(max_value):
+                max_value = max_value(obj)  # pylint: disable=not-callable
+            if newval > max_value:
+                raise ValueError(f"Unitful quantity is too high. Got {newval}, "
+                                 f"maximum value is {max_value}")
+        _property_sendcmd(obj, self._set_msg(newval), self.cacheable,
+                          self.query_cmd, self._shadow)
+
+    def _to_msg(self, raw):
+        return self._set_msg(self._parse(raw))
+
+
+class UnitfulBoundProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Minimum or maximum property returned by `bounded_unitful_property`.
+
+    __slots__ = ("__doc__", "bound")
+
+    def __init__(self, command, units, fmt_str, bound):
+        self.bound = bound
+        super(UnitfulBoundProperty, self).__init__(
+            command, readonly=True, shadow=False
+        )
+        self.query_cmd = fmt_str.format(command)
+        self.units = units
+
+    def value(self, obj):
+        """
+        Returns the bound for ``obj``, as a `~quantities.Quantity`.
+        """
+        if self.bound == "query":
+            return u.Quantity(*split_unit_str(obj.query(self.query_cmd),
+                                              self.units))
+        return assume_units(self.bound, self.units).rescale(self.units)
+
+    def _get(self, obj):
+        value = self.value(obj)
+        if _raw_units_enabled(obj):
+            return float(value.rescale(self.units).magnitude)
+        return value
+
+
+class StringProperty(FactoryProperty):  # pylint: disable=missing-docstring
+    # Property returned by `string_property`.
+
+    __slots__ = ("__doc__", "bookmark_symbol")
+
+    def __init__(self, command, set_cmd=None, bookmark_symbol='"', doc=None,
+                 readonly=False, writeonly=False, set_fmt="{} {}{}{}",
+                 cacheable=False):
+        self.bookmark_symbol = bookmark_symbol
+        super(StringProperty, self).__init__(
+            command, set_cmd, set_fmt, doc, readonly, writeonly, cacheable,
+            shadow=False
+        )
+
+    def _set_fmt_args(self, value):
+        return self.set_cmd, self.bookmark_symbol, value, self.bookmark_symbol
+
+    def _get(self, obj):
+        response = _property_query(obj, self.query_cmd, self.cacheable,
+                                   self._shadow)
+        length = len(self.bookmark_symbol)
+        return response[length:-length] if length > 0 else response
+
+    def _set(self, obj, newval):
+        _property_sendcmd(obj, self._format_set(newval), self.cacheable,
+                          self.query_cmd, self._shadow)
+
+
 def bool_property(command, set_cmd=None, inst_true="ON", inst_false="OFF",
-                  doc=None, readonly=False, writeonly=False, set_fmt="{} {}"):
+                  doc=None, readonly=False, writeonly=False, set_fmt="{} {}",
+                  cacheable=False):
     """
     Called inside of SCPI classes to instantiate boolean properties
     of the device cleanly.
@@ -217,27 +939,23 @@ def bool_property(command, set_cmd=None, inst_true="ON", inst_false="OFF",
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
     """
-
-    def _getter(self):
-        return self.query(command + "?").strip() == inst_true
-
-    def _setter(self, newval):
-        if not isinstance(newval, bool):
-            raise TypeError("Bool properties must be specified with a "
-                            "boolean value")
-        self.sendcmd(set_fmt.format(
-            command if set_cmd is None else set_cmd,
-            inst_true if newval else inst_false
-        ))
-
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+    return BoolProperty(
+        command, set_cmd=set_cmd, inst_true=inst_true, inst_false=inst_false,
+        doc=doc, readonly=readonly, writeonly=writeonly, set_fmt=set_fmt,
+        cacheable=cacheable
+    )
 
 
 def enum_property(command, enum, set_cmd=None, doc=None, input_decoration=None,
                   output_decoration=None, readonly=False, writeonly=False,
-                  set_fmt="{} {}"):
+                  set_fmt="{} {}", cacheable=False):
     """
     Called inside of SCPI classes to instantiate Enum properties
     of the device cleanly.
@@ -272,43 +990,24 @@ def enum_property(command, enum, set_cmd=None, doc=None, input_decoration=None,
         to be used when reading/querying from the instrument. If used, the name
         parameter is still used to set the command for pure-write commands to
         the instrument.
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
     """
-    def _in_decor_fcn(val):
-        if input_decoration is None:
-            return val
-        elif hasattr(input_decoration, "__get__"):
-            return input_decoration.__get__(None, object)(val)
-        return input_decoration(val)
-
-    def _out_decor_fcn(val):
-        if output_decoration is None:
-            return val
-        elif hasattr(output_decoration, "__get__"):
-            return output_decoration.__get__(None, object)(val)
-        return output_decoration(val)
-
-    def _getter(self):
-        return enum(_in_decor_fcn(self.query("{}?".format(command)).strip()))
-
-    def _setter(self, newval):
-        try:  # First assume newval is Enum.value
-            newval = enum[newval]
-        except KeyError:  # Check if newval is Enum.name instead
-            try:
-                newval = enum(newval)
-            except ValueError:
-                raise ValueError("Enum property new value not in enum.")
-        self.sendcmd(set_fmt.format(
-            command if set_cmd is None else set_cmd,
-            _out_decor_fcn(enum(newval).value)
-        ))
-
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+    return EnumProperty(
+        command, enum, set_cmd=set_cmd, doc=doc,
+        input_decoration=input_decoration,
+        output_decoration=output_decoration, readonly=readonly,
+        writeonly=writeonly, set_fmt=set_fmt, cacheable=cacheable
+    )
 
 
 def unitless_property(command, set_cmd=None, format_code='{:e}', doc=None,
-                      readonly=False, writeonly=False, set_fmt="{} {}"):
+                      readonly=False, writeonly=False, set_fmt="{} {}",
+                      cacheable=False):
     """
     Called inside of SCPI classes to instantiate properties with unitless
     numeric values.
@@ -331,31 +1030,23 @@ def unitless_property(command, set_cmd=None, format_code='{:e}', doc=None,
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
     """
-
-    def _getter(self):
-        raw = self.query("{}?".format(command))
-        return float(raw)
-
-    def _setter(self, newval):
-        if isinstance(newval, u.Quantity):
-            if newval.units == u.dimensionless:
-                newval = float(newval.magnitude)
-            else:
-                raise ValueError
-        strval = format_code.format(newval)
-        self.sendcmd(set_fmt.format(
-            command if set_cmd is None else set_cmd,
-            strval
-        ))
-
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+    return UnitlessProperty(
+        command, set_cmd=set_cmd, format_code=format_code, doc=doc,
+        readonly=readonly, writeonly=writeonly, set_fmt=set_fmt,
+        cacheable=cacheable
+    )
 
 
 def int_property(command, set_cmd=None, format_code='{:d}', doc=None,
                  readonly=False, writeonly=False, valid_set=None,
-                 set_fmt="{} {}"):
+                 set_fmt="{} {}", cacheable=False):
     """
     Called inside of SCPI classes to instantiate properties with unitless
     numeric values.
@@ -380,39 +1071,24 @@ def int_property(command, set_cmd=None, format_code='{:d}', doc=None,
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
     """
-
-    def _getter(self):
-        raw = self.query("{}?".format(command))
-        return int(raw)
-    if valid_set is None:
-        def _setter(self, newval):
-            strval = format_code.format(newval)
-            self.sendcmd(set_fmt.format(
-                command if set_cmd is None else set_cmd,
-                strval
-            ))
-    else:
-        def _setter(self, newval):
-            if newval not in valid_set:
-                raise ValueError(
-                    "{} is not an allowed value for this property; "
-                    "must be one of {}.".format(newval, valid_set)
-                )
-            strval = format_code.format(newval)
-            self.sendcmd(set_fmt.format(
-                command if set_cmd is None else set_cmd,
-                strval
-            ))
-
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+    return IntProperty(
+        command, set_cmd=set_cmd, format_code=format_code, doc=doc,
+        readonly=readonly, writeonly=writeonly, valid_set=valid_set,
+        set_fmt=set_fmt, cacheable=cacheable
+    )
 
 
 def unitful_property(command, units, set_cmd=None, format_code='{:e}', doc=None,
                      input_decoration=None, output_decoration=None,
                      readonly=False, writeonly=False, set_fmt="{} {}",
-                     valid_range=(None, None)):
+                     valid_range=(None, None), cacheable=False):
     """
     Called inside of SCPI classes to instantiate properties with unitful numeric
     values. This function assumes that the instrument only accepts
@@ -451,50 +1127,22 @@ def unitful_property(command, units, set_cmd=None, format_code='{:e}', doc=None,
         range. The default of `(None, None)` has no min or max constraints.
         The valid set is inclusive of the values provided.
     :type valid_range: `tuple` or `list` of `int` or `float`
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
+    :return: A `UnitfulProperty`, whose getter returns a `float` in
+        ``units`` instead of a `~quantities.Quantity` in raw units mode.
     """
-    def _in_decor_fcn(val):
-        if input_decoration is None:
-            return val
-        elif hasattr(input_decoration, "__get__"):
-            return input_decoration.__get__(None, object)(val)
-        return input_decoration(val)
-
-    def _out_decor_fcn(val):
-        if output_decoration is None:
-            return val
-        elif hasattr(output_decoration, "__get__"):
-            return output_decoration.__get__(None, object)(val)
-        return output_decoration(val)
-
-    def _getter(self):
-        raw = _in_decor_fcn(self.query("{}?".format(command)))
-        return u.Quantity(*split_unit_str(raw, units)).rescale(units)
-
-    def _setter(self, newval):
-        min_value, max_value = valid_range
-        if min_value is not None:
-            if callable(min_value):
-                min_value = min_value(self)  # pylint: disable=not-callable
-            if newval < min_value:
-                raise ValueError(f"Unitful quantity is too low. Got {newval}, "
-                                 f"minimum value is {min_value}")
-        if max_value is not None:
-            if callable(max_value):
-                max_value = max_value(self)  # pylint: disable=not-callable
-            if newval > max_value:
-                raise ValueError(f"Unitful quantity is too high. Got {newval}, "
-                                 f"maximum value is {max_value}")
-        # Rescale to the correct unit before printing. This will also
-        # catch bad units.
-        strval = format_code.format(
-            assume_units(newval, units).rescale(units).item())
-        self.sendcmd(set_fmt.format(
-            command if set_cmd is None else set_cmd,
-            _out_decor_fcn(strval)
-        ))
-
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+    return UnitfulProperty(
+        command, units, set_cmd=set_cmd, format_code=format_code, doc=doc,
+        input_decoration=input_decoration,
+        output_decoration=output_decoration, readonly=readonly,
+        writeonly=writeonly, set_fmt=set_fmt, valid_range=valid_range,
+        cacheable=cacheable
+    )
 
 
 def bounded_unitful_property(command, units, min_fmt_str="{}:MIN?",
@@ -540,33 +1188,30 @@ def bounded_unitful_property(command, units, min_fmt_str="{}:MIN?",
         `unitful_property`, second is a property representing the minimum
         value, and third is a property representing the maximum value
     """
-
-    def _min_getter(self):
-        if valid_range[0] == "query":
-            return u.Quantity(*split_unit_str(self.query(min_fmt_str.format(command)), units))
-
-        return assume_units(valid_range[0], units).rescale(units)
-
-    def _max_getter(self):
-        if valid_range[1] == "query":
-            return u.Quantity(*split_unit_str(self.query(max_fmt_str.format(command)), units))
-
-        return assume_units(valid_range[1], units).rescale(units)
+    min_property = None
+    max_property = None
+    if valid_range[0] is not None:
+        min_property = UnitfulBoundProperty(command, units, min_fmt_str,
+                                            valid_range[0])
+    if valid_range[1] is not None:
+        max_property = UnitfulBoundProperty(command, units, max_fmt_str,
+                                            valid_range[1])
 
     new_range = (
-        None if valid_range[0] is None else _min_getter,
-        None if valid_range[1] is None else _max_getter
+        None if min_property is None else min_property.value,
+        None if max_property is None else max_property.value
     )
 
     return (
         unitful_property(command, units, valid_range=new_range, **kwargs),
-        property(_min_getter) if valid_range[0] is not None else None,
-        property(_max_getter) if valid_range[1] is not None else None
+        min_property,
+        max_property
     )
 
 
 def string_property(command, set_cmd=None, bookmark_symbol='"', doc=None,
-                    readonly=False, writeonly=False, set_fmt="{} {}{}{}"):
+                    readonly=False, writeonly=False, set_fmt="{} {}{}{}",
+                    cacheable=False):
     """
     Called inside of SCPI classes to instantiate properties with a string value.
 
@@ -588,27 +1233,196 @@ def string_property(command, set_cmd=None, bookmark_symbol='"', doc=None,
         the bookmark symbols on either side of the parameter.
     :param str bookmark_symbol: The symbol that will flank both sides of the
         parameter to be sent to the instrument. By default this is ``"``.
+    :param cacheable: If not `False`, the response to the query of this
+        property may be served from the query cache of the instrument, when
+        enabled by `~instruments.Instrument.query_cache_ttl`. Setting the
+        property invalidates the cached response. Either `True` to use the
+        time to live of the instrument, or a time to live for this property.
+    :type cacheable: `bool`, `float` or `~quantities.Quantity`
     """
-    bookmark_length = len(bookmark_symbol)
-
-    def _getter(self):
-        string = self.query("{}?".format(command))
-        string = string[
-            bookmark_length:-bookmark_length] if bookmark_length > 0 else string
-        return string
+    return StringProperty(
+        command, set_cmd=set_cmd, bookmark_symbol=bookmark_symbol, doc=doc,
+        readonly=readonly, writeonly=writeonly, set_fmt=set_fmt,
+        cacheable=cacheable
+    )
 
-    def _setter(self, newval):
-        self.sendcmd(set_fmt.format(
-            command if set_cmd is None else set_cmd,
-            bookmark_symbol, newval, bookmark_symbol
-        ))
 
-    return rproperty(fget=_getter, fset=_setter, doc=doc, readonly=readonly,
-                     writeonly=writeonly)
+def _proxy_cache(parent, proxy_cls):
+    """
+    Returns the dictionary holding the ``proxy_cls`` objects of a cached
+    `ProxyList` for ``parent``, or `None` if ``parent`` can't hold one.
+    """
+    try:
+        attrs = vars(parent)
+    except TypeError:
+        return None
+    return attrs.setdefault("_proxy_cache", {}).setdefault(proxy_cls, {})
 
 # CLASSES #####################################################################
 
 
+class QueryCache:
+
+    """
+    Cache of the responses to queries sent to an instrument, keyed by the
+    query command as sent to the instrument, each with its own time to live.
+
+    Used by `~instruments.Instrument` to answer the getters of properties
+    declared with ``cacheable=`` without a round trip to the instrument.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, cmd):
+        return self.get(cmd) is not None
+
+    def get(self, cmd):
+        """
+        Gets the cached response to a query, or `None` if it is not cached or
+        has expired.
+
+        :param str cmd: Query command.
+        :rtype: `str` or `None`
+        """
+        entry = self._entries.get(cmd)
+        if entry is None:
+            return None
+        response, expiry = entry
+        if time.monotonic() >= expiry:
+            del self._entries[cmd]
+            return None
+        return response
+
+    def put(self, cmd, response, ttl):
+        """
+        Caches the response to a query.
+
+        :param str cmd: Query command.
+        :param str response: Response to the query.
+        :param float ttl: Time, in seconds, for which the response is valid.
+        """
+        self._entries[cmd] = (response, time.monotonic() + ttl)
+
+    def invalidate(self, cmd=None):
+        """
+        Removes the cached response to a query, or every cached response.
+
+        :param str cmd: Query command, or `None` to clear the cache.
+        """
+        if cmd is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(cmd, None)
+
+    @staticmethod
+    def take_hint(kind):
+        """
+        Gets and clears the hint set by the getter (``kind`` of ``"query"``)
+        or setter (``"sendcmd"``) of a cacheable property around the query or
+        command currently being sent, if any.
+
+        :return: For queries, a `tuple` of ``"query"``, the normalized
+            ``cacheable`` argument of the property, the query sent by the
+            getter, and a function converting a response into the command
+            that sets the same value (`None` if the property has no shadow
+            state). For commands, a `tuple` of ``"sendcmd"``, the command
+            sent by the setter, the query sent by the getter, and the same
+            conversion function. `None` if there is no hint.
+        :rtype: `tuple` or `None`
+        """
+        hint = _query_cache_hint.get()
+        if hint is None or hint[0] != kind:
+            return None
+        _query_cache_hint.set(None)
+        return hint
+
+
+class ShadowState:
+
+    """
+    Last known settings of an instrument, used by `~instruments.Instrument`
+    to skip commands that would set a property to the value it already has.
+
+    Each setting is keyed by the query reading it, as sent to the instrument,
+    and holds the command that sets its last known value.
+    """
+
+    def __init__(self):
+        self._settings = {}
+
+    def __len__(self):
+        return len(self._settings)
+
+    def get(self, key):
+        """
+        Gets the command that sets the last known value of a setting.
+
+        :param str key: Query reading the setting.
+        :rtype: `str` or `None`
+        """
+        entry = self._settings.get(key)
+        return None if entry is None else entry[0]
+
+    def record(self, key, cmd, prefix, to_msg):
+        """
+        Records the command last sent to set a setting.
+
+        :param str key: Query reading the setting.
+        :param str cmd: Command sent to the instrument.
+        :param str prefix: Prefix added to the commands of the property by
+            the object, such as a channel, the property belongs to.
+        :param callable to_msg: Converts a response to ``key`` into the
+            command, without ``prefix``, setting the same value.
+        """
+        self._settings[key] = (cmd, prefix, to_msg)
+
+    def record_response(self, key, response, prefix, to_msg):
+        """
+        Records the response to the query reading a setting.
+
+        :param str key: Query reading the setting.
+        :param str response: Response of the instrument.
+        :param str prefix: As for `record`.
+        :param callable to_msg: As for `record`.
+        """
+        try:
+            cmd = prefix + to_msg(response)
+        except (ValueError, KeyError, TypeError):
+            # A response we can't interpret says nothing about the setting.
+            self.forget(key)
+        else:
+            self.record(key, cmd, prefix, to_msg)
+
+    def forget(self, key=None):
+        """
+        Removes a setting, or every setting.
+
+        :param str key: Query reading the setting, or `None` to remove every
+            setting.
+        """
+        if key is None:
+            self._settings.clear()
+        else:
+            self._settings.pop(key, None)
+
+    def settings(self):
+        """
+        Gets the settings held.
+
+        :return: A `list` of `tuple` of the query reading each setting, and
+            the ``prefix`` and ``to_msg`` arguments it was recorded with.
+        :rtype: `list`
+        """
+        return [
+            (key, prefix, to_msg)
+            for key, (_, prefix, to_msg) in self._settings.items()
+        ]
+
+
 class ProxyList:
     """
     This is a special class used to generate lists of objects where the valid
@@ -629,9 +1443,16 @@ class ProxyList:
     :param valid_set: The set of valid keys by which the proxy class objects
         are accessed. Typically this is something like `range`, but can be
         any generator, list, enum, etc.
+    :param bool cached: If `True`, each proxy object is created once per
+        parent and key, and the same object is returned on every later
+        access, from any `ProxyList` with the same parent and proxy class.
+        This keeps state held by the proxy objects, and avoids creating them
+        in tight polling loops. The proxy objects are held by the parent, and
+        are freed along with it. ``proxy_cls`` must then be the same object
+        on every access, such as a class, rather than a new lambda.
     """
 
-    def __init__(self, parent, proxy_cls, valid_set):
+    def __init__(self, parent, proxy_cls, valid_set, cached=False):
         self._parent = parent
         self._proxy_cls = proxy_cls
         self._valid_set = valid_set
@@ -643,9 +1464,27 @@ class ProxyList:
         else:
             self._isenum = False
 
+        self._cache = _proxy_cache(parent, proxy_cls) if cached else None
+
+    def _proxy(self, idx, key=None):
+        cache = self._cache
+        if cache is None:
+            return self._proxy_cls(self._parent, idx)
+        if key is None:
+            key = idx
+        try:
+            return cache[key]
+        except KeyError:
+            return cache.setdefault(key, self._proxy_cls(self._parent, idx))
+        except TypeError:  # Unhashable key
+            return self._proxy_cls(self._parent, idx)
+
     def __iter__(self):
         for idx in self._valid_set:
-            yield self._proxy_cls(self._parent, idx)
+            # Enum members are passed as they are when iterating, but by
+            # value when indexing, and the two must not share a proxy object
+            # when equal, as with an IntEnum.
+            yield self._proxy(idx, (idx,) if self._isenum else idx)
 
     def __getitem__(self, idx):
         # If we have an enum, try to normalize by using getitem. This will
@@ -666,7 +1505,7 @@ class ProxyList:
             if idx not in self._valid_set:
                 raise IndexError("Index out of range. Must be "
                                  "in {}.".format(self._valid_set))
-        return self._proxy_cls(self._parent, idx)
+        return self._proxy(idx)
 
     def __len__(self):
         return len(self._valid_set)
@@ -8,7 +8,6 @@ Rok Zitko, March 2020
 # IMPORTS #####################################################################
 
 
-import struct
 from enum import Enum
 
 import instruments.units as u
@@ -541,12 +540,9 @@ class Wavetek39A(SCPIInstrument, FunctionGenerator):
 
     def _arbitrary_send_data(self, cpd, csv, command):
         length, csvint = prepare_for_sending(cpd, csv)
-        bin_data = struct.pack('>{}h'.format(length), *csvint)
-        size_str = str(len(bin_data))
-        len_size_str = len(size_str)
-        header = '#{}{}'.format(len_size_str, size_str)
-        cmd = "{} {},{},{}{}".format(command, cpd, str(length), header, bin_data)
-        self.sendcmd(cmd)
+        self.binblockwrite(
+            "{} {},{},".format(command, cpd, str(length)), csvint, fmt=">h"
+        )
 
     def arbitrary_define_csv(self, cpd, csv):
         """
@@ -109,7 +109,9 @@ class Yokogawa6370(OpticalSpectrumAnalyzer):
 
         :rtype: `list`[`~Yokogawa6370.Channel`]
         """
-        return ProxyList(self, Yokogawa6370.Channel, Yokogawa6370.Traces)
+        return ProxyList(
+            self, Yokogawa6370.Channel, Yokogawa6370.Traces, cached=True
+        )
 
     start_wl, start_wl_min, start_wl_max = bounded_unitful_property(
         ":SENS:WAV:STAR",
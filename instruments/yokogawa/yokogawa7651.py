@@ -166,7 +166,7 @@ class Yokogawa7651(PowerSupply, Instrument):
 
         :rtype: `~Yokogawa7651.Channel`
         """
-        return ProxyList(self, Yokogawa7651.Channel, [0])
+        return ProxyList(self, Yokogawa7651.Channel, [0], cached=True)
 
     @property
     def voltage(self):
@@ -15,13 +15,12 @@ from setuptools import setup, find_packages
 # SETUP VALUES ###############################################################
 
 NAME = "instruments"
-PACKAGES = find_packages()
+PACKAGES = find_packages(exclude=["benchmarks", "benchmarks.*"])
 META_PATH = os.path.join("instruments", "__init__.py")
 CLASSIFIERS = [
     "Development Status :: 4 - Beta",
     "Programming Language :: Python",
     "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
     "Programming Language :: Python :: 3.8",
     "Operating System :: OS Independent",
@@ -86,6 +85,7 @@ setup(
     author=find_meta("author"),
     author_email=find_meta("email"),
     packages=PACKAGES,
+    python_requires=">=3.7",
     install_requires=INSTALL_REQUIRES,
     tests_require=[
         'pytest >= 2.9.1',